@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los motores de par de puntos más cercanos.
+
+Compara `closest_pair` con el motor de listas (original) contra el motor de
+arreglos sobre nubes de puntos aleatorios, midiendo tiempo y memoria pico.
+También mide la versión aleatorizada con grilla de hash (O(n) esperado).
+
+Uso:
+    python benchmarks/bench_closest_pair.py [n1 n2 ...]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair
+from tp_algos.algorithms.randomized.closest_pair_grilla import closest_pair_grilla
+
+from generadores import puntos_aleatorios
+
+
+def medir(func, *args, **kwargs):
+    """(resultado, segundos, pico de memoria en bytes) de ejecutar `func`.
+
+    El tiempo se mide en una corrida aparte: tracemalloc encarece cada
+    asignación y distorsiona la comparación.
+    """
+    inicio = time.perf_counter()
+    resultado = func(*args, **kwargs)
+    segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    func(*args, **kwargs)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def main():
+    tamanos = [int(x) for x in sys.argv[1:]] or [10_000, 100_000, 500_000]
+    mb = 1024 * 1024
+    print(f"{'n':>9} {'listas (s)':>11} {'arreglos (s)':>13} {'speedup':>8} "
+          f"{'pico listas (MB)':>17} {'pico arreglos (MB)':>19} {'grilla (s)':>11}")
+    for n in tamanos:
+        puntos = puntos_aleatorios(n)
+        (d_l, _, _), t_l, m_l = medir(closest_pair, puntos)
+        (d_a, _, _), t_a, m_a = medir(closest_pair, puntos, motor="arreglos")
+        (d_g, _, _), t_g, _ = medir(closest_pair_grilla, puntos, semilla=0)
+        assert d_l == d_a == d_g
+        print(f"{n:>9} {t_l:>11.2f} {t_a:>13.2f} {t_l / t_a:>7.1f}x {m_l / mb:>17.1f} "
+              f"{m_a / mb:>19.1f} {t_g:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
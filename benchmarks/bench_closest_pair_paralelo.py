@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado del par de puntos más cercanos paralelo.
+
+Mide `closest_pair_paralelo` con 1, 2, 4, 8 y 16 procesos sobre una misma
+nube de puntos y reporta el speedup y la eficiencia respecto del motor de
+arreglos serial (workers=1). Como referencia mide también `closest_pair`
+(motor de listas) y `fuerza_bruta` sobre una muestra chica, extrapolada a n.
+
+Uso:
+    python benchmarks/bench_closest_pair_paralelo.py [n]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair, fuerza_bruta
+from tp_algos.algorithms.divide_conquer.closest_pair_paralelo import closest_pair_paralelo
+
+from generadores import puntos_aleatorios
+
+# Fuerza bruta es O(n²): se mide con esta cantidad de puntos y se extrapola
+MUESTRA_FUERZA_BRUTA = 2_000
+
+
+def cronometrar(func, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = func(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    puntos = puntos_aleatorios(n)
+
+    print(f"n={n}, CPUs disponibles={os.cpu_count()}")
+    (d_listas, _, _), t_listas = cronometrar(closest_pair, puntos)
+    _, t_muestra = cronometrar(fuerza_bruta, puntos[:MUESTRA_FUERZA_BRUTA])
+    print(f"closest_pair (listas): {t_listas:.2f} s")
+    print(f"fuerza_bruta (extrapolado de {MUESTRA_FUERZA_BRUTA} puntos): "
+          f"{t_muestra * (n / MUESTRA_FUERZA_BRUTA) ** 2:.0f} s")
+
+    print(f"{'workers':>8} {'tiempo (s)':>11} {'speedup':>9} {'eficiencia':>11} {'vs listas':>10}")
+    base = None
+    for workers in (1, 2, 4, 8, 16):
+        (d, _, _), tiempo = cronometrar(closest_pair_paralelo, puntos, workers=workers, umbral_paralelo=0)
+        assert d == d_listas
+        base = base or tiempo
+        speedup = base / tiempo
+        print(f"{workers:>8} {tiempo:>11.2f} {speedup:>8.2f}x {speedup / workers:>10.0%} "
+              f"{t_listas / tiempo:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
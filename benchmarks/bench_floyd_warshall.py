@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los motores de Floyd-Warshall.
+
+Compara el triple ciclo en Python contra el motor vectorizado con NumPy
+y la versión por bloques sobre grafos aleatorios de distintos tamaños.
+
+Uso:
+    python benchmarks/bench_floyd_warshall.py [n1 n2 ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from tp_algos.algorithms.graphs.floyd_warshall import floyd_warshall
+
+from generadores import grafo_aleatorio
+
+
+def medir(func, *args, **kwargs) -> float:
+    """Tiempo de ejecución en segundos."""
+    inicio = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - inicio
+
+
+def main():
+    tamanos = [int(x) for x in sys.argv[1:]] or [50, 100, 200, 400]
+    print(f"{'n':>6} {'python (s)':>12} {'numpy f64 (s)':>14} {'numpy f32 (s)':>14} "
+          f"{'bloques (s)':>12} {'speedup':>9}")
+    for n in tamanos:
+        grafo = grafo_aleatorio(n)
+        t_py = medir(floyd_warshall, grafo)
+        t_64 = medir(floyd_warshall, grafo, motor="numpy")
+        t_32 = medir(floyd_warshall, grafo, motor="numpy", dtype=np.float32)
+        t_bl = medir(floyd_warshall, grafo, motor="bloques")
+        print(f"{n:>6} {t_py:>12.4f} {t_64:>14.4f} {t_32:>14.4f} {t_bl:>12.4f} {t_py / t_64:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado de Floyd-Warshall paralelo.
+
+Mide el tiempo de `floyd_warshall_paralelo` con 1, 2, 4, 8 y 16 procesos
+sobre un mismo grafo aleatorio y reporta el speedup y la eficiencia respecto
+de la versión serial por bloques.
+
+Uso:
+    python benchmarks/bench_floyd_warshall_paralelo.py [n] [tamano_bloque]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.graphs.floyd_warshall_paralelo import floyd_warshall_paralelo
+
+from generadores import grafo_aleatorio
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    tamano_bloque = int(sys.argv[2]) if len(sys.argv) > 2 else 128
+    grafo = grafo_aleatorio(n)
+
+    print(f"n={n}, bloque={tamano_bloque}, CPUs disponibles={os.cpu_count()}")
+    print(f"{'workers':>8} {'tiempo (s)':>11} {'speedup':>9} {'eficiencia':>11}")
+    base = None
+    for workers in (1, 2, 4, 8, 16):
+        inicio = time.perf_counter()
+        floyd_warshall_paralelo(grafo, workers=workers, tamano_bloque=tamano_bloque)
+        tiempo = time.perf_counter() - inicio
+        base = base or tiempo
+        speedup = base / tiempo
+        print(f"{workers:>8} {tiempo:>11.3f} {speedup:>8.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
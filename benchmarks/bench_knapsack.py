@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los motores de mochila 0/1.
+
+Compara `knapsack_01_optimizado` con el ciclo en Python contra el motor
+vectorizado con NumPy sobre instancias aleatorias.
+
+Uso:
+    python benchmarks/bench_knapsack.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01_optimizado
+from generadores import mochila_aleatoria
+
+
+def medir(func, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = func(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    casos = [(100, 10_000), (200, 50_000), (500, 100_000), (2_000, 1_000_000)]
+    print(f"{'n':>6} {'W':>10} {'python (s)':>11} {'numpy (s)':>10} {'speedup':>9}")
+    for n, capacidad in casos:
+        pesos, valores, capacidad = mochila_aleatoria(n, capacidad, ruido=100)
+        r_np, t_np = medir(knapsack_01_optimizado, pesos, valores, capacidad, motor="numpy")
+        if n * capacidad <= 50_000_000:
+            r_py, t_py = medir(knapsack_01_optimizado, pesos, valores, capacidad)
+            assert r_py == r_np
+            print(f"{n:>6} {capacidad:>10} {t_py:>11.3f} {t_np:>10.3f} {t_py / t_np:>8.1f}x")
+        else:
+            print(f"{n:>6} {capacidad:>10} {'(omitido)':>11} {t_np:>10.3f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
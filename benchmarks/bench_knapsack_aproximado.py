@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark del FPTAS de mochila 0/1 para distintos eps.
+
+Compara `knapsack_01_aproximado` contra el óptimo exacto de
+`knapsack_01_optimizado` (motor NumPy) sobre instancias aleatorias grandes:
+tiempo, razón valor/óptimo y la cota de error garantizada.
+
+Uso:
+    python benchmarks/bench_knapsack_aproximado.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01_aproximado, knapsack_01_optimizado
+from generadores import mochila_aleatoria
+
+
+def medir(func, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = func(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    casos = [(200, 200_000), (500, 1_000_000)]
+    epsilons = [0.5, 0.1, 0.05, 0.01, 0.001]
+    for n, capacidad in casos:
+        pesos, valores, capacidad = mochila_aleatoria(n, capacidad, peso_maximo=capacidad // 20,
+                                                     ruido=capacidad // 200)
+        optimo, t_exacto = medir(knapsack_01_optimizado, pesos, valores, capacidad, motor="numpy")
+        print(f"\nn={n}, W={capacidad}: exacto {t_exacto * 1000:.1f} ms (valor {optimo})")
+        print(f"{'eps':>7} {'tiempo (ms)':>12} {'valor/opt':>10} {'cota error':>11} {'error real':>11}")
+        for eps in epsilons:
+            (valor, _, cota), segundos = medir(knapsack_01_aproximado, pesos, valores, capacidad, eps)
+            assert optimo - valor <= cota + 1e-9
+            print(f"{eps:>7} {segundos * 1000:>12.1f} {valor / optimo:>10.5f} "
+                  f"{cota:>11.1f} {optimo - valor:>11}")
+
+
+if __name__ == "__main__":
+    main()
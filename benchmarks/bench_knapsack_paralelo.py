@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado de la mochila 0/1 paralela.
+
+Mide el tiempo de `knapsack_01_paralelo` con 1, 2, 4, 8 y 16 procesos sobre
+una misma instancia y reporta el speedup y la eficiencia respecto del motor
+NumPy serial (workers=1).
+
+Uso:
+    python benchmarks/bench_knapsack_paralelo.py [n] [capacidad]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.dp.knapsack_paralelo import knapsack_01_paralelo
+from generadores import mochila_aleatoria
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    capacidad = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000
+    pesos, valores, capacidad = mochila_aleatoria(n, capacidad)
+
+    print(f"n={n}, W={capacidad}, CPUs disponibles={os.cpu_count()}")
+    print(f"{'workers':>8} {'tiempo (s)':>11} {'speedup':>9} {'eficiencia':>11}")
+    base = esperado = None
+    for workers in (1, 2, 4, 8, 16):
+        inicio = time.perf_counter()
+        resultado = knapsack_01_paralelo(pesos, valores, capacidad, workers=workers, umbral_paralelo=0)
+        tiempo = time.perf_counter() - inicio
+        esperado = esperado if esperado is not None else resultado
+        assert resultado == esperado
+        base = base or tiempo
+        speedup = base / tiempo
+        print(f"{workers:>8} {tiempo:>11.3f} {speedup:>8.2f}x {speedup / workers:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
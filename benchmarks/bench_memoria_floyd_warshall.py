@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria de las representaciones del resultado de Floyd-Warshall.
+
+Compara cuánta memoria ocupan `dist` y `next_node` como listas de listas
+(formato original), como MatrizDistancias/MatrizSiguientes (array) y como
+arreglos NumPy. Se mide con tracemalloc la memoria asignada al construir cada
+representación a partir del mismo resultado.
+
+Uso:
+    python benchmarks/bench_memoria_floyd_warshall.py [n1 n2 ...]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from tp_algos.algorithms.graphs.floyd_warshall_vectorizado import floyd_warshall_numpy
+from tp_algos.algorithms.graphs.matrices_compactas import compactar, expandir
+
+from generadores import grafo_aleatorio
+
+
+def memoria(constructor) -> int:
+    """Bytes que quedan asignados tras ejecutar `constructor`."""
+    tracemalloc.start()
+    resultado = constructor()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return actual
+
+
+def main():
+    tamanos = [int(x) for x in sys.argv[1:]] or [200, 500, 1000]
+    mb = 1024 * 1024
+    print(f"{'n':>6} {'listas (MB)':>12} {'array d (MB)':>13} {'array f (MB)':>13} "
+          f"{'numpy f32/i16 (MB)':>19} {'ahorro':>8}")
+    for n in tamanos:
+        dist_np, next_np = floyd_warshall_numpy(grafo_aleatorio(n, densidad=0.05, reales=True))
+        dist, next_node = expandir(dist_np, next_np)
+
+        m_listas = memoria(lambda: expandir(dist_np, next_np))
+        m_d = memoria(lambda: compactar(dist, next_node, 'd'))
+        m_f = memoria(lambda: compactar(dist, next_node, 'f'))
+        m_np = memoria(lambda: (dist_np.astype(np.float32), next_np.astype(np.int16)))
+        print(f"{n:>6} {m_listas / mb:>12.1f} {m_d / mb:>13.1f} {m_f / mb:>13.1f} "
+              f"{m_np / mb:>19.1f} {m_listas / m_d:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
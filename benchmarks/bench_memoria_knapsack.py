@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria de los modos de reconstrucción de la mochila 0/1.
+
+Compara el pico de memoria (tracemalloc) de `knapsack_01_con_items` con la
+tabla 2-D de listas, con la tabla de decisiones en bits y con la
+reconstrucción de Hirschberg, sobre la misma instancia aleatoria.
+
+Uso:
+    python benchmarks/bench_memoria_knapsack.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01_con_items
+# Importar antes de medir para que NumPy no cuente en el pico del primer modo
+import tp_algos.algorithms.dp.knapsack_bits  # noqa: F401
+from generadores import mochila_aleatoria
+
+
+def pico(func, *args, **kwargs):
+    """(resultado, pico de memoria en bytes, segundos) de ejecutar `func`."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = func(*args, **kwargs)
+    segundos = time.perf_counter() - inicio
+    _, maximo = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, maximo, segundos
+
+
+def main():
+    casos = [(50, 2_000), (100, 5_000), (200, 10_000)]
+    mb = 1024 * 1024
+    print(f"{'n':>5} {'W':>7} {'modo':>11} {'pico (MB)':>10} {'tiempo (s)':>11}")
+    for n, capacidad in casos:
+        pesos, valores, capacidad = mochila_aleatoria(n, capacidad)
+        esperado = None
+        for modo in ("tabla", "bits", "hirschberg"):
+            resultado, maximo, segundos = pico(knapsack_01_con_items, pesos, valores, capacidad,
+                                               reconstruccion=modo, formulacion="peso")
+            esperado = esperado or resultado
+            assert resultado[0] == esperado[0]
+            print(f"{n:>5} {capacidad:>7} {modo:>11} {maximo / mb:>10.2f} {segundos:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
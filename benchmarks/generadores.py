@@ -0,0 +1,42 @@
+"""
+Generadores de instancias aleatorias compartidos por los benchmarks.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tp_algos.algorithms.graphs.floyd_warshall import crear_grafo_vacio
+
+
+def grafo_aleatorio(n: int, densidad: float = 0.1, semilla: int = 0, reales: bool = False):
+    """Genera un grafo dirigido aleatorio con pesos en [1, 1000] (enteros o reales)."""
+    rng = random.Random(semilla)
+    grafo = crear_grafo_vacio(n)
+    for i in range(n):
+        for j in range(n):
+            if i != j and rng.random() < densidad:
+                grafo[i][j] = rng.randint(1, 1000) + (rng.random() if reales else 0)
+    return grafo
+
+
+def puntos_aleatorios(n: int, semilla: int = 0):
+    """Genera n puntos aleatorios en [0, 10⁶]²."""
+    rng = random.Random(semilla)
+    return [(rng.uniform(0, 1e6), rng.uniform(0, 1e6)) for _ in range(n)]
+
+
+def mochila_aleatoria(n: int, capacidad: int, semilla: int = 0,
+                      peso_maximo: int = None, ruido: int = 1000):
+    """
+    Objetos con pesos hasta capacidad/10 (o `peso_maximo`) y valores
+    correlacionados con el peso (peso + [0, ruido]), las instancias difíciles
+    para las cotas golosas. Devuelve (pesos, valores, capacidad).
+    """
+    rng = random.Random(semilla)
+    if peso_maximo is None:
+        peso_maximo = capacidad // 10
+    pesos = [rng.randint(1, max(1, peso_maximo)) for _ in range(n)]
+    valores = [p + rng.randint(0, ruido) for p in pesos]
+    return pesos, valores, capacidad
@@ -0,0 +1,122 @@
+"""
+Problema: Mochila 0/1 (Knapsack Problem)
+Branch and Bound best-first con la cota de la mochila fraccionaria.
+
+Los objetos se ordenan por `relacion` valor/peso decreciente. Cada nodo decide
+los primeros `nivel` objetos; su cota superior es el valor ya tomado más el
+óptimo fraccionario de los restantes con la capacidad que queda. Se expande
+siempre el nodo de mayor cota (heap) y se descartan los que no pueden superar
+a la mejor solución conocida. No depende de W, así que sirve para capacidades
+enormes con algunos cientos de objetos.
+"""
+import heapq
+import time
+from bisect import bisect_right
+from itertools import count
+from typing import List, Optional, Tuple
+
+
+def knapsack_01_bb(pesos: List[int], valores: List[int], capacidad: int,
+                   max_nodos: Optional[int] = None,
+                   tiempo_limite: Optional[float] = None) -> Tuple[int, List[int], float]:
+    """
+    Mochila 0/1 por Branch and Bound best-first.
+
+    Args:
+        pesos: Lista de pesos de los objetos
+        valores: Lista de valores de los objetos
+        capacidad: Capacidad máxima de la mochila
+        max_nodos: Cantidad máxima de nodos a expandir (None = sin límite)
+        tiempo_limite: Segundos máximos de búsqueda (None = sin límite)
+
+    Returns:
+        Tupla (valor, lista_de_indices_seleccionados, cota_superior). Si la
+        búsqueda termina, cota_superior == valor (óptimo demostrado); si se
+        agota el presupuesto, valor es la mejor solución encontrada y el
+        óptimo está entre valor y cota_superior.
+
+    Complejidad: O(2^n) en el peor caso; O(log n) por cota gracias a las
+                 sumas prefijas. En la práctica la poda deja muy pocos nodos.
+    """
+    inicio_reloj = time.perf_counter()
+    if capacidad < 0:
+        return 0, [], 0
+
+    # Los objetos de peso 0 y valor positivo se toman siempre
+    fijos = [i for i in range(len(pesos)) if pesos[i] == 0 and valores[i] > 0]
+    orden = sorted(
+        (i for i in range(len(pesos)) if 0 < pesos[i] <= capacidad and valores[i] > 0),
+        key=lambda i: valores[i] / pesos[i], reverse=True
+    )
+    n = len(orden)
+    base = sum(valores[i] for i in fijos)
+
+    # Sumas prefijas en el orden por relación: peso_acum[k] = peso de orden[:k]
+    peso_acum = [0]
+    valor_acum = [0]
+    for i in orden:
+        peso_acum.append(peso_acum[-1] + pesos[i])
+        valor_acum.append(valor_acum[-1] + valores[i])
+
+    def cota(nivel: int, valor: int, peso: int) -> float:
+        """Valor + óptimo fraccionario de orden[nivel:] con capacidad - peso."""
+        # Último k tal que orden[nivel:k] entra completo
+        k = bisect_right(peso_acum, peso_acum[nivel] + capacidad - peso) - 1
+        total = valor + valor_acum[k] - valor_acum[nivel]
+        if k < n:
+            restante = capacidad - peso - (peso_acum[k] - peso_acum[nivel])
+            total += valores[orden[k]] * restante / pesos[orden[k]]
+        return total
+
+    # Solución inicial golosa: por relación, salteando lo que no entra
+    mejor_valor, mejor_camino, peso = 0, None, 0
+    for nivel, i in enumerate(orden):
+        if peso + pesos[i] <= capacidad:
+            peso += pesos[i]
+            mejor_valor += valores[i]
+            mejor_camino = (nivel, mejor_camino)
+
+    # Nodos del heap: (-cota, desempate, nivel, valor, peso, camino). camino es
+    # una lista enlazada (nivel_tomado, camino_anterior) compartida entre nodos.
+    desempate = count()
+    heap = [(-cota(0, 0, 0), next(desempate), 0, 0, 0, None)]
+    expandidos = 0
+
+    while heap:
+        if -heap[0][0] <= mejor_valor:
+            heap = []
+            break
+        if max_nodos is not None and expandidos >= max_nodos:
+            break
+        if tiempo_limite is not None and time.perf_counter() - inicio_reloj >= tiempo_limite:
+            break
+
+        _, _, nivel, valor, peso, camino = heapq.heappop(heap)
+        expandidos += 1
+        if nivel == n:
+            continue
+        i = orden[nivel]
+
+        # Rama "tomar orden[nivel]"
+        if peso + pesos[i] <= capacidad:
+            valor_con, peso_con, camino_con = valor + valores[i], peso + pesos[i], (nivel, camino)
+            if valor_con > mejor_valor:
+                mejor_valor, mejor_camino = valor_con, camino_con
+            cota_con = cota(nivel + 1, valor_con, peso_con)
+            if cota_con > mejor_valor:
+                heapq.heappush(heap, (-cota_con, next(desempate), nivel + 1, valor_con, peso_con, camino_con))
+
+        # Rama "no tomar orden[nivel]"
+        cota_sin = cota(nivel + 1, valor, peso)
+        if cota_sin > mejor_valor:
+            heapq.heappush(heap, (-cota_sin, next(desempate), nivel + 1, valor, peso, camino))
+
+    # Con nodos abiertos el óptimo puede llegar hasta la mayor cota pendiente
+    cota_superior = max(mejor_valor, -heap[0][0]) if heap else mejor_valor
+
+    items = list(fijos)
+    while mejor_camino is not None:
+        nivel, mejor_camino = mejor_camino
+        items.append(orden[nivel])
+    items.sort()
+    return base + mejor_valor, items, base + cota_superior
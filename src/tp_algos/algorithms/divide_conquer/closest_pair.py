@@ -106,18 +106,32 @@ def closest_pair_recursivo(px: List[Point], py: List[Point]) -> Tuple[float, Poi
     return d, p1, p2
 
 
-def closest_pair(puntos: List[Point]) -> Tuple[float, Point, Point]:
+def closest_pair(puntos: List[Point], motor: str = "listas", **opciones) -> Tuple[float, Point, Point]:
     """
     Encuentra el par de puntos más cercanos usando Divide & Conquer.
     
     Args:
         puntos: Lista de tuplas (x, y)
+        motor: "listas" (px/py como listas de tuplas) o "arreglos"
+               (coordenadas en array('d') y rangos de índices, sin copias
+               por nivel; ver closest_pair_arreglos) o "paralelo" (una
+               franja vertical por proceso; ver closest_pair_paralelo)
+        **opciones: Parámetros del motor paralelo (workers, umbral_paralelo)
     
     Returns:
         Tupla con (distancia_minima, punto1, punto2)
     
     Complejidad: O(n log n)
     """
+    if motor == "arreglos":
+        from tp_algos.algorithms.divide_conquer.closest_pair_arreglos import closest_pair_arreglos
+        return closest_pair_arreglos(puntos)
+    if motor == "paralelo":
+        from tp_algos.algorithms.divide_conquer.closest_pair_paralelo import closest_pair_paralelo
+        return closest_pair_paralelo(puntos, **opciones)
+    if motor != "listas":
+        raise ValueError(f"Motor desconocido: {motor}")
+    
     if len(puntos) < 2:
         return float('inf'), None, None
     
@@ -0,0 +1,121 @@
+"""
+Par de puntos más cercanos sin copias por nivel.
+
+Misma estrategia Divide & Conquer que `closest_pair`, pero:
+    - las coordenadas ordenadas por x se guardan una sola vez en dos
+      `array('d')` y la recursión recibe rangos [inicio, fin) en lugar de
+      listas `px[:mid]` y `pyl`/`pyr` reconstruidas en cada nivel
+    - la franja es un rango contiguo de posiciones (xs está ordenado), que se
+      ubica con bisect en O(log n) en lugar de recorrer todos los puntos
+    - sólo se ordenan por y las posiciones de la franja, que con d chico son
+      muy pocas
+    - se comparan distancias al cuadrado; `math.sqrt` se usa una vez por nivel
+      para acotar la franja y otra al final
+"""
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import List, Sequence, Tuple
+
+from tp_algos.algorithms.divide_conquer.closest_pair import Point
+
+# Hasta este tamaño el rango se resuelve comparando todos los pares
+CASO_BASE = 8
+
+
+class _Resolvedor:
+    """Estado compartido por toda la recursión: arreglos y mejor par actual."""
+
+    def __init__(self, xs: Sequence[float], ys: Sequence[float]):
+        # Coordenadas ordenadas por x (array('d') o una vista de memoria compartida)
+        self.xs = xs
+        self.ys = ys
+        self.mejor = math.inf  # distancia al cuadrado
+        self.par = (-1, -1)
+
+    def resolver(self, inicio: int, fin: int):
+        """Actualiza el mejor par con los puntos de posiciones [inicio, fin)."""
+        xs, ys = self.xs, self.ys
+
+        if fin - inicio <= CASO_BASE:
+            mejor = self.mejor
+            for i in range(inicio, fin):
+                xi, yi = xs[i], ys[i]
+                for j in range(i + 1, fin):
+                    dx = xs[j] - xi
+                    dy = ys[j] - yi
+                    d2 = dx * dx + dy * dy
+                    if d2 < mejor:
+                        mejor = d2
+                        self.par = (i, j)
+            self.mejor = mejor
+            return
+
+        medio = (inicio + fin) // 2
+        self.resolver(inicio, medio)
+        self.resolver(medio, fin)
+        self.revisar_franja(inicio, medio, fin)
+
+    def revisar_franja(self, inicio: int, medio: int, fin: int):
+        """
+        Actualiza el mejor par con los pares que cruzan la división en `medio`.
+
+        La franja se ordena por y en cada nivel: O(s log s) con s sus puntos,
+        así que el peor caso total es O(n log² n) y no O(n log n). Mantener
+        el orden por y con una mezcla por nivel lo evitaría, pero en Python
+        resultó más lento que ordenar sólo la franja, que suele ser chica.
+        """
+        xs, ys = self.xs, self.ys
+        x_medio = xs[medio]
+        # Franja: posiciones con |x - x_medio| < d. Se ensancha apenas para
+        # cubrir el redondeo de la raíz; los puntos de más se descartan al comparar.
+        d = math.sqrt(self.mejor) * (1 + 1e-9)
+        izq = bisect_left(xs, x_medio - d, inicio, medio)
+        der = bisect_right(xs, x_medio + d, medio, fin)
+        franja = sorted(range(izq, der), key=ys.__getitem__)
+
+        mejor = self.mejor
+        largo = len(franja)
+        for a in range(largo):
+            i = franja[a]
+            xi, yi = xs[i], ys[i]
+            for b in range(a + 1, min(a + 8, largo)):
+                j = franja[b]
+                dy = ys[j] - yi
+                if dy * dy >= mejor:
+                    break
+                dx = xs[j] - xi
+                d2 = dx * dx + dy * dy
+                if d2 < mejor:
+                    mejor = d2
+                    self.par = (i, j)
+        self.mejor = mejor
+
+
+def closest_pair_arreglos(puntos: List[Point]) -> Tuple[float, Point, Point]:
+    """
+    Par de puntos más cercanos sobre arreglos preasignados y rangos de índices.
+
+    Args:
+        puntos: Lista de tuplas (x, y)
+
+    Returns:
+        Tupla con (distancia_minima, punto1, punto2), con la misma distancia
+        que `closest_pair`
+
+    Complejidad: O(n log n) con franjas chicas (el caso habitual); O(n log² n)
+                 en el peor caso (todos los puntos en la franja de cada nivel)
+    Espacio: O(n) para los arreglos, asignados una sola vez
+    """
+    if len(puntos) < 2:
+        return float('inf'), None, None
+
+    # Referencias a los puntos ordenados por x: sólo para devolver el par
+    px = sorted(puntos, key=itemgetter(0))
+    resolvedor = _Resolvedor(array('d', map(itemgetter(0), px)), array('d', map(itemgetter(1), px)))
+    resolvedor.resolver(0, len(px))
+
+    i, j = resolvedor.par
+    p1, p2 = px[i], px[j]
+    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2), p1, p2
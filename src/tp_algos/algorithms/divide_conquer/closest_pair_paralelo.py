@@ -0,0 +1,129 @@
+"""
+Par de puntos más cercanos repartido entre procesos.
+
+Los puntos ordenados por x se parten en P franjas verticales contiguas (una
+por trabajador). Cada proceso resuelve su franja con el motor de arreglos y
+el proceso principal combina los resultados: con d el mínimo de todas las
+franjas, sólo falta revisar los pares que cruzan cada frontera, que están a
+menos de d de ella (la misma franja que `min_distancia_franja`).
+
+Las fronteras se combinan de a pares, como los niveles superiores de la
+recursión serial: revisar sólo 7 vecinos en la franja vale cuando cada lado
+de la frontera ya está resuelto (sus pares están a distancia ≥ d).
+
+Las coordenadas viven en un único segmento de `multiprocessing.shared_memory`
+(xs seguido de ys, como doubles): cada proceso se conecta una sola vez al
+iniciar y las tareas sólo envían los límites de su franja, nunca los puntos.
+"""
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import List, Tuple
+
+from tp_algos.algorithms.divide_conquer.closest_pair import Point
+from tp_algos.algorithms.divide_conquer.closest_pair_arreglos import _Resolvedor, closest_pair_arreglos
+from tp_algos.structures.memoria_compartida import conectar, segmentos_compartidos
+
+# Por debajo de esta cantidad de puntos el costo de crear procesos supera la ganancia
+UMBRAL_PARALELO = 100_000
+
+# Estado de cada proceso trabajador (se completa en _inicializar_worker)
+_coordenadas = {}
+
+
+def _inicializar_worker(nombre: str, n: int):
+    """Conecta el proceso trabajador a las coordenadas compartidas."""
+    memoria = conectar(nombre)
+    vista = memoria.buf.cast('d')
+    _coordenadas['shm'] = memoria
+    _coordenadas['xs'] = vista[:n]
+    _coordenadas['ys'] = vista[n:2 * n]
+
+
+def _resolver_franja(inicio: int, fin: int) -> Tuple[float, int, int]:
+    """Mejor par de las posiciones [inicio, fin) como (distancia², i, j)."""
+    resolvedor = _Resolvedor(_coordenadas['xs'], _coordenadas['ys'])
+    resolvedor.resolver(inicio, fin)
+    return (resolvedor.mejor,) + resolvedor.par
+
+
+def _franjas(n: int, partes: int) -> List[Tuple[int, int]]:
+    """Parte las posiciones 0..n en `partes` rangos contiguos de tamaño similar."""
+    limites = [n * k // partes for k in range(partes + 1)]
+    return [(a, b) for a, b in zip(limites, limites[1:]) if a < b]
+
+
+def closest_pair_paralelo(puntos: List[Point], workers: int = None,
+                          umbral_paralelo: int = UMBRAL_PARALELO) -> Tuple[float, Point, Point]:
+    """
+    Par de puntos más cercanos con una franja vertical por proceso.
+
+    Args:
+        puntos: Lista de tuplas (x, y)
+        workers: Cantidad de procesos y de franjas (por defecto, os.cpu_count())
+        umbral_paralelo: Con menos puntos se usa el motor de arreglos serial
+
+    Returns:
+        Tupla con (distancia_minima, punto1, punto2), con la misma distancia
+        que `closest_pair`
+
+    Complejidad: O(n log n) para ordenar + O((n / workers) log n) por proceso
+                 + la revisión de las P - 1 fronteras en O(log P) niveles
+    Espacio: O(n) compartido entre todos los procesos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("La cantidad de workers debe ser positiva")
+
+    n = len(puntos)
+    if workers == 1 or n < max(umbral_paralelo, 2):
+        return closest_pair_arreglos(puntos)
+
+    # Referencias a los puntos ordenados por x: sólo para devolver el par
+    px = sorted(puntos, key=itemgetter(0))
+    with segmentos_compartidos([2 * n * 8]) as (memoria,):
+        i, j = _resolver_en_pool(memoria, px, workers)
+
+    p1, p2 = px[i], px[j]
+    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2), p1, p2
+
+
+def _combinar(resolvedor: _Resolvedor, franjas: List[Tuple[int, int]], a: int, b: int):
+    """
+    Revisa las fronteras entre las franjas a..b-1 en orden de árbol: primero
+    las de cada mitad y después la del medio, con las dos mitades ya resueltas.
+    """
+    if b - a < 2:
+        return
+    medio = (a + b) // 2
+    _combinar(resolvedor, franjas, a, medio)
+    _combinar(resolvedor, franjas, medio, b)
+    resolvedor.revisar_franja(franjas[a][0], franjas[medio][0], franjas[b - 1][1])
+
+
+def _resolver_en_pool(memoria, px: List[Point], workers: int) -> Tuple[int, int]:
+    """Resuelve cada franja en el pool y revisa las fronteras; devuelve las posiciones del par."""
+    n = len(px)
+    vista = memoria.buf.cast('d')
+    xs, ys = vista[:n], vista[n:]
+    xs[:] = array('d', map(itemgetter(0), px))
+    ys[:] = array('d', map(itemgetter(1), px))
+    try:
+        franjas = _franjas(n, workers)
+        with ProcessPoolExecutor(max_workers=len(franjas), initializer=_inicializar_worker,
+                                 initargs=(memoria.name, n)) as pool:
+            resultados = list(pool.map(_resolver_franja, *zip(*franjas)))
+
+        resolvedor = _Resolvedor(xs, ys)
+        resolvedor.mejor, i, j = min(resultados)
+        resolvedor.par = (i, j)
+        _combinar(resolvedor, franjas, 0, len(franjas))
+        return resolvedor.par
+    finally:
+        # Las vistas tienen que liberarse antes de cerrar el segmento
+        xs.release()
+        ys.release()
+        vista.release()
@@ -5,7 +5,21 @@ Programación Dinámica para maximizar el valor en una mochila con capacidad lim
 from typing import List, Tuple
 
 
-def knapsack_01(pesos: List[int], valores: List[int], capacidad: int) -> int:
+def _elegir_formulacion(valores: List[int], capacidad: int, formulacion: str) -> str:
+    """
+    Resuelve formulacion="auto": se indexa por valor sólo si los valores son
+    enteros no negativos y sum(valores) < capacidad (tabla más angosta).
+    """
+    if formulacion == "auto":
+        enteros = all(isinstance(v, int) and v >= 0 for v in valores)
+        return "valor" if enteros and sum(valores) < capacidad else "peso"
+    if formulacion not in ("peso", "valor"):
+        raise ValueError(f"Formulación desconocida: {formulacion}")
+    return formulacion
+
+
+def knapsack_01(pesos: List[int], valores: List[int], capacidad: int,
+                formulacion: str = "auto") -> int:
     """
     Mochila 0/1 usando Programación Dinámica.
     
@@ -13,13 +27,21 @@ def knapsack_01(pesos: List[int], valores: List[int], capacidad: int) -> int:
         pesos: Lista de pesos de los objetos
         valores: Lista de valores de los objetos
         capacidad: Capacidad máxima de la mochila
+        formulacion: "peso" (tabla indexada por capacidad), "valor" (tabla
+                     indexada por valor total, ver knapsack_valor) o "auto"
+                     (por defecto, elige la de menos columnas)
     
     Returns:
         Valor máximo alcanzable
     
     Complejidad: O(n * W) donde n = número de objetos, W = capacidad
+                 (O(n * V) con V = sum(valores) en la formulación por valor)
     Espacio: O(n * W)
     """
+    if _elegir_formulacion(valores, capacidad, formulacion) == "valor":
+        from tp_algos.algorithms.dp.knapsack_valor import knapsack_01_por_valor
+        return knapsack_01_por_valor(pesos, valores, capacidad)
+    
     n = len(pesos)
     
     # Tabla DP: dp[i][w] = valor máximo usando los primeros i objetos con capacidad w
@@ -38,13 +60,53 @@ def knapsack_01(pesos: List[int], valores: List[int], capacidad: int) -> int:
     return dp[n][capacidad]
 
 
-def knapsack_01_con_items(pesos: List[int], valores: List[int], capacidad: int) -> Tuple[int, List[int]]:
+def _reconstruir_lineal(pesos: List[int], valores: List[int], capacidad: int,
+                        reconstruccion: str) -> Tuple[int, List[int]]:
+    """Resuelve con un modo de reconstrucción que no arma la tabla completa."""
+    if reconstruccion == "hirschberg":
+        from tp_algos.algorithms.dp.knapsack_hirschberg import knapsack_01_hirschberg
+        return knapsack_01_hirschberg(pesos, valores, capacidad)
+    if reconstruccion == "bits":
+        from tp_algos.algorithms.dp.knapsack_bits import knapsack_01_bits
+        return knapsack_01_bits(pesos, valores, capacidad)
+    raise ValueError(f"Modo de reconstrucción desconocido: {reconstruccion}")
+
+
+def knapsack_01_con_items(pesos: List[int], valores: List[int], capacidad: int,
+                          reconstruccion: str = "tabla",
+                          formulacion: str = "auto") -> Tuple[int, List[int]]:
     """
     Mochila 0/1 que también retorna los objetos seleccionados.
     
+    Args:
+        formulacion: "peso", "valor" o "auto", como en `knapsack_01`. La
+                     formulación por valor arma su propia tabla y elige los
+                     mismos objetos que la tabla por peso, así que sólo se
+                     combina con reconstruccion="tabla"; "auto" con otro
+                     modo de reconstrucción indexa por peso
+        reconstruccion: "tabla" (guarda la tabla completa, O(n * W) de memoria)
+                        o "hirschberg" (divide y vencerás, O(W) de memoria y
+                        ~2 veces el tiempo; ante empates puede elegir otra
+                        solución óptima) o "bits" (fila 1-D más un bit de
+                        decisión por celda, n * W / 8 bytes; mismos objetos
+                        que la tabla)
+    
     Returns:
         Tupla con (valor_maximo, lista_de_indices_seleccionados)
+
+    Raises:
+        ValueError: si la formulación es desconocida o si se pide
+                    formulacion="valor" con una reconstrucción que no es "tabla"
     """
+    elegida = _elegir_formulacion(valores, capacidad, formulacion)
+    if formulacion == "valor" and reconstruccion != "tabla":
+        raise ValueError(f'formulacion="valor" no admite reconstruccion="{reconstruccion}"')
+    if elegida == "valor" and reconstruccion == "tabla":
+        from tp_algos.algorithms.dp.knapsack_valor import knapsack_01_por_valor_con_items
+        return knapsack_01_por_valor_con_items(pesos, valores, capacidad)
+    if reconstruccion != "tabla":
+        return _reconstruir_lineal(pesos, valores, capacidad, reconstruccion)
+    
     n = len(pesos)
     dp = [[0] * (capacidad + 1) for _ in range(n + 1)]
     
@@ -68,10 +130,19 @@ def knapsack_01_con_items(pesos: List[int], valores: List[int], capacidad: int)
     return dp[n][capacidad], items_seleccionados
 
 
-def knapsack_01_detallado(pesos: List[int], valores: List[int], capacidad: int) -> dict:
+def knapsack_01_detallado(pesos: List[int], valores: List[int], capacidad: int,
+                          reconstruccion: str = "tabla",
+                          formulacion: str = "auto") -> dict:
     """
     Versión detallada que muestra el proceso completo.
     
+    Args:
+        reconstruccion: "tabla" o un modo en memoria lineal (ver
+                        `knapsack_01_con_items`); en ese caso 'tabla_dp' es None
+        formulacion: "peso", "valor" o "auto", como en `knapsack_01_con_items`.
+                     'tabla_dp' es la tabla indexada por peso, así que también
+                     es None cuando se indexa por valor
+    
     Returns:
         Diccionario con:
         - 'valor_maximo': el valor máximo alcanzable
@@ -80,40 +151,47 @@ def knapsack_01_detallado(pesos: List[int], valores: List[int], capacidad: int)
         - 'tabla_dp': tabla de programación dinámica
         - 'solucion_detallada': información de cada objeto seleccionado
     """
-    n = len(pesos)
-    dp = [[0] * (capacidad + 1) for _ in range(n + 1)]
-    
-    # Llenar la tabla DP
-    for i in range(1, n + 1):
-        for w in range(capacidad + 1):
-            dp[i][w] = dp[i-1][w]
-            if pesos[i-1] <= w:
-                dp[i][w] = max(dp[i][w], dp[i-1][w - pesos[i-1]] + valores[i-1])
-    
-    # Reconstruir la solución
-    items_seleccionados = []
-    solucion_detallada = []
-    w = capacidad
-    
-    for i in range(n, 0, -1):
-        if dp[i][w] != dp[i-1][w]:
-            idx = i - 1
-            items_seleccionados.append(idx)
-            solucion_detallada.append({
-                'indice': idx,
-                'peso': pesos[idx],
-                'valor': valores[idx],
-                'relacion': valores[idx] / pesos[idx] if pesos[idx] > 0 else 0
-            })
-            w -= pesos[idx]
+    if reconstruccion != "tabla" or _elegir_formulacion(valores, capacidad, formulacion) == "valor":
+        valor_maximo, items_seleccionados = knapsack_01_con_items(
+            pesos, valores, capacidad, reconstruccion, formulacion)
+        dp = None
+    else:
+        n = len(pesos)
+        dp = [[0] * (capacidad + 1) for _ in range(n + 1)]
+        
+        # Llenar la tabla DP
+        for i in range(1, n + 1):
+            for w in range(capacidad + 1):
+                dp[i][w] = dp[i-1][w]
+                if pesos[i-1] <= w:
+                    dp[i][w] = max(dp[i][w], dp[i-1][w - pesos[i-1]] + valores[i-1])
+        
+        # Reconstruir la solución
+        items_seleccionados = []
+        w = capacidad
+        
+        for i in range(n, 0, -1):
+            if dp[i][w] != dp[i-1][w]:
+                items_seleccionados.append(i - 1)
+                w -= pesos[i-1]
+        
+        items_seleccionados.reverse()
+        valor_maximo = dp[n][capacidad]
     
-    items_seleccionados.reverse()
-    solucion_detallada.reverse()
+    solucion_detallada = [
+        {
+            'indice': idx,
+            'peso': pesos[idx],
+            'valor': valores[idx],
+            'relacion': valores[idx] / pesos[idx] if pesos[idx] > 0 else 0
+        }
+        for idx in items_seleccionados
+    ]
     
     peso_total = sum(pesos[i] for i in items_seleccionados)
     
     return {
-        'valor_maximo': dp[n][capacidad],
+        'valor_maximo': valor_maximo,
         'items_seleccionados': items_seleccionados,
         'peso_total': peso_total,
         'capacidad_usada': f"{peso_total}/{capacidad}",
@@ -123,14 +201,157 @@ def knapsack_01_detallado(pesos: List[int], valores: List[int], capacidad: int)
     }
 
 
-def knapsack_01_optimizado(pesos: List[int], valores: List[int], capacidad: int) -> int:
+def _orden_por_relacion(pesos: List[int], valores: List[int], indices) -> List[int]:
+    """Índices ordenados por `relacion` valor/peso decreciente (peso 0 primero)."""
+    return sorted(indices, key=lambda i: valores[i] / pesos[i] if pesos[i] > 0 else float('inf'),
+                  reverse=True)
+
+
+def cota_fraccionaria(pesos: List[int], valores: List[int], capacidad: int) -> float:
+    """
+    Cota superior de la mochila 0/1: el óptimo de la mochila fraccionaria
+    (relajación lineal). Se toman los objetos por mayor `relacion` valor/peso
+    y del primero que no entra, sólo la fracción que cabe.
+    
+    Complejidad: O(n log n)
+    """
+    orden = _orden_por_relacion(
+        pesos, valores, [i for i in range(len(pesos)) if valores[i] > 0 and pesos[i] <= capacidad]
+    )
+    cota = 0
+    restante = capacidad
+    for i in orden:
+        if pesos[i] <= restante:
+            cota += valores[i]
+            restante -= pesos[i]
+        else:
+            return cota + valores[i] * restante / pesos[i]
+    return cota
+
+
+def knapsack_01_aproximado(pesos: List[int], valores: List[int], capacidad: int,
+                           eps: float = 0.01) -> Tuple[int, List[int], float]:
+    """
+    Esquema de aproximación (FPTAS) para la mochila 0/1.
+    
+    Los valores se escalan a floor(v / K) con K = eps * LB / n, donde LB es
+    una cota inferior del óptimo (el mejor objeto solo o la solución golosa),
+    y se resuelve exacto con la formulación por valor sobre los valores
+    escalados. Redondear pierde menos de K por objeto, así que:
+        valor >= OPT - n * K >= (1 - eps) * OPT
+    
+    Args:
+        pesos: Lista de pesos de los objetos
+        valores: Lista de valores no negativos
+        capacidad: Capacidad máxima de la mochila
+        eps: Error relativo tolerado, en (0, 1)
+    
+    Returns:
+        Tupla con (valor, lista_de_indices_seleccionados, cota_error), donde
+        OPT - valor <= cota_error = min(n * K, cota fraccionaria - valor).
+        Si los valores son enteros y K <= 1 no se escala y la cota es 0.
+    
+    Complejidad: O(n² / eps) (la fila tiene a lo sumo ~2n / eps columnas)
+    Espacio: O(n² / eps) bits
+    """
+    if not 0 < eps < 1:
+        raise ValueError("eps debe estar en (0, 1)")
+    candidatos = [i for i in range(len(pesos)) if valores[i] > 0 and pesos[i] <= capacidad]
+    if not candidatos:
+        return 0, [], 0
+    
+    pesos_c = [pesos[i] for i in candidatos]
+    valores_c = [valores[i] for i in candidatos]
+    
+    # Cota inferior golosa: por relación valor/peso, salteando lo que no entra
+    orden = _orden_por_relacion(pesos_c, valores_c, range(len(candidatos)))
+    goloso, restante = 0, capacidad
+    for j in orden:
+        if pesos_c[j] <= restante:
+            goloso += valores_c[j]
+            restante -= pesos_c[j]
+    
+    escala = eps * max(goloso, max(valores_c)) / len(candidatos)
+    exacto = escala <= 1 and all(isinstance(v, int) for v in valores_c)
+    if exacto:
+        escala = 1
+    escalados = [int(v // escala) for v in valores_c]
+    cota_superior = cota_fraccionaria(pesos_c, valores_c, capacidad)
+    
+    from tp_algos.algorithms.dp.knapsack_valor import knapsack_01_por_valor_bits
+    _, elegidos = knapsack_01_por_valor_bits(pesos_c, escalados, capacidad,
+                                             valor_maximo=int(cota_superior // escala))
+    
+    items = [candidatos[j] for j in elegidos]
+    valor = sum(valores[i] for i in items)
+    cota_error = 0 if exacto else max(0, min(len(candidatos) * escala, cota_superior - valor))
+    return valor, items, cota_error
+
+
+def knapsack_01_multi(pesos: List[int], valores: List[int], capacidades: List[int],
+                      con_items: bool = False) -> list:
+    """
+    Resuelve la mochila 0/1 para varias capacidades con una sola pasada.
+    
+    La fila 1-D llenada hasta max(capacidades) ya contiene en dp[c] la
+    respuesta para toda capacidad c. Con `con_items` se guarda además una
+    única tabla de decisiones en bits (ver knapsack_bits) compartida por
+    todas las reconstrucciones.
+    
+    Args:
+        pesos: Lista de pesos de los objetos
+        valores: Lista de valores de los objetos
+        capacidades: Capacidades a consultar (en cualquier orden, con repetidos)
+        con_items: Si es True, devuelve también los objetos de cada capacidad
+    
+    Returns:
+        Lista alineada con `capacidades`: el valor máximo de cada una o, con
+        `con_items`, tuplas (valor_maximo, lista_de_indices_seleccionados)
+        iguales a las de `knapsack_01_con_items`
+    
+    Complejidad: O(n * max(capacidades)) más O(n) por reconstrucción
+    Espacio: O(max(capacidades)), más n * max(capacidades) / 8 bytes con items
+    """
+    if not capacidades:
+        return []
+    maxima = max(max(capacidades), 0)
+    
+    if not con_items:
+        from tp_algos.algorithms.dp.knapsack_vectorizado import fila_vectorizada, a_python
+        dp = fila_vectorizada(pesos, valores, maxima)
+        return [a_python(dp[c]) if c >= 0 else 0 for c in capacidades]
+    
+    from tp_algos.algorithms.dp.knapsack_bits import resolver_con_decisiones
+    from tp_algos.algorithms.dp.knapsack_vectorizado import a_python
+    dp, decisiones = resolver_con_decisiones(pesos, valores, maxima)
+    return [(a_python(dp[c]), decisiones.reconstruir(pesos, c)) if c >= 0 else (0, [])
+            for c in capacidades]
+
+
+def knapsack_01_optimizado(pesos: List[int], valores: List[int], capacidad: int,
+                           motor: str = "python", **opciones) -> int:
     """
     Versión optimizada en espacio: O(W) en lugar de O(n*W).
     Solo calcula el valor máximo, no los items.
     
+    Args:
+        motor: "python" (ciclo sobre w), "numpy" (cada objeto actualiza la
+               fila completa con una operación vectorizada) o "paralelo"
+               (la fila se reparte en tramos entre procesos)
+        **opciones: Parámetros del motor paralelo (workers, umbral_paralelo)
+    
     Complejidad temporal: O(n * W)
     Complejidad espacial: O(W)
     """
+    if motor == "numpy":
+        from tp_algos.algorithms.dp.knapsack_vectorizado import knapsack_01_vectorizado
+        return knapsack_01_vectorizado(pesos, valores, capacidad)
+    if motor == "paralelo":
+        from tp_algos.algorithms.dp.knapsack_paralelo import knapsack_01_paralelo
+        return knapsack_01_paralelo(pesos, valores, capacidad, **opciones)
+    if motor != "python":
+        raise ValueError(f"Motor desconocido: {motor}")
+    
     dp = [0] * (capacidad + 1)
     
     for i in range(len(pesos)):
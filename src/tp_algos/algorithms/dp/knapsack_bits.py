@@ -0,0 +1,105 @@
+"""
+Mochila 0/1 con tabla de decisiones empaquetada en bits.
+
+Para reconstruir los objetos no hace falta la tabla de valores completa: alcanza
+con saber, para cada objeto i y capacidad w, si tomar el objeto mejoró
+estrictamente dp[w]. Esa decisión es un bit, así que la tabla ocupa n·(W+1)/8
+bytes en lugar de n·(W+1) enteros de Python (8 bytes de puntero cada uno, más
+el objeto si el valor no es un entero chico).
+
+Los valores se calculan con la fila 1-D vectorizada de `knapsack_vectorizado` y
+el bit es exactamente la condición dp[i][w] != dp[i-1][w] de la tabla, por lo
+que el recorrido hacia atrás elige los mismos objetos que `knapsack_01_con_items`.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+from tp_algos.algorithms.dp.knapsack_vectorizado import elegir_dtype, a_python
+
+
+class TablaDecisiones:
+    """
+    Bits de decisión por (objeto, capacidad), una fila de bytes por objeto.
+
+    El bit w de la fila i vale 1 si al procesar el objeto i convino tomarlo
+    con capacidad w.
+    """
+
+    def __init__(self, n: int, capacidad: int):
+        self.capacidad = capacidad
+        self.bits = np.zeros((n, (capacidad + 8) // 8), dtype=np.uint8)
+
+    def guardar_fila(self, i: int, mascara: np.ndarray):
+        """Empaqueta una máscara booleana de largo capacidad + 1 en la fila i."""
+        self.bits[i] = np.packbits(mascara, bitorder='little')
+
+    def tomado(self, i: int, w: int) -> bool:
+        return bool((self.bits[i, w >> 3] >> (w & 7)) & 1)
+
+    def reconstruir(self, pesos: List[int], capacidad: int) -> List[int]:
+        """Recorre las decisiones desde el último objeto, como la tabla completa."""
+        items = []
+        w = capacidad
+        for i in range(len(self.bits) - 1, -1, -1):
+            if self.tomado(i, w):
+                items.append(i)
+                w -= pesos[i]
+        items.reverse()
+        return items
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes
+
+
+def resolver_con_decisiones(pesos: List[int], valores: List,
+                            capacidad: int) -> Tuple[np.ndarray, TablaDecisiones]:
+    """
+    Llena la fila 1-D hasta `capacidad` guardando las decisiones en bits.
+
+    Returns:
+        (fila, decisiones): fila[w] es el valor máximo con capacidad w y
+        decisiones.reconstruir(pesos, w) los objetos, para todo w ≤ capacidad
+    """
+    dtype = elegir_dtype(valores)
+    decisiones = TablaDecisiones(len(pesos), capacidad)
+
+    dp = np.zeros(capacidad + 1, dtype=dtype)
+    candidato = np.empty(capacidad + 1, dtype=dtype)
+    mascara = np.zeros(capacidad + 1, dtype=bool)
+
+    for i, (p, v) in enumerate(zip(pesos, valores)):
+        if p > capacidad:
+            continue
+        largo = capacidad + 1 - p
+        np.add(dp[:largo], v, out=candidato[:largo])
+        # Se toma sólo si mejora estrictamente, como dp[i][w] != dp[i-1][w]
+        mascara[:p] = False
+        mascara[p:] = candidato[:largo] > dp[p:]
+        np.maximum(dp[p:], candidato[:largo], out=dp[p:])
+        decisiones.guardar_fila(i, mascara)
+
+    return dp, decisiones
+
+
+def knapsack_01_bits(pesos: List[int], valores: List, capacidad: int) -> Tuple[int, List[int]]:
+    """
+    Mochila 0/1 con fila de DP 1-D y un bit de decisión por (objeto, capacidad).
+
+    Args:
+        pesos: Lista de pesos enteros no negativos
+        valores: Lista de valores
+        capacidad: Capacidad máxima de la mochila
+
+    Returns:
+        Tupla con (valor_maximo, lista_de_indices_seleccionados), igual a
+        `knapsack_01_con_items`
+
+    Complejidad: O(n * W), con O(n) operaciones NumPy
+    Espacio: O(n * W / 8) bytes para las decisiones + O(W) para la fila
+    """
+    if capacidad < 0:
+        return 0, []
+    dp, decisiones = resolver_con_decisiones(pesos, valores, capacidad)
+    return a_python(dp[capacidad]), decisiones.reconstruir(pesos, capacidad)
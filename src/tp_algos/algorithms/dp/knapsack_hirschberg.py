@@ -0,0 +1,76 @@
+"""
+Reconstrucción de la mochila 0/1 en memoria O(W) (estilo Hirschberg).
+
+`knapsack_01_con_items` guarda la tabla completa de (n+1)×(W+1) sólo para
+poder recorrerla hacia atrás. Acá se guardan a lo sumo dos filas a la vez:
+
+    1. Se parten los objetos en dos mitades A y B.
+    2. f[c] = mejor valor de A con capacidad c (DP hacia adelante)
+       g[c] = mejor valor de B con capacidad c (DP sobre la otra mitad)
+    3. El punto de corte c* maximiza f[W - c] + g[c]: la solución óptima
+       usa capacidad W - c* en A y c* en B.
+    4. Se liberan f y g y se resuelve cada mitad recursivamente.
+
+En cada nivel de la recursión las capacidades de los subproblemas suman W,
+así que el tiempo total es a lo sumo ~2 veces el de la tabla.
+"""
+from typing import List, Tuple
+
+
+def _fila(pesos: List[int], valores: List, inicio: int, fin: int, capacidad: int) -> list:
+    """Fila final de la DP 1-D con los objetos [inicio, fin) y capacidades 0..capacidad."""
+    dp = [0] * (capacidad + 1)
+    for i in range(inicio, fin):
+        p, v = pesos[i], valores[i]
+        for w in range(capacidad, p - 1, -1):
+            candidato = dp[w - p] + v
+            if candidato > dp[w]:
+                dp[w] = candidato
+    return dp
+
+
+def _resolver(pesos: List[int], valores: List, inicio: int, fin: int,
+              capacidad: int, items: List[int]):
+    """Agrega a `items`, en orden creciente, los objetos elegidos de [inicio, fin)."""
+    if fin - inicio == 1:
+        # Mismo criterio que la tabla: se incluye sólo si mejora estrictamente
+        if pesos[inicio] <= capacidad and valores[inicio] > 0:
+            items.append(inicio)
+        return
+    if fin <= inicio:
+        return
+
+    medio = (inicio + fin) // 2
+    f = _fila(pesos, valores, inicio, medio, capacidad)
+    g = _fila(pesos, valores, medio, fin, capacidad)
+
+    # Ante empates se toma el menor c: la mitad B usa exactamente c* de capacidad
+    corte = max(range(capacidad + 1), key=lambda c: (f[capacidad - c] + g[c], -c))
+    del f, g
+
+    _resolver(pesos, valores, inicio, medio, capacidad - corte, items)
+    _resolver(pesos, valores, medio, fin, corte, items)
+
+
+def knapsack_01_hirschberg(pesos: List[int], valores: List, capacidad: int) -> Tuple[int, List[int]]:
+    """
+    Mochila 0/1 con reconstrucción de objetos en memoria lineal.
+
+    Args:
+        pesos: Lista de pesos enteros no negativos
+        valores: Lista de valores
+        capacidad: Capacidad máxima de la mochila
+
+    Returns:
+        Tupla con (valor_maximo, lista_de_indices_seleccionados), como
+        `knapsack_01_con_items`. Si hay varias soluciones óptimas puede
+        devolver otra distinta de la que da la tabla.
+
+    Complejidad: O(n * W), con constante ~2 respecto de la tabla
+    Espacio: O(W + log n)
+    """
+    if capacidad < 0:
+        return 0, []
+    items: List[int] = []
+    _resolver(pesos, valores, 0, len(pesos), capacidad, items)
+    return sum((valores[i] for i in items), 0), items
@@ -0,0 +1,184 @@
+"""
+Mochila 0/1 incremental: agregar objetos a un estado de DP ya calculado.
+
+La fila 1-D de `knapsack_01_optimizado` después de procesar n objetos es todo
+lo que hace falta para procesar el objeto n+1. `KnapsackState` guarda esa fila
+(y opcionalmente un bit de decisión por objeto y capacidad), así que cuando el
+catálogo crece sólo se paga O(W) por objeto nuevo en lugar de O(n * W).
+
+Formato del archivo de `guardar` (little-endian):
+
+    offset  tamaño  campo
+    0       4       firma b"TPKS"
+    4       2       versión del formato
+    6       1       1 si guarda decisiones, 0 si no
+    7       1       tipo de los valores: b"q" (int64) o b"d" (float64)
+    8       8       capacidad W
+    16      8       n (cantidad de objetos)
+    24      8·n     pesos (int64)
+    ...     8·n     valores
+    ...     8·(W+1) fila de DP
+    ...     n·⌈(W+1)/8⌉  decisiones empaquetadas (si corresponde)
+"""
+import struct
+from typing import List, Optional
+
+import numpy as np
+
+from tp_algos.algorithms.dp.knapsack_vectorizado import a_python, elegir_dtype
+
+FIRMA = b"TPKS"
+VERSION = 1
+_ENCABEZADO = struct.Struct("<4sHBcQQ")
+_TIPOS = {b"q": np.dtype("<i8"), b"d": np.dtype("<f8")}
+
+
+class KnapsackState:
+    """
+    Estado de la DP de mochila 0/1 al que se le pueden agregar objetos.
+
+    El tipo de la fila sigue a `elegir_dtype`: int64 mientras los valores sean
+    enteros y su suma entre en int64, object (enteros de Python) si la suma
+    puede desbordar y float64 desde el primer valor real.
+    """
+
+    def __init__(self, capacidad: int, guardar_decisiones: bool = False):
+        if capacidad < 0:
+            raise ValueError("La capacidad debe ser no negativa")
+        self.capacidad = capacidad
+        self.guardar_decisiones = guardar_decisiones
+        self.pesos: List[int] = []
+        self.valores: List = []
+        self.fila = np.zeros(capacidad + 1, dtype=_TIPOS[b"q"])
+        self._candidato = np.empty_like(self.fila)
+        self._decisiones: List[np.ndarray] = []
+        # Suma de |valor| de los enteros agregados: cota de cualquier fila[w]
+        self._suma_abs = 0
+
+    def __len__(self):
+        return len(self.pesos)
+
+    def agregar_item(self, peso: int, valor) -> int:
+        """
+        Procesa un objeto nuevo sobre la fila actual.
+
+        Returns:
+            Índice del objeto agregado
+
+        Complejidad: O(W)
+        """
+        if peso < 0:
+            raise ValueError("El peso debe ser no negativo")
+        self._promover(valor)
+
+        mascara = np.zeros(self.capacidad + 1, dtype=bool) if self.guardar_decisiones else None
+        if peso <= self.capacidad:
+            largo = self.capacidad + 1 - peso
+            candidato = self._candidato[:largo]
+            np.add(self.fila[:largo], valor, out=candidato)
+            if mascara is not None:
+                # Se toma sólo si mejora estrictamente, como la tabla completa
+                mascara[peso:] = candidato > self.fila[peso:]
+            np.maximum(self.fila[peso:], candidato, out=self.fila[peso:])
+
+        if mascara is not None:
+            self._decisiones.append(np.packbits(mascara, bitorder='little'))
+        self.pesos.append(peso)
+        self.valores.append(valor)
+        return len(self.pesos) - 1
+
+    def _promover(self, valor):
+        """Cambia el tipo de la fila si `valor` no entra en el actual (int64 → object → float64)."""
+        if isinstance(valor, (int, np.integer)):
+            self._suma_abs += abs(int(valor))
+        if self.fila.dtype == _TIPOS[b"d"]:
+            return
+        dtype = elegir_dtype([self._suma_abs, valor])
+        if dtype != self.fila.dtype and not (dtype == np.int64 and self.fila.dtype == object):
+            self.fila = self.fila.astype(dtype)
+            self._candidato = np.empty_like(self.fila)
+
+    def mejor_valor(self, capacidad: Optional[int] = None):
+        """Valor máximo con los objetos agregados hasta ahora. Complejidad: O(1)"""
+        capacidad = self.capacidad if capacidad is None else capacidad
+        if not 0 <= capacidad <= self.capacidad:
+            raise ValueError(f"La capacidad debe estar entre 0 y {self.capacidad}")
+        return a_python(self.fila[capacidad])
+
+    def items(self, capacidad: Optional[int] = None) -> List[int]:
+        """
+        Objetos de la solución óptima (los mismos que `knapsack_01_con_items`).
+
+        Complejidad: O(n)
+        """
+        if not self.guardar_decisiones:
+            raise ValueError("El estado no guarda decisiones (guardar_decisiones=False)")
+        w = self.capacidad if capacidad is None else capacidad
+        self.mejor_valor(w)
+        seleccionados = []
+        for i in range(len(self.pesos) - 1, -1, -1):
+            if (self._decisiones[i][w >> 3] >> (w & 7)) & 1:
+                seleccionados.append(i)
+                w -= self.pesos[i]
+        seleccionados.reverse()
+        return seleccionados
+
+    def guardar(self, ruta: str):
+        """
+        Guarda el estado en un archivo binario versionado.
+
+        Raises:
+            ValueError: si la fila usa enteros fuera de int64 (no tienen formato fijo)
+        """
+        if self.fila.dtype == object:
+            raise ValueError("Los valores exceden int64 y no se pueden guardar")
+        tipo = b"q" if self.fila.dtype == _TIPOS[b"q"] else b"d"
+        with open(ruta, "wb") as archivo:
+            archivo.write(_ENCABEZADO.pack(FIRMA, VERSION, int(self.guardar_decisiones), tipo,
+                                           self.capacidad, len(self.pesos)))
+            archivo.write(np.asarray(self.pesos, dtype="<i8").tobytes())
+            archivo.write(np.asarray(self.valores, dtype=_TIPOS[tipo]).tobytes())
+            archivo.write(self.fila.tobytes())
+            for fila in self._decisiones:
+                archivo.write(fila.tobytes())
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "KnapsackState":
+        """
+        Reconstruye un estado guardado con `guardar`.
+
+        Raises:
+            ValueError: si el archivo no tiene el formato o la versión esperados
+        """
+        with open(ruta, "rb") as archivo:
+            crudo = archivo.read()
+        if len(crudo) < _ENCABEZADO.size:
+            raise ValueError("Archivo demasiado corto para ser un estado de mochila")
+        firma, version, con_decisiones, tipo, capacidad, n = _ENCABEZADO.unpack_from(crudo)
+        if firma != FIRMA:
+            raise ValueError("El archivo no es un estado de mochila")
+        if version != VERSION:
+            raise ValueError(f"Versión de formato no soportada: {version}")
+
+        dtype = _TIPOS[tipo]
+        bytes_fila = (capacidad + 8) // 8
+        esperado = _ENCABEZADO.size + 8 * n + 8 * n + 8 * (capacidad + 1)
+        esperado += n * bytes_fila if con_decisiones else 0
+        if len(crudo) != esperado:
+            raise ValueError("El archivo está truncado o tiene datos de más")
+
+        estado = cls(capacidad, bool(con_decisiones))
+        offset = _ENCABEZADO.size
+        estado.pesos = np.frombuffer(crudo, "<i8", n, offset).tolist()
+        offset += 8 * n
+        estado.valores = np.frombuffer(crudo, dtype, n, offset).tolist()
+        if dtype == _TIPOS[b"q"]:
+            estado._suma_abs = sum(abs(v) for v in estado.valores)
+        offset += 8 * n
+        estado.fila = np.frombuffer(crudo, dtype, capacidad + 1, offset).copy()
+        estado._candidato = np.empty_like(estado.fila)
+        offset += 8 * (capacidad + 1)
+        if con_decisiones:
+            decisiones = np.frombuffer(crudo, np.uint8, n * bytes_fila, offset).reshape(n, bytes_fila)
+            estado._decisiones = list(decisiones.copy())
+        return estado
@@ -0,0 +1,110 @@
+"""
+Mochila 0/1 paralela sobre tramos de la capacidad.
+
+Para un objeto fijo (p, v), la fila nueva depende sólo de la anterior:
+    nueva[w] = max(anterior[w], anterior[w - p] + v)
+así que el rango 0..W se puede partir en tramos que se calculan en procesos
+distintos. Las dos filas viven en `multiprocessing.shared_memory` y se
+alternan (doble buffer): en cada objeto todos los trabajadores leen de una y
+escriben en la otra, y el proceso principal espera a que terminen todos los
+tramos (barrera) antes de pasar al objeto siguiente.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import List, Tuple
+
+import numpy as np
+
+from tp_algos.algorithms.dp.knapsack_vectorizado import (
+    a_python, elegir_dtype, knapsack_01_vectorizado
+)
+from tp_algos.structures.memoria_compartida import conectar, segmentos_compartidos
+
+# Por debajo de esta capacidad el costo de sincronizar por objeto supera la ganancia
+UMBRAL_PARALELO = 1_000_000
+
+# Filas compartidas de cada proceso trabajador (se completa en _inicializar_worker)
+_filas = {}
+
+
+def _inicializar_worker(nombres: Tuple[str, str], largo: int, dtype: str):
+    """Conecta el proceso trabajador a las dos filas compartidas."""
+    for indice, nombre in enumerate(nombres):
+        memoria = conectar(nombre)
+        _filas[f'shm{indice}'] = memoria
+        _filas[indice] = np.ndarray((largo,), dtype=dtype, buffer=memoria.buf)
+
+
+def _procesar_tramo(origen: int, inicio: int, fin: int, p: int, v):
+    """Calcula destino[inicio:fin] para el objeto (p, v) leyendo sólo de la fila origen."""
+    anterior, nueva = _filas[origen], _filas[1 - origen]
+    corte = min(max(inicio, p), fin)
+    # Capacidades donde el objeto no entra: se copian sin cambios
+    nueva[inicio:corte] = anterior[inicio:corte]
+    if corte < fin:
+        np.maximum(anterior[corte:fin], anterior[corte - p:fin - p] + v, out=nueva[corte:fin])
+
+
+def _tramos(largo: int, partes: int) -> List[Tuple[int, int]]:
+    """Parte 0..largo en `partes` tramos contiguos de tamaño similar."""
+    limites = [largo * k // partes for k in range(partes + 1)]
+    return [(a, b) for a, b in zip(limites, limites[1:]) if a < b]
+
+
+def knapsack_01_paralelo(pesos: List[int], valores: List, capacidad: int,
+                         workers: int = None, umbral_paralelo: int = UMBRAL_PARALELO):
+    """
+    Mochila 0/1 con la actualización de cada objeto repartida entre procesos.
+
+    Args:
+        pesos: Lista de pesos enteros no negativos
+        valores: Lista de valores (enteros o reales)
+        capacidad: Capacidad máxima de la mochila
+        workers: Cantidad de procesos (por defecto, os.cpu_count())
+        umbral_paralelo: Si la capacidad es menor, se usa el motor NumPy serial
+
+    Returns:
+        Valor máximo alcanzable, igual que `knapsack_01_optimizado`
+
+    Complejidad: O(n * W / workers) de cómputo + O(n) barreras
+    Espacio: O(W) compartido entre todos los procesos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("La cantidad de workers debe ser positiva")
+
+    dtype = elegir_dtype(valores)
+    # Los enteros arbitrarios (dtype object) no se pueden compartir entre procesos
+    if workers == 1 or capacidad < umbral_paralelo or dtype == object:
+        return knapsack_01_vectorizado(pesos, valores, capacidad)
+
+    largo = capacidad + 1
+    with segmentos_compartidos([largo * dtype.itemsize] * 2) as memorias:
+        return _resolver_en_pool(memorias, pesos, valores, largo, dtype, workers)
+
+
+def _resolver_en_pool(memorias: list, pesos: List[int], valores: List, largo: int,
+                      dtype: np.dtype, workers: int):
+    """Procesa los objetos de a uno, con un tramo de capacidades por trabajador."""
+    filas = [np.ndarray((largo,), dtype=dtype, buffer=memoria.buf) for memoria in memorias]
+    filas[0][:] = 0
+    origen = 0
+    tramos = _tramos(largo, workers)
+    argumentos = ((memorias[0].name, memorias[1].name), largo, dtype.str)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                             initargs=argumentos) as pool:
+        for p, v in zip(pesos, valores):
+            if p >= largo:
+                continue
+            futuros = [pool.submit(_procesar_tramo, origen, inicio, fin, p, v) for inicio, fin in tramos]
+            # Barrera: la fila nueva tiene que estar completa antes del próximo objeto
+            wait(futuros)
+            for futuro in futuros:
+                futuro.result()
+            origen = 1 - origen
+
+    resultado = a_python(filas[origen][largo - 1])
+    del filas
+    return resultado
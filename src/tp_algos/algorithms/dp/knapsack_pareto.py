@@ -0,0 +1,95 @@
+"""
+Mochila 0/1 sobre el frente de Pareto (Nemhauser–Ullmann).
+
+En lugar de indexar por capacidad, se guarda la lista de pares (peso, valor)
+alcanzables que no están dominados: ningún otro par pesa lo mismo o menos y
+vale lo mismo o más. Al agregar un objeto (p, v) el nuevo frente es la mezcla
+de la lista anterior con su copia desplazada en (p, v), descartando los pares
+dominados. Ambas listas ya están ordenadas por peso, así que la mezcla es
+lineal.
+
+El costo depende del tamaño del frente y no de W, por lo que sirve para
+capacidades enormes (pesos en gramos hasta 10⁹) siempre que haya pocas
+combinaciones no dominadas.
+"""
+from typing import List, Optional, Tuple
+
+# Cada estado del frente es (peso, valor, camino), donde camino es una lista
+# enlazada (indice_objeto, camino_anterior) compartida entre estados: cada
+# objeto agregado cuesta O(1) de memoria, como un puntero al padre.
+Camino = Optional[tuple]
+
+
+def _mezclar(frente: List[tuple], desplazado: List[tuple]) -> List[tuple]:
+    """
+    Mezcla dos listas ordenadas por peso y deja sólo los pares no dominados.
+
+    Ante un empate exacto gana el estado de `frente` (no tomar el objeto),
+    igual que la tabla, que sólo toma un objeto si mejora estrictamente.
+    """
+    resultado = []
+    mejor_valor = None
+    i = j = 0
+    while i < len(frente) or j < len(desplazado):
+        if j == len(desplazado) or (i < len(frente) and frente[i][0] <= desplazado[j][0]):
+            estado = frente[i]
+            i += 1
+        else:
+            estado = desplazado[j]
+            j += 1
+        if mejor_valor is None or estado[1] > mejor_valor:
+            if resultado and resultado[-1][0] == estado[0]:
+                # Mismo peso y más valor: el anterior queda dominado
+                resultado[-1] = estado
+            else:
+                resultado.append(estado)
+            mejor_valor = estado[1]
+    return resultado
+
+
+def frente_pareto(pesos: List[int], valores: List, capacidad: int) -> List[tuple]:
+    """
+    Frente de Pareto de los subconjuntos que entran en la mochila.
+
+    Returns:
+        Lista de (peso, valor, camino) ordenada por peso, con valores
+        estrictamente crecientes; el último estado es el óptimo.
+
+    Complejidad: O(sum_i |F_i|), con F_i el frente tras el objeto i
+    """
+    frente: List[tuple] = [(0, 0, None)]
+    for indice, (p, v) in enumerate(zip(pesos, valores)):
+        if v <= 0 or p > capacidad:
+            continue
+        desplazado = [(w + p, valor + v, (indice, camino))
+                      for w, valor, camino in frente if w + p <= capacidad]
+        frente = _mezclar(frente, desplazado)
+    return frente
+
+
+def knapsack_01_pareto(pesos: List[int], valores: List, capacidad: int) -> Tuple[int, List[int]]:
+    """
+    Mochila 0/1 por listas de dominancia, con la misma firma que
+    `knapsack_01_con_items`.
+
+    Args:
+        pesos: Lista de pesos no negativos (pueden ser enormes)
+        valores: Lista de valores
+        capacidad: Capacidad máxima de la mochila
+
+    Returns:
+        Tupla con (valor_maximo, lista_de_indices_seleccionados)
+
+    Complejidad: O(n * F) con F el tamaño máximo del frente (F ≤ W + 1)
+    Espacio: O(F + cantidad de estados generados)
+    """
+    if capacidad < 0:
+        return 0, []
+    _, valor, camino = frente_pareto(pesos, valores, capacidad)[-1]
+
+    items = []
+    while camino is not None:
+        indice, camino = camino
+        items.append(indice)
+    items.reverse()
+    return valor, items
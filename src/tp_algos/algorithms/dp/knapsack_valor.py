@@ -0,0 +1,156 @@
+"""
+Mochila 0/1 indexada por valor en lugar de por capacidad.
+
+    M[i][val] = peso mínimo de un subconjunto de los primeros i objetos
+                cuyo valor total es al menos val
+
+    M[i][val] = min(M[i-1][val], M[i-1][max(0, val - v_i)] + p_i)
+
+La tabla tiene sum(valores) + 1 columnas, así que conviene cuando los pesos
+(y la capacidad) son enormes pero los valores son enteros chicos. Como cada
+fila es no decreciente en val, el mejor valor con capacidad w se obtiene por
+búsqueda binaria: el mayor val con M[i][val] ≤ w. Eso es exactamente
+dp[i][w] de la tabla por peso, y permite reconstruir los mismos objetos.
+"""
+from bisect import bisect_right
+from typing import List, Tuple
+
+INFINITO = float('inf')
+
+
+def _validar_valores(valores: List[int]):
+    if not all(isinstance(v, int) and v >= 0 for v in valores):
+        raise ValueError("La formulación por valor requiere valores enteros no negativos")
+
+
+def _fila_siguiente(fila: List, p: int, v: int) -> List:
+    """Fila i a partir de la fila i-1 al agregar el objeto (p, v)."""
+    if v == 0:
+        return fila
+    nueva = fila[:]
+    for val in range(1, len(fila)):
+        candidato = fila[val - v if val > v else 0] + p
+        if candidato < nueva[val]:
+            nueva[val] = candidato
+    return nueva
+
+
+def _mejor_valor(fila: List, capacidad: int) -> int:
+    """Mayor val con fila[val] ≤ capacidad (la fila es no decreciente)."""
+    return bisect_right(fila, capacidad) - 1
+
+
+def knapsack_01_por_valor(pesos: List[int], valores: List[int], capacidad: int) -> int:
+    """
+    Valor máximo de la mochila 0/1 con la DP indexada por valor.
+
+    Args:
+        pesos: Lista de pesos (pueden ser enormes)
+        valores: Lista de valores enteros no negativos
+        capacidad: Capacidad máxima de la mochila
+
+    Returns:
+        Valor máximo alcanzable
+
+    Complejidad: O(n * V) con V = sum(valores)
+    Espacio: O(V)
+    """
+    _validar_valores(valores)
+    if capacidad < 0:
+        return 0
+    fila = [0] + [INFINITO] * sum(valores)
+    for p, v in zip(pesos, valores):
+        if v == 0:
+            continue
+        # De derecha a izquierda: fila[val - v] todavía es de la fila anterior
+        for val in range(len(fila) - 1, 0, -1):
+            candidato = fila[val - v if val > v else 0] + p
+            if candidato < fila[val]:
+                fila[val] = candidato
+    return _mejor_valor(fila, capacidad)
+
+
+def knapsack_01_por_valor_con_items(pesos: List[int], valores: List[int],
+                                    capacidad: int) -> Tuple[int, List[int]]:
+    """
+    Mochila 0/1 indexada por valor que también retorna los objetos.
+
+    El recorrido hacia atrás usa la misma regla que la tabla por peso (el
+    objeto i-1 se toma si dp[i][w] != dp[i-1][w]), así que devuelve los mismos
+    objetos que `knapsack_01_con_items`.
+
+    Returns:
+        Tupla con (valor_maximo, lista_de_indices_seleccionados)
+
+    Complejidad: O(n * V) con V = sum(valores)
+    Espacio: O(n * V)
+    """
+    _validar_valores(valores)
+    if capacidad < 0:
+        return 0, []
+    filas = [[0] + [INFINITO] * sum(valores)]
+    for p, v in zip(pesos, valores):
+        filas.append(_fila_siguiente(filas[-1], p, v))
+
+    items = []
+    w = capacidad
+    for i in range(len(pesos), 0, -1):
+        if _mejor_valor(filas[i], w) != _mejor_valor(filas[i - 1], w):
+            items.append(i - 1)
+            w -= pesos[i - 1]
+    items.reverse()
+    return _mejor_valor(filas[-1], capacidad), items
+
+
+def knapsack_01_por_valor_bits(pesos: List[int], valores: List[int], capacidad: int,
+                               valor_maximo: int = None) -> Tuple[int, List[int]]:
+    """
+    Formulación por valor con la fila vectorizada en NumPy y un bit de
+    decisión por (objeto, valor), para instancias con V grande.
+
+    Los pesos se acumulan en float64, exactos hasta 2⁵³. Ante empates puede
+    elegir objetos distintos de `knapsack_01_por_valor_con_items`.
+
+    Args:
+        valor_maximo: Cota superior del valor alcanzable dentro de la
+                      capacidad; acorta la fila (por defecto sum(valores))
+
+    Returns:
+        Tupla con (valor_maximo, lista_de_indices_seleccionados)
+
+    Complejidad: O(n * V) con O(n) operaciones NumPy
+    Espacio: O(n * V / 8) bytes para las decisiones
+    """
+    import numpy as np
+
+    from tp_algos.algorithms.dp.knapsack_bits import TablaDecisiones
+
+    _validar_valores(valores)
+    if capacidad < 0:
+        return 0, []
+    largo = (sum(valores) if valor_maximo is None else valor_maximo) + 1
+    decisiones = TablaDecisiones(len(pesos), largo - 1)
+
+    fila = np.full(largo, np.inf)
+    fila[0] = 0.0
+    candidato = np.empty(largo)
+    for i, (p, v) in enumerate(zip(pesos, valores)):
+        if v == 0 or p > capacidad:
+            continue
+        # Con val ≤ v alcanza con el objeto solo: M[0] + p = p
+        corte = min(v, largo)
+        candidato[:corte] = p
+        np.add(fila[:largo - corte], p, out=candidato[corte:])
+        mascara = candidato < fila
+        np.minimum(fila, candidato, out=fila)
+        decisiones.guardar_fila(i, mascara)
+
+    mejor = int(np.searchsorted(fila, capacidad, side='right')) - 1
+    items = []
+    val = mejor
+    for i in range(len(pesos) - 1, -1, -1):
+        if val > 0 and decisiones.tomado(i, val):
+            items.append(i)
+            val = max(0, val - valores[i])
+    items.reverse()
+    return mejor, items
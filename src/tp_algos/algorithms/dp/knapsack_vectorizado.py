@@ -0,0 +1,76 @@
+"""
+Mochila 0/1 con la fila de DP vectorizada en NumPy.
+
+Misma recurrencia que `knapsack_01_optimizado`, pero la actualización de cada
+objeto sobre todas las capacidades se hace en una sola operación:
+    dp[p:] = max(dp[p:], dp[:-p] + v)
+El lado derecho se calcula entero antes de escribir, así que cada objeto se
+usa a lo sumo una vez (no hace falta recorrer w de derecha a izquierda).
+"""
+from typing import List
+
+import numpy as np
+
+
+def elegir_dtype(valores: List) -> np.dtype:
+    """
+    Elige el dtype de la fila de DP a partir de los valores:
+    - int64 si son enteros y su suma entra en int64 (resultado exacto)
+    - object (enteros de Python) si son enteros más grandes
+    - float64 si hay valores no enteros
+    """
+    if all(isinstance(v, (int, np.integer)) for v in valores):
+        if sum(abs(int(v)) for v in valores) <= np.iinfo(np.int64).max:
+            return np.dtype(np.int64)
+        return np.dtype(object)
+    return np.dtype(np.float64)
+
+
+def fila_vectorizada(pesos: List[int], valores: List, capacidad: int, dtype=None) -> np.ndarray:
+    """
+    Fila final de la DP 1-D: fila[w] = valor máximo con capacidad w, para
+    todo w en 0..capacidad.
+    """
+    dtype = elegir_dtype(valores) if dtype is None else np.dtype(dtype)
+
+    dp = np.zeros(capacidad + 1, dtype=dtype)
+    # Buffer reutilizado para dp[:-p] + v: evita una asignación por objeto
+    candidato = np.empty(capacidad + 1, dtype=dtype)
+
+    for p, v in zip(pesos, valores):
+        if p > capacidad:
+            continue
+        if p == 0:
+            if v > 0:
+                dp += v
+            continue
+        largo = capacidad + 1 - p
+        np.add(dp[:largo], v, out=candidato[:largo])
+        np.maximum(dp[p:], candidato[:largo], out=dp[p:])
+    return dp
+
+
+def a_python(valor):
+    """Convierte un escalar NumPy a int/float de Python (los object ya lo son)."""
+    return valor.item() if isinstance(valor, np.generic) else valor
+
+
+def knapsack_01_vectorizado(pesos: List[int], valores: List, capacidad: int, dtype=None):
+    """
+    Mochila 0/1 donde cada objeto actualiza toda la fila con una operación NumPy.
+
+    Args:
+        pesos: Lista de pesos enteros no negativos
+        valores: Lista de valores (enteros o reales)
+        capacidad: Capacidad máxima de la mochila
+        dtype: Tipo de la fila de DP; por defecto lo elige `elegir_dtype`
+
+    Returns:
+        Valor máximo alcanzable (int o float de Python, igual que knapsack_01)
+
+    Complejidad temporal: O(n * W) operaciones, O(n) llamadas a NumPy
+    Complejidad espacial: O(W)
+    """
+    if capacidad < 0:
+        return 0
+    return a_python(fila_vectorizada(pesos, valores, capacidad, dtype)[capacidad])
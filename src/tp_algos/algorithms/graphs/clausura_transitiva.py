@@ -0,0 +1,94 @@
+"""
+Clausura transitiva (algoritmo de Warshall) con filas como bitsets.
+
+Cuando sólo interesa saber si un paquete puede llegar de i a j, y no cuánto
+cuesta, alcanza con la versión booleana de Floyd-Warshall:
+    si i alcanza a k, entonces i alcanza todo lo que alcanza k
+
+Cada fila se guarda como un entero de Python usado como bitset (bit j = "i
+alcanza a j"), así que `fila_i |= fila_k` procesa n columnas en una sola
+operación sobre palabras de 64 bits, en lugar de n comparaciones de floats.
+"""
+from typing import Iterator, List, Union
+
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+
+
+def _bits(fila: int) -> Iterator[int]:
+    """Índices de los bits encendidos de `fila`, de menor a mayor."""
+    while fila:
+        menor = fila & -fila
+        yield menor.bit_length() - 1
+        fila ^= menor
+
+
+def clausura_transitiva(grafo: Union[GrafoDisperso, List[List[float]]]) -> List[int]:
+    """
+    Calcula la clausura transitiva y reflexiva del grafo.
+
+    Args:
+        grafo: Matriz de adyacencia (inf = sin arista) o GrafoDisperso
+
+    Returns:
+        Lista de n enteros: el bit j de filas[i] vale 1 si hay camino de i a j
+        (todo nodo se alcanza a sí mismo)
+
+    Complejidad: O(n³ / w) con w el tamaño de palabra (64)
+    Espacio: O(n² / 8) bytes
+    """
+    n = len(grafo)
+    filas = [1 << i for i in range(n)]
+
+    if isinstance(grafo, GrafoDisperso):
+        for origen, destino, _ in grafo.aristas():
+            filas[origen] |= 1 << destino
+    else:
+        for i, fila in enumerate(grafo):
+            for j, peso in enumerate(fila):
+                if peso != float('inf'):
+                    filas[i] |= 1 << j
+
+    for k in range(n):
+        bit_k = 1 << k
+        fila_k = filas[k]
+        for i in range(n):
+            if filas[i] & bit_k:
+                filas[i] |= fila_k
+
+    return filas
+
+
+class Alcanzabilidad:
+    """
+    Consultas de alcanzabilidad sobre la clausura transitiva de un grafo.
+    """
+
+    def __init__(self, grafo: Union[GrafoDisperso, List[List[float]]]):
+        self.n = len(grafo)
+        self.filas = clausura_transitiva(grafo)
+
+    def alcanzable(self, i: int, j: int) -> bool:
+        """True si existe un camino de i a j. Complejidad: O(1)"""
+        return bool((self.filas[i] >> j) & 1)
+
+    def alcanzables_desde(self, i: int) -> List[int]:
+        """Nodos alcanzables desde i (incluido i)."""
+        return list(_bits(self.filas[i]))
+
+    def componentes_fuertemente_conexas(self) -> List[List[int]]:
+        """
+        Componentes fuertemente conexas: i y j están en la misma si cada uno
+        alcanza al otro. Se listan en orden de su nodo de menor índice.
+
+        Complejidad: O(n²) en el peor caso
+        """
+        asignado = 0
+        componentes = []
+        for i in range(self.n):
+            if (asignado >> i) & 1:
+                continue
+            componente = [j for j in _bits(self.filas[i]) if (self.filas[j] >> i) & 1]
+            for j in componente:
+                asignado |= 1 << j
+            componentes.append(componente)
+        return componentes
@@ -0,0 +1,216 @@
+"""
+Consultas de rutas punto a punto sin calcular todos los pares.
+
+La mayoría de las consultas reales piden una sola ruta origen -> destino.
+`ConsultorRutas` las responde con Dijkstra bidireccional (se detiene apenas
+los dos frentes de búsqueda garantizan el óptimo) y guarda en un caché LRU
+los árboles de caminos mínimos de los orígenes más consultados, de modo que
+las consultas repetidas desde un mismo centro (por ejemplo "BA") se resuelven
+recorriendo el árbol, sin volver a buscar.
+"""
+import heapq
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+
+INF = float('inf')
+
+Nodo = Union[int, str]
+
+
+def dijkstra(grafo: GrafoDisperso, origen: int) -> Tuple[List[float], List[Optional[int]]]:
+    """
+    Dijkstra desde `origen` con heap binario.
+
+    Returns:
+        Tupla (dist, predecesor) para todos los nodos
+
+    Complejidad: O((n + m) log n)
+    """
+    dist = [INF] * grafo.n
+    predecesor: List[Optional[int]] = [None] * grafo.n
+    dist[origen] = 0
+    heap = [(0, origen)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, peso in grafo.adyacentes[u]:
+            nueva = d + peso
+            if nueva < dist[v]:
+                dist[v] = nueva
+                predecesor[v] = u
+                heapq.heappush(heap, (nueva, v))
+    return dist, predecesor
+
+
+def dijkstra_bidireccional(grafo: GrafoDisperso, inverso: GrafoDisperso,
+                           origen: int, destino: int) -> Tuple[float, List[int]]:
+    """
+    Dijkstra bidireccional: un frente avanza desde el origen sobre `grafo` y
+    otro desde el destino sobre `inverso`. Se detiene cuando la suma de los
+    mínimos de ambos heaps ya no puede mejorar la mejor ruta encontrada.
+
+    Returns:
+        Tupla (distancia, camino). (inf, []) si no hay camino.
+    """
+    if origen == destino:
+        return 0, [origen]
+
+    dist = ({origen: 0}, {destino: 0})
+    padre: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+    cerrado = (set(), set())
+    heaps = ([(0, origen)], [(0, destino)])
+    adyacencias = (grafo.adyacentes, inverso.adyacentes)
+
+    mejor = INF
+    encuentro = None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= mejor:
+            break
+        # Avanzar el frente con el heap más chico
+        lado = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        d, u = heapq.heappop(heaps[lado])
+        if u in cerrado[lado]:
+            continue
+        cerrado[lado].add(u)
+
+        dist_lado, dist_otro = dist[lado], dist[1 - lado]
+        for v, peso in adyacencias[lado][u]:
+            nueva = d + peso
+            if nueva < dist_lado.get(v, INF):
+                dist_lado[v] = nueva
+                padre[lado][v] = u
+                heapq.heappush(heaps[lado], (nueva, v))
+            if v in dist_otro and nueva + dist_otro[v] < mejor:
+                mejor = nueva + dist_otro[v]
+                encuentro = v
+
+    if encuentro is None:
+        return INF, []
+
+    # origen ... encuentro con los padres hacia adelante
+    camino = [encuentro]
+    while camino[-1] != origen:
+        camino.append(padre[0][camino[-1]])
+    camino.reverse()
+    # encuentro ... destino con los padres del frente inverso
+    while camino[-1] != destino:
+        camino.append(padre[1][camino[-1]])
+    return mejor, camino
+
+
+class ConsultorRutas:
+    """
+    Responde consultas origen -> destino sobre un grafo con pesos no negativos.
+
+    Args:
+        grafo: GrafoDisperso o matriz de adyacencia
+        nombres_nodos: Nombres opcionales; si se dan, las consultas y los caminos
+                       usan nombres en lugar de índices
+        capacidad_cache: Cantidad máxima de árboles de un solo origen en memoria
+        umbral_arbol: A partir de cuántas consultas desde un mismo origen conviene
+                      calcular y guardar su árbol completo (1 = siempre)
+
+    Los contadores `aciertos` y `fallos` registran cuántas consultas se
+    respondieron desde el caché y cuántas necesitaron una búsqueda.
+    """
+
+    def __init__(self, grafo: Union[GrafoDisperso, List[List[float]]],
+                 nombres_nodos: List[str] = None, capacidad_cache: int = 128,
+                 umbral_arbol: int = 2):
+        if not isinstance(grafo, GrafoDisperso):
+            grafo = GrafoDisperso.desde_matriz(grafo)
+        if any(peso < 0 for _, _, peso in grafo.aristas()):
+            raise ValueError("Dijkstra requiere pesos no negativos")
+        if capacidad_cache < 1:
+            raise ValueError("La capacidad del caché debe ser positiva")
+
+        self.grafo = grafo
+        self.inverso = grafo.invertido()
+        self.nombres_nodos = nombres_nodos
+        self._indices = {nombre: i for i, nombre in enumerate(nombres_nodos)} if nombres_nodos else None
+        self.capacidad_cache = capacidad_cache
+        self.umbral_arbol = umbral_arbol
+
+        self._arboles: "OrderedDict[int, Tuple[List[float], List[Optional[int]]]]" = OrderedDict()
+        self._consultas_por_origen: Dict[int, int] = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _indice(self, nodo: Nodo) -> int:
+        if self._indices is not None and not isinstance(nodo, int):
+            return self._indices[nodo]
+        return nodo
+
+    def _nombrar(self, camino: List[int]) -> List[Nodo]:
+        if self.nombres_nodos is None:
+            return camino
+        return [self.nombres_nodos[nodo] for nodo in camino]
+
+    def arbol(self, origen: Nodo) -> Tuple[List[float], List[Optional[int]]]:
+        """
+        Árbol de caminos mínimos desde `origen` como (dist, predecesor),
+        tomado del caché o calculado y guardado en él.
+        """
+        o = self._indice(origen)
+        if o in self._arboles:
+            self._arboles.move_to_end(o)
+            return self._arboles[o]
+        arbol = dijkstra(self.grafo, o)
+        self._arboles[o] = arbol
+        if len(self._arboles) > self.capacidad_cache:
+            self._arboles.popitem(last=False)
+        return arbol
+
+    def ruta(self, origen: Nodo, destino: Nodo) -> Tuple[float, List[Nodo]]:
+        """
+        Ruta más corta de origen a destino.
+
+        Returns:
+            Tupla (distancia, camino). (inf, []) si no hay camino.
+
+        Complejidad:
+            - Acierto de caché: O(largo del camino)
+            - Fallo: Dijkstra bidireccional, o un Dijkstra completo
+              O((n + m) log n) si el origen ya superó `umbral_arbol`
+        """
+        o, d = self._indice(origen), self._indice(destino)
+
+        if o in self._arboles:
+            self.aciertos += 1
+            self._arboles.move_to_end(o)
+            dist, predecesor = self._arboles[o]
+            return dist[d], self._nombrar(self._camino_en_arbol(predecesor, o, d, dist[d]))
+
+        self.fallos += 1
+        consultas = self._consultas_por_origen.get(o, 0) + 1
+        self._consultas_por_origen[o] = consultas
+        if consultas >= self.umbral_arbol:
+            dist, predecesor = self.arbol(o)
+            return dist[d], self._nombrar(self._camino_en_arbol(predecesor, o, d, dist[d]))
+
+        distancia, camino = dijkstra_bidireccional(self.grafo, self.inverso, o, d)
+        return distancia, self._nombrar(camino)
+
+    @staticmethod
+    def _camino_en_arbol(predecesor: List[Optional[int]], origen: int, destino: int,
+                         distancia: float) -> List[int]:
+        if distancia == INF:
+            return []
+        camino = [destino]
+        while camino[-1] != origen:
+            camino.append(predecesor[camino[-1]])
+        camino.reverse()
+        return camino
+
+    def estadisticas(self) -> dict:
+        """Contadores del caché."""
+        total = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / total if total else 0.0,
+            'arboles_en_cache': len(self._arboles),
+        }
@@ -7,33 +7,73 @@ Los paquetes pueden pasar por múltiples centros antes de llegar a su destino.
 Cada ruta entre centros tiene un costo (tiempo, distancia o dinero).
 Floyd-Warshall nos ayuda a encontrar la ruta más económica entre cualquier par de centros.
 """
-from typing import List, Tuple, Optional
+from array import array
+from collections.abc import Mapping
+from typing import Iterator, List, Optional, TextIO, Tuple
+import json
 import math
+import sys
 
 
-def floyd_warshall(grafo: List[List[float]]) -> Tuple[List[List[float]], List[List[Optional[int]]]]:
+def floyd_warshall(grafo: List[List[float]], motor: str = "python", compacto: bool = False,
+                   tipo_distancia: Optional[str] = None,
+                   **opciones) -> Tuple[List[List[float]], List[List[Optional[int]]]]:
     """
     Algoritmo Floyd-Warshall para caminos más cortos entre todos los pares.
     
     Args:
         grafo: Matriz de adyacencia n×n donde grafo[i][j] es el peso de i->j
                Usar float('inf') para indicar que no hay arista
+        motor: Implementación a usar:
+               - "python": triple ciclo sobre listas (por defecto)
+               - "numpy": cada paso k vectorizado con NumPy (acepta `dtype`)
+               - "bloques": versión por bloques para matrices grandes
+                 (acepta `tamano_bloque` y `dtype`)
+               - "paralelo": versión por bloques repartida entre procesos
+                 (acepta `workers`, `tamano_bloque`, `dtype` y `umbral_paralelo`)
+        compacto: Si es True, devuelve matrices compactas en lugar de listas de
+                  listas: MatrizDistancias/MatrizSiguientes con el motor "python"
+                  o los arreglos NumPy con los demás motores. En ambos casos
+                  next_node usa -1 en lugar de None
+        tipo_distancia: Con motor "python" y compacto=True, 'd' (float64, por
+                        defecto) o 'f' (float32). Los demás motores usan `dtype`
+        **opciones: Parámetros extra del motor elegido
     
     Returns:
         Tupla con:
         - dist: Matriz de distancias mínimas
         - next: Matriz para reconstruir caminos (next[i][j] = próximo nodo en el camino i->j)
     
+    Raises:
+        ValueError: si se pasa tipo_distancia sin motor "python" y compacto=True
+    
     Complejidad: O(n³)
     Espacio: O(n²)
     """
-    n = len(grafo)
+    if tipo_distancia is not None and (motor != "python" or not compacto):
+        raise ValueError('tipo_distancia sólo aplica al motor "python" con compacto=True '
+                         '(los motores NumPy usan dtype)')
+    if motor != "python":
+        dist, next_node = _motor_numpy(motor)(grafo, **opciones)
+        if compacto:
+            return dist, next_node
+        from tp_algos.algorithms.graphs.matrices_compactas import expandir
+        return expandir(dist, next_node)
     
-    # Inicializar matriz de distancias (copia del grafo)
-    dist = [fila[:] for fila in grafo]
+    n = len(grafo)
     
-    # Inicializar matriz de siguiente nodo para reconstrucción de caminos
-    next_node = [[None] * n for _ in range(n)]
+    if compacto:
+        from tp_algos.algorithms.graphs.matrices_compactas import (
+            MatrizDistancias, MatrizSiguientes
+        )
+        dist = MatrizDistancias.desde_listas(grafo, tipo_distancia or 'd')
+        next_node = MatrizSiguientes(n)
+    else:
+        # Inicializar matriz de distancias (copia del grafo)
+        dist = [fila[:] for fila in grafo]
+        
+        # Inicializar matriz de siguiente nodo para reconstrucción de caminos
+        next_node = [[None] * n for _ in range(n)]
     
     # Si hay una arista directa de i a j, el siguiente nodo es j
     for i in range(n):
@@ -44,23 +84,43 @@ def floyd_warshall(grafo: List[List[float]]) -> Tuple[List[List[float]], List[Li
     # Algoritmo Floyd-Warshall
     # Para cada nodo intermedio k
     for k in range(n):
+        # Las filas se toman fuera del ciclo sobre j: con matrices compactas
+        # cada dist[i] arma una vista nueva
+        fila_k = dist[k]
         # Para cada par de nodos (i, j)
         for i in range(n):
+            fila_i = dist[i]
+            siguientes_i = next_node[i]
             for j in range(n):
                 # Si el camino i->k->j es mejor que el actual i->j
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
-                    next_node[i][j] = next_node[i][k]
+                if fila_i[k] + fila_k[j] < fila_i[j]:
+                    fila_i[j] = fila_i[k] + fila_k[j]
+                    siguientes_i[j] = siguientes_i[k]
     
     return dist, next_node
 
 
+def _motor_numpy(motor: str):
+    """Importa (sólo cuando se usa) la implementación NumPy del motor pedido."""
+    if motor == "numpy":
+        from tp_algos.algorithms.graphs.floyd_warshall_vectorizado import floyd_warshall_numpy
+        return floyd_warshall_numpy
+    if motor == "bloques":
+        from tp_algos.algorithms.graphs.floyd_warshall_bloques import floyd_warshall_bloques
+        return floyd_warshall_bloques
+    if motor == "paralelo":
+        from tp_algos.algorithms.graphs.floyd_warshall_paralelo import floyd_warshall_paralelo
+        return floyd_warshall_paralelo
+    raise ValueError(f"Motor desconocido: {motor}")
+
+
 def reconstruir_camino(next_node: List[List[Optional[int]]], origen: int, destino: int) -> List[int]:
     """
     Reconstruye el camino más corto de origen a destino.
     
     Args:
-        next_node: Matriz generada por floyd_warshall
+        next_node: Matriz generada por floyd_warshall. También acepta arreglos
+                   (NumPy, np.memmap) que usan -1 en lugar de None
         origen: Nodo inicial
         destino: Nodo final
     
@@ -68,87 +128,202 @@ def reconstruir_camino(next_node: List[List[Optional[int]]], origen: int, destin
         Lista de nodos en el camino (incluyendo origen y destino)
         Lista vacía si no hay camino
     """
-    if next_node[origen][destino] is None:
+    siguiente = next_node[origen][destino]
+    if siguiente is None or siguiente < 0:
         return []
     
     camino = [origen]
     actual = origen
     
     while actual != destino:
-        actual = next_node[actual][destino]
+        actual = int(next_node[actual][destino])
         camino.append(actual)
     
     return camino
 
 
-def floyd_warshall_detallado(grafo: List[List[float]], nombres_nodos: List[str] = None) -> dict:
+def floyd_warshall_traza(grafo: List[List[float]], nombres_nodos: List[str] = None,
+                         instantaneas_cada: int = 0, compacto: bool = False) -> Iterator[dict]:
     """
-    Versión detallada que muestra el proceso paso a paso.
+    Versión generadora de floyd_warshall_detallado: produce los eventos del
+    algoritmo a medida que ocurren, sin acumularlos.
+    
+    Eventos (diccionarios con la clave 'tipo'):
+        - 'inicio': matriz inicial (sólo si instantaneas_cada > 0)
+        - 'cambio': una mejora, con 'k', 'de', 'a', 'via', 'dist_anterior', 'dist_nueva'
+        - 'paso': fin del paso k, con 'n_cambios' y, si corresponde muestrear
+                  ese paso, una copia de la matriz en 'matriz'
+        - 'fin': 'matriz_distancias' y 'next_node' finales
     
     Args:
         grafo: Matriz de adyacencia
         nombres_nodos: Nombres opcionales para los nodos
+        instantaneas_cada: Copiar la matriz cada tantos pasos (0 = nunca).
+                           El último paso siempre se incluye si es > 0
+        compacto: Usar MatrizDistancias/MatrizSiguientes en lugar de listas
     
-    Returns:
-        Diccionario con información completa del algoritmo
+    Memoria: O(n²) para la matriz de trabajo, más O(n²) por instantánea
+    muestreada. Los cambios no se guardan.
     """
     n = len(grafo)
     
     if nombres_nodos is None:
         nombres_nodos = [f"Nodo_{i}" for i in range(n)]
     
-    dist = [fila[:] for fila in grafo]
-    next_node = [[None] * n for _ in range(n)]
+    if compacto:
+        from tp_algos.algorithms.graphs.matrices_compactas import (
+            MatrizDistancias, MatrizSiguientes
+        )
+        dist = MatrizDistancias.desde_listas(grafo)
+        next_node = MatrizSiguientes(n)
+    else:
+        dist = [fila[:] for fila in grafo]
+        next_node = [[None] * n for _ in range(n)]
     
     for i in range(n):
         for j in range(n):
             if i != j and dist[i][j] != float('inf'):
                 next_node[i][j] = j
     
-    # Guardar pasos intermedios
-    pasos = []
-    pasos.append({
-        'k': -1,
-        'descripcion': 'Matriz inicial',
-        'matriz': [fila[:] for fila in dist]
-    })
+    if instantaneas_cada > 0:
+        yield {
+            'tipo': 'inicio',
+            'k': -1,
+            'descripcion': 'Matriz inicial',
+            'matriz': [list(fila) for fila in dist]
+        }
     
     # Algoritmo con seguimiento de pasos
     for k in range(n):
-        cambios = []
+        n_cambios = 0
         for i in range(n):
             for j in range(n):
                 nueva_dist = dist[i][k] + dist[k][j]
                 if nueva_dist < dist[i][j]:
-                    cambios.append({
+                    yield {
+                        'tipo': 'cambio',
+                        'k': k,
                         'de': nombres_nodos[i],
                         'a': nombres_nodos[j],
                         'via': nombres_nodos[k],
                         'dist_anterior': dist[i][j] if dist[i][j] != float('inf') else '∞',
                         'dist_nueva': nueva_dist
-                    })
+                    }
+                    n_cambios += 1
                     dist[i][j] = nueva_dist
                     next_node[i][j] = next_node[i][k]
         
-        pasos.append({
+        paso = {
+            'tipo': 'paso',
             'k': k,
             'nodo_intermedio': nombres_nodos[k],
             'descripcion': f'Considerando {nombres_nodos[k]} como nodo intermedio',
-            'matriz': [fila[:] for fila in dist],
-            'cambios': cambios
-        })
+            'n_cambios': n_cambios
+        }
+        if instantaneas_cada > 0 and ((k + 1) % instantaneas_cada == 0 or k == n - 1):
+            paso['matriz'] = [list(fila) for fila in dist]
+        yield paso
+    
+    yield {
+        'tipo': 'fin',
+        'matriz_distancias': dist,
+        'next_node': next_node
+    }
+
+
+class CaminosPerezosos(Mapping):
+    """
+    Diccionario de solo lectura "A_a_B" -> {'camino', 'distancia'} que arma
+    cada camino recién cuando se consulta, en lugar de construir los n² caminos.
+    """
+    
+    def __init__(self, dist, next_node, nombres_nodos: List[str]):
+        self._dist = dist
+        self._next_node = next_node
+        self._nombres = nombres_nodos
+        self._indices = {nombre: i for i, nombre in enumerate(nombres_nodos)}
+    
+    def _par(self, clave: str) -> Tuple[int, int]:
+        # Un nombre podría contener "_a_", así que se prueban todas las divisiones
+        inicio = clave.find("_a_")
+        while inicio != -1:
+            i = self._indices.get(clave[:inicio])
+            j = self._indices.get(clave[inicio + 3:])
+            if i is not None and j is not None and i != j and self._dist[i][j] != float('inf'):
+                return i, j
+            inicio = clave.find("_a_", inicio + 1)
+        raise KeyError(clave)
+    
+    def __getitem__(self, clave: str) -> dict:
+        i, j = self._par(clave)
+        camino = reconstruir_camino(self._next_node, i, j)
+        return {
+            'camino': [self._nombres[nodo] for nodo in camino],
+            'distancia': self._dist[i][j]
+        }
+    
+    def __iter__(self):
+        n = len(self._nombres)
+        for i in range(n):
+            for j in range(n):
+                if i != j and self._dist[i][j] != float('inf'):
+                    yield f"{self._nombres[i]}_a_{self._nombres[j]}"
+    
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+def floyd_warshall_detallado(grafo: List[List[float]], nombres_nodos: List[str] = None,
+                             compacto: bool = False, instantaneas_cada: int = 1,
+                             caminos_perezosos: bool = False) -> dict:
+    """
+    Versión detallada que muestra el proceso paso a paso.
+    
+    Args:
+        grafo: Matriz de adyacencia
+        nombres_nodos: Nombres opcionales para los nodos
+        compacto: Si es True, 'matriz_distancias' y 'next_node' son
+                  MatrizDistancias/MatrizSiguientes en lugar de listas
+        instantaneas_cada: Guardar la matriz en 'pasos' cada tantos pasos
+                           (1 = todos, 0 = ninguno)
+        caminos_perezosos: Si es True, 'todos_caminos' arma cada camino al
+                           consultarlo (CaminosPerezosos) en lugar de generarlos todos
+    
+    Returns:
+        Diccionario con información completa del algoritmo
+    
+    Para grafos grandes conviene recorrer floyd_warshall_traza directamente:
+    este diccionario acumula todos los cambios.
+    """
+    n = len(grafo)
+    
+    if nombres_nodos is None:
+        nombres_nodos = [f"Nodo_{i}" for i in range(n)]
+    
+    # Guardar pasos intermedios
+    pasos = []
+    cambios = []
+    for evento in floyd_warshall_traza(grafo, nombres_nodos, instantaneas_cada, compacto):
+        tipo = evento.pop('tipo')
+        if tipo == 'cambio':
+            evento.pop('k')
+            cambios.append(evento)
+        elif tipo == 'paso':
+            evento.pop('n_cambios')
+            evento['cambios'] = cambios
+            cambios = []
+            pasos.append(evento)
+        elif tipo == 'inicio':
+            pasos.append(evento)
+        else:
+            dist = evento['matriz_distancias']
+            next_node = evento['next_node']
     
     # Generar todos los caminos
-    todos_caminos = {}
-    for i in range(n):
-        for j in range(n):
-            if i != j and dist[i][j] != float('inf'):
-                camino = reconstruir_camino(next_node, i, j)
-                camino_nombres = [nombres_nodos[nodo] for nodo in camino]
-                todos_caminos[f"{nombres_nodos[i]}_a_{nombres_nodos[j]}"] = {
-                    'camino': camino_nombres,
-                    'distancia': dist[i][j]
-                }
+    if caminos_perezosos:
+        todos_caminos = CaminosPerezosos(dist, next_node, nombres_nodos)
+    else:
+        todos_caminos = dict(CaminosPerezosos(dist, next_node, nombres_nodos).items())
     
     return {
         'matriz_distancias': dist,
@@ -159,6 +334,247 @@ def floyd_warshall_detallado(grafo: List[List[float]], nombres_nodos: List[str]
     }
 
 
+def escribir_traza(grafo: List[List[float]], destino: TextIO = None,
+                   nombres_nodos: List[str] = None, instantaneas_cada: int = 0) -> int:
+    """
+    Escribe la traza de Floyd-Warshall como JSON, un evento por línea, a medida
+    que se genera (memoria acotada). El evento final sólo indica el fin, sin
+    las matrices.
+    
+    Args:
+        grafo: Matriz de adyacencia
+        destino: Archivo de texto abierto (por defecto, la salida estándar)
+        nombres_nodos: Nombres opcionales para los nodos
+        instantaneas_cada: Incluir la matriz cada tantos pasos (0 = nunca)
+    
+    Returns:
+        Cantidad de eventos escritos
+    """
+    if destino is None:
+        destino = sys.stdout
+    escritos = 0
+    for evento in floyd_warshall_traza(grafo, nombres_nodos, instantaneas_cada):
+        if evento['tipo'] == 'fin':
+            evento = {'tipo': 'fin'}
+        destino.write(json.dumps(evento, ensure_ascii=False) + "\n")
+        escritos += 1
+    return escritos
+
+
+def actualizar_arista(dist, next_node, u: int, v: int, w: float) -> int:
+    """
+    Actualiza un resultado de Floyd-Warshall cuando la arista u->v pasa a
+    costar w (o se agrega), siempre que w no supere el costo actual de u a v.
+    
+    Sólo pueden mejorar los caminos que usan la nueva arista, es decir
+    i -> ... -> u -> v -> ... -> j, así que basta con revisar cada par una vez:
+        dist[i][j] = min(dist[i][j], dist[i][u] + w + dist[v][j])
+    
+    Modifica `dist` y `next_node` en el lugar (listas de listas o arreglos
+    NumPy). La matriz de adyacencia del llamador no se toca.
+    
+    Args:
+        dist, next_node: Resultado de floyd_warshall
+        u, v: Extremos de la arista
+        w: Nuevo peso de la arista
+    
+    Returns:
+        Cantidad de pares cuya distancia mejoró
+    
+    Raises:
+        ValueError: si la arista cierra un ciclo de peso negativo
+    
+    Complejidad: O(n²)
+    """
+    if w + dist[v][u] < 0:
+        raise ValueError("La arista genera un ciclo de peso negativo")
+    if u == v or w >= dist[u][v]:
+        # Cualquier camino que use la arista se puede reemplazar por el camino u->v actual
+        return 0
+    
+    if hasattr(dist, 'shape'):
+        return _actualizar_arista_numpy(dist, next_node, u, v, w)
+    
+    n = len(dist)
+    # La fila v y la columna u no cambian: mejorarlas requeriría un ciclo negativo
+    fila_v = dist[v]
+    cambios = 0
+    for i in range(n):
+        base = dist[i][u] + w
+        if base == float('inf'):
+            continue
+        primero = v if i == u else next_node[i][u]
+        fila_dist = dist[i]
+        fila_next = next_node[i]
+        for j in range(n):
+            nueva = base + fila_v[j]
+            if nueva < fila_dist[j]:
+                fila_dist[j] = nueva
+                fila_next[j] = primero
+                cambios += 1
+    return cambios
+
+
+def _actualizar_arista_numpy(dist, next_node, u: int, v: int, w: float) -> int:
+    """Versión de actualizar_arista para los arreglos de los motores NumPy."""
+    candidato = dist[:, u, None] + w + dist[None, v, :]
+    mejora = candidato < dist
+    primero = next_node[:, u].copy()
+    primero[u] = v
+    dist[mejora] = candidato[mejora]
+    next_node[mejora] = primero[mejora.nonzero()[0]]
+    return int(mejora.sum())
+
+
+def actualizar_aristas(dist, next_node, aristas: List[Tuple[int, int, float]]) -> int:
+    """
+    Aplica actualizar_arista a un lote de aristas (u, v, w) que bajan de costo
+    o se agregan.
+    
+    Returns:
+        Cantidad total de mejoras aplicadas
+    
+    Complejidad: O(k · n²) para k aristas
+    """
+    return sum(actualizar_arista(dist, next_node, u, v, w) for u, v, w in aristas)
+
+
+def aumentar_arista(grafo: List[List[float]], dist: List[List[float]],
+                    next_node: List[List[Optional[int]]], u: int, v: int,
+                    w: float = float('inf')) -> List[int]:
+    """
+    Actualiza el resultado cuando la arista u->v sube de costo o se elimina
+    (w = inf).
+    
+    Como `actualizar_arista`, modifica `dist` y `next_node` en el lugar pero no
+    la matriz de adyacencia: `grafo` describe el grafo con el peso anterior y el
+    llamador actualiza `grafo[u][v]` si la conserva. Acepta listas de listas,
+    los arreglos NumPy de los demás motores o MatrizDistancias/MatrizSiguientes
+    (estos dos con -1 en next_node).
+    
+    Sólo se recalculan las filas de los orígenes i cuyo camino guardado hacia
+    algún j pasa por u->v (se siguen los punteros de next_node, sin comparar
+    sumas de distancias, que con pesos reales dependen del orden de la suma);
+    el resto del resultado sigue siendo válido porque sus caminos no cambian
+    de costo. Cada fila se recalcula con un Dijkstra denso O(n²). Si el grafo
+    tiene pesos negativos se recurre a un floyd_warshall completo.
+    
+    Si w es menor que el peso anterior delega en actualizar_arista.
+    
+    Returns:
+        Lista de filas (orígenes) recalculadas
+    
+    Complejidad: O(n²) para detectar filas afectadas + O(n²) por fila afectada
+    """
+    anterior = grafo[u][v]
+    if u == v or w == anterior:
+        return []
+    if w < anterior:
+        actualizar_arista(dist, next_node, u, v, w)
+        return []
+    
+    n = len(dist)
+    afectadas = _filas_que_usan_arista(next_node, u, v)
+    if not afectadas:
+        return []
+    
+    from tp_algos.algorithms.graphs.matrices_compactas import SIN_SIGUIENTE, _MatrizPlana
+    
+    # Copia en listas con el peso nuevo (los arreglos NumPy se convierten)
+    grafo_nuevo = grafo.tolist() if hasattr(grafo, 'tolist') else [list(fila) for fila in grafo]
+    grafo_nuevo[u][v] = w
+    # Los arreglos NumPy y las matrices compactas usan -1 en lugar de None
+    sin_siguiente = SIN_SIGUIENTE if isinstance(next_node, _MatrizPlana) or hasattr(next_node, 'shape') else None
+    
+    if any(peso < 0 for fila in grafo_nuevo for peso in fila):
+        filas = list(range(n))
+        dist_nueva, next_nueva = floyd_warshall(grafo_nuevo)
+    else:
+        filas = afectadas
+        dist_nueva, next_nueva = {}, {}
+        for i in filas:
+            dist_nueva[i], next_nueva[i] = _fila_dijkstra_densa(grafo_nuevo, i)
+    for i in filas:
+        _escribir_fila(dist, i, dist_nueva[i])
+        _escribir_fila(next_node, i, [sin_siguiente if j is None else j for j in next_nueva[i]])
+    return filas
+
+
+def _escribir_fila(matriz, i: int, valores: list):
+    """matriz[i][:] = valores, también para las filas memoryview de las matrices compactas."""
+    from tp_algos.algorithms.graphs.matrices_compactas import _MatrizPlana
+    if isinstance(matriz, _MatrizPlana):
+        valores = array(matriz.datos.typecode, valores)
+    matriz[i][:] = valores
+
+
+def _filas_que_usan_arista(next_node, u: int, v: int) -> List[int]:
+    """
+    Orígenes i cuyo camino guardado hacia algún destino j pasa por u->v.
+
+    Para cada j con next_node[u][j] == v, los punteros next_node[.][j] forman
+    un árbol hacia j: un origen lo usa si su cadena de punteros llega a u. Cada
+    nodo se visita una vez por destino gracias al estado memorizado.
+
+    Complejidad: O(n) por destino, O(n²) en total
+    """
+    n = len(next_node)
+    fila_u = next_node[u]
+    afectadas = [False] * n
+    for j in range(n):
+        if j == u or fila_u[j] != v:
+            continue
+        # pasa[x]: None (sin visitar), True o False según si el camino de x a j usa u->v
+        pasa: List[Optional[bool]] = [None] * n
+        pasa[u] = True
+        pasa[j] = False
+        for i in range(n):
+            cadena = []
+            x = i
+            # Sin ciclos negativos la cadena llega a j en menos de n pasos
+            while pasa[x] is None and len(cadena) <= n:
+                cadena.append(x)
+                siguiente = next_node[x][j]
+                if siguiente is None or siguiente < 0:
+                    pasa[x] = False
+                    break
+                x = int(siguiente)
+            resultado = bool(pasa[x])
+            for y in cadena:
+                pasa[y] = resultado
+            afectadas[i] = afectadas[i] or resultado
+    return [i for i in range(n) if afectadas[i]]
+
+
+def _fila_dijkstra_densa(grafo: List[List[float]], origen: int) -> Tuple[List[float], List[Optional[int]]]:
+    """
+    Dijkstra sobre la matriz de adyacencia (sin heap, O(n²)).
+    Devuelve la fila `origen` de dist y de next_node.
+    """
+    n = len(grafo)
+    dist = [float('inf')] * n
+    primero: List[Optional[int]] = [None] * n
+    visitado = [False] * n
+    dist[origen] = 0
+    
+    for _ in range(n):
+        u = -1
+        for x in range(n):
+            if not visitado[x] and (u == -1 or dist[x] < dist[u]):
+                u = x
+        if u == -1 or dist[u] == float('inf'):
+            break
+        visitado[u] = True
+        fila = grafo[u]
+        for x in range(n):
+            nueva = dist[u] + fila[x]
+            if not visitado[x] and nueva < dist[x]:
+                dist[x] = nueva
+                primero[x] = x if u == origen else primero[u]
+    
+    return dist, primero
+
+
 def crear_grafo_vacio(n: int) -> List[List[float]]:
     """
     Crea una matriz de adyacencia vacía de tamaño n×n.
@@ -0,0 +1,132 @@
+"""
+Floyd-Warshall por bloques (tiled / cache-blocked).
+
+La matriz se divide en bloques de B×B. En cada ronda b (los nodos intermedios
+k del bloque b) se procesa:
+    1. El bloque diagonal (b, b)
+    2. Los bloques de la fila b y de la columna b (dependen sólo del diagonal)
+    3. El resto de los bloques (dependen sólo de la fila y columna b)
+
+Cada bloque se actualiza leyendo a lo sumo otros dos bloques, así que el
+trabajo se mantiene dentro de la caché. Además, los bloques de una misma fase
+son independientes entre sí, lo que permite procesarlos en paralelo.
+"""
+from typing import Iterator, Tuple
+
+import numpy as np
+
+from tp_algos.algorithms.graphs.floyd_warshall_vectorizado import preparar_matrices
+
+Bloque = Tuple[slice, slice]
+
+# Cantidad de nodos intermedios que se suman juntos en el producto min-plus
+TROZO_K = 8
+
+
+def rango_bloques(n: int, tamano_bloque: int) -> list:
+    """Devuelve los slices que parten [0, n) en bloques de `tamano_bloque`."""
+    return [slice(inicio, min(inicio + tamano_bloque, n)) for inicio in range(0, n, tamano_bloque)]
+
+
+def relajar_bloque(dist: np.ndarray, next_node: np.ndarray, filas: slice, columnas: slice, ks: slice):
+    """
+    Actualiza el bloque (filas, columnas) usando como intermedios los nodos de `ks`,
+    uno por uno y en orden. Necesario cuando el bloque comparte filas o
+    columnas con `ks` (fases 1 y 2), porque cada k usa los valores del k anterior.
+    """
+    bloque_dist = dist[filas, columnas]
+    bloque_next = next_node[filas, columnas]
+    for k in range(ks.start, ks.stop):
+        candidato = dist[filas, k][:, None] + dist[k, columnas][None, :]
+        mejora = candidato < bloque_dist
+        if mejora.any():
+            bloque_dist[mejora] = candidato[mejora]
+            filas_mejora = np.nonzero(mejora)[0]
+            bloque_next[mejora] = next_node[filas.start + filas_mejora, k]
+
+
+def relajar_bloque_min_plus(dist: np.ndarray, next_node: np.ndarray, filas: slice, columnas: slice, ks: slice):
+    """
+    Actualiza el bloque (filas, columnas) con el producto min-plus de los bloques
+    (filas, ks) y (ks, columnas). Válido en la fase 3, donde esos dos bloques ya
+    son definitivos para la ronda y no cambian mientras se recorre k.
+
+    Los k se reducen de a TROZO_K: la suma con broadcasting ocupa B×TROZO_K×B
+    en lugar de B×B×B (2 MB con B=64 en float64), así que el temporal también
+    entra en la caché junto con los bloques.
+
+    Se elige el primer k que alcanza el mínimo, igual que el ciclo secuencial
+    con comparación estricta.
+    """
+    bloque_dist = dist[filas, columnas]
+    bloque_next = next_node[filas, columnas]
+    for inicio in range(ks.start, ks.stop, TROZO_K):
+        trozo = slice(inicio, min(inicio + TROZO_K, ks.stop))
+        suma = dist[filas, trozo][:, :, None] + dist[trozo, columnas][None, :, :]
+        mejor_k = suma.argmin(axis=1)
+        candidato = np.take_along_axis(suma, mejor_k[:, None, :], axis=1)[:, 0, :]
+
+        # Comparación estricta: ante empates queda el k de un trozo anterior
+        mejora = candidato < bloque_dist
+        if mejora.any():
+            bloque_dist[mejora] = candidato[mejora]
+            siguientes = np.take_along_axis(next_node[filas, trozo], mejor_k, axis=1)
+            bloque_next[mejora] = siguientes[mejora]
+
+
+def bloques_fila_columna(bloques: list, b: int) -> Iterator[Bloque]:
+    """Bloques de la fase 2 de la ronda b: fila b y columna b sin el diagonal."""
+    pivote = bloques[b]
+    for otro, rango in enumerate(bloques):
+        if otro != b:
+            yield pivote, rango
+            yield rango, pivote
+
+
+def bloques_restantes(bloques: list, b: int) -> Iterator[Bloque]:
+    """Bloques de la fase 3 de la ronda b: todos los que no tocan la fila ni la columna b."""
+    for i, filas in enumerate(bloques):
+        if i == b:
+            continue
+        for j, columnas in enumerate(bloques):
+            if j != b:
+                yield filas, columnas
+
+
+def floyd_warshall_bloques(grafo, tamano_bloque: int = 64,
+                           dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Floyd-Warshall por bloques de tamaño `tamano_bloque`×`tamano_bloque`.
+
+    Args:
+        grafo: Matriz de adyacencia n×n
+        tamano_bloque: Lado B de cada bloque. Conviene que 3 bloques de B×B
+                       entren en la caché L2 (B=64 con float64 usa 32 KB por bloque)
+        dtype: Tipo de las distancias (np.float64 o np.float32)
+
+    Returns:
+        Tupla (dist, next_node) como arreglos NumPy, con el mismo formato que
+        `floyd_warshall_numpy` (-1 en next_node si no hay camino)
+
+    Complejidad: O(n³)
+    Espacio: O(n²) + O(B² · TROZO_K) temporal para el producto min-plus
+    """
+    if tamano_bloque < 1:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+
+    dist, next_node = preparar_matrices(grafo, dtype)
+    bloques = rango_bloques(dist.shape[0], tamano_bloque)
+
+    for b, pivote in enumerate(bloques):
+        # Fase 1: bloque diagonal
+        relajar_bloque(dist, next_node, pivote, pivote, pivote)
+
+        # Fase 2: fila y columna del pivote
+        for filas, columnas in bloques_fila_columna(bloques, b):
+            relajar_bloque(dist, next_node, filas, columnas, pivote)
+
+        # Fase 3: resto de la matriz
+        for filas, columnas in bloques_restantes(bloques, b):
+            relajar_bloque_min_plus(dist, next_node, filas, columnas, pivote)
+
+    return dist, next_node
@@ -0,0 +1,120 @@
+"""
+Floyd-Warshall paralelo sobre varios procesos.
+
+Usa el esquema por bloques de `floyd_warshall_bloques`: en cada ronda, los
+bloques de la fase 2 son independientes entre sí, y lo mismo los de la fase 3.
+Esos bloques se reparten entre los procesos de un `ProcessPoolExecutor`.
+
+Las matrices `dist` y `next_node` viven en `multiprocessing.shared_memory`:
+cada proceso se conecta una sola vez al iniciar y las tareas sólo envían las
+coordenadas de los bloques, nunca la matriz.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+from tp_algos.algorithms.graphs.floyd_warshall_bloques import (
+    bloques_fila_columna, bloques_restantes, floyd_warshall_bloques,
+    rango_bloques, relajar_bloque, relajar_bloque_min_plus
+)
+from tp_algos.algorithms.graphs.floyd_warshall_vectorizado import preparar_matrices
+from tp_algos.structures.memoria_compartida import conectar, segmentos_compartidos
+
+# Por debajo de este tamaño el costo de crear procesos supera la ganancia
+UMBRAL_PARALELO = 256
+
+# Estado de cada proceso trabajador (se completa en _inicializar_worker)
+_matrices = {}
+
+Rango = Tuple[int, int]
+
+
+def _inicializar_worker(nombre_dist: str, nombre_next: str, n: int, dtype_dist: str, dtype_next: str):
+    """Conecta el proceso trabajador a la memoria compartida."""
+    for clave, nombre, dtype in (('dist', nombre_dist, dtype_dist), ('next', nombre_next, dtype_next)):
+        memoria = conectar(nombre)
+        _matrices[clave + '_shm'] = memoria
+        _matrices[clave] = np.ndarray((n, n), dtype=dtype, buffer=memoria.buf)
+
+
+def _procesar_tareas(tareas: List[Tuple[Rango, Rango, Rango]], min_plus: bool):
+    """Procesa en el trabajador una lista de bloques (filas, columnas, ks)."""
+    relajar = relajar_bloque_min_plus if min_plus else relajar_bloque
+    dist, next_node = _matrices['dist'], _matrices['next']
+    for filas, columnas, ks in tareas:
+        relajar(dist, next_node, slice(*filas), slice(*columnas), slice(*ks))
+
+
+def _repartir(tareas: list, partes: int) -> List[list]:
+    """Reparte las tareas en `partes` listas de tamaño similar."""
+    return [tareas[i::partes] for i in range(partes) if tareas[i::partes]]
+
+
+def _como_rango(s: slice) -> Rango:
+    return s.start, s.stop
+
+
+def floyd_warshall_paralelo(grafo, workers: int = None, tamano_bloque: int = 64,
+                            dtype=np.float64,
+                            umbral_paralelo: int = UMBRAL_PARALELO) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Floyd-Warshall por bloques con las fases 2 y 3 repartidas entre procesos.
+
+    Args:
+        grafo: Matriz de adyacencia n×n
+        workers: Cantidad de procesos (por defecto, os.cpu_count())
+        tamano_bloque: Lado de cada bloque
+        dtype: Tipo de las distancias (np.float64 o np.float32)
+        umbral_paralelo: Si n es menor, se usa la versión serial por bloques
+
+    Returns:
+        Tupla (dist, next_node) como arreglos NumPy (-1 en next_node si no hay camino)
+
+    Complejidad: O(n³ / workers) de cómputo + O(n / B) sincronizaciones por fase
+    Espacio: O(n²) compartido entre todos los procesos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("La cantidad de workers debe ser positiva")
+
+    n = len(grafo)
+    if workers == 1 or n < umbral_paralelo:
+        return floyd_warshall_bloques(grafo, tamano_bloque, dtype)
+
+    dist_inicial, next_inicial = preparar_matrices(grafo, dtype)
+    with segmentos_compartidos((dist_inicial.nbytes, next_inicial.nbytes)) as memorias:
+        return _resolver_en_pool(memorias, dist_inicial, next_inicial, workers, tamano_bloque)
+
+
+def _resolver_en_pool(memorias: list, dist_inicial: np.ndarray, next_inicial: np.ndarray,
+                      workers: int, tamano_bloque: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Copia las matrices a memoria compartida y ejecuta las rondas con el pool."""
+    n = dist_inicial.shape[0]
+    dist = np.ndarray(dist_inicial.shape, dtype=dist_inicial.dtype, buffer=memorias[0].buf)
+    next_node = np.ndarray(next_inicial.shape, dtype=next_inicial.dtype, buffer=memorias[1].buf)
+    dist[:] = dist_inicial
+    next_node[:] = next_inicial
+
+    bloques = rango_bloques(n, tamano_bloque)
+    argumentos = (memorias[0].name, memorias[1].name, n, dist.dtype.str, next_node.dtype.str)
+
+    # Un único pool para todas las rondas y fases
+    with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker,
+                             initargs=argumentos) as pool:
+        for b, pivote in enumerate(bloques):
+            ks = _como_rango(pivote)
+
+            # Fase 1: un solo bloque, se resuelve en el proceso principal
+            relajar_bloque(dist, next_node, pivote, pivote, pivote)
+
+            # Fases 2 y 3: bloques independientes entre sí, repartidos en el pool.
+            # Consumir el resultado de map funciona como barrera entre fases.
+            for generador, min_plus in ((bloques_fila_columna, False), (bloques_restantes, True)):
+                tareas = [(_como_rango(f), _como_rango(c), ks) for f, c in generador(bloques, b)]
+                lotes = _repartir(tareas, workers)
+                list(pool.map(_procesar_tareas, lotes, [min_plus] * len(lotes)))
+
+    return dist.copy(), next_node.copy()
@@ -0,0 +1,155 @@
+"""
+Persistencia binaria de resultados de Floyd-Warshall.
+
+Formato del archivo (little-endian):
+
+    offset  tamaño  campo
+    0       4       firma b"TPFW"
+    4       2       versión del formato
+    6       2       reservado
+    8       8       n (cantidad de nodos)
+    16      4       dtype de dist (por ejemplo b"<f8 ")
+    20      4       dtype de next_node (por ejemplo b"<i2 ")
+    24      32      SHA-256 del grafo de origen (ceros si no se indicó)
+    56      8       relleno hasta 64
+    64      n²·a    dist, fila por fila
+    ...     n²·b    next_node, fila por fila (-1 = no hay camino)
+
+Al cargar, las dos matrices se abren con `np.memmap`: abrir el archivo es
+instantáneo sin importar n y varios procesos que lo abran comparten las
+mismas páginas del sistema operativo.
+"""
+import hashlib
+import struct
+from typing import Optional, Tuple
+
+import numpy as np
+
+from tp_algos.algorithms.graphs.matrices_compactas import SIN_SIGUIENTE
+
+FIRMA = b"TPFW"
+VERSION = 1
+TAMANO_ENCABEZADO = 64
+_ESTRUCTURA = struct.Struct("<4sHHQ4s4s32s")
+
+
+def hash_grafo(grafo) -> bytes:
+    """SHA-256 de la matriz de adyacencia (como float64), para validar el archivo."""
+    matriz = np.asarray(grafo, dtype=np.float64)
+    return hashlib.sha256(struct.pack("<Q", len(grafo)) + matriz.tobytes()).digest()
+
+
+def _dtype_siguientes(n: int) -> np.dtype:
+    """El entero más chico que puede guardar índices 0..n-1 y el -1."""
+    return np.dtype("<i2") if n <= np.iinfo(np.int16).max else np.dtype("<i4")
+
+
+def _codigo(dtype: np.dtype) -> bytes:
+    return dtype.str.encode("ascii").ljust(4)
+
+
+def guardar_resultado(ruta: str, dist, next_node, grafo=None, dtype_dist=np.float64):
+    """
+    Guarda `dist` y `next_node` en un archivo binario versionado.
+
+    Args:
+        ruta: Archivo de destino
+        dist: Matriz de distancias (listas o arreglo NumPy)
+        next_node: Matriz de siguientes (listas con None o arreglo con -1)
+        grafo: Matriz de adyacencia de origen; si se pasa, su hash queda en el
+               encabezado para validar la carga
+        dtype_dist: np.float64 o np.float32 para las distancias
+
+    Los siguientes se guardan como int16 si n ≤ 32767 y como int32 si no.
+    """
+    n = len(dist)
+    dtype_dist = np.dtype(dtype_dist).newbyteorder("<")
+    dtype_next = _dtype_siguientes(n)
+
+    dist = np.asarray(dist, dtype=dtype_dist).reshape(n, n)
+    if isinstance(next_node, np.ndarray):
+        siguientes = next_node.astype(dtype_next)
+    else:
+        siguientes = np.array(
+            [[SIN_SIGUIENTE if j is None else j for j in fila] for fila in next_node],
+            dtype=dtype_next
+        ).reshape(n, n)
+
+    huella = hash_grafo(grafo) if grafo is not None else bytes(32)
+    encabezado = _ESTRUCTURA.pack(FIRMA, VERSION, 0, n, _codigo(dtype_dist), _codigo(dtype_next), huella)
+
+    with open(ruta, "wb") as archivo:
+        archivo.write(encabezado.ljust(TAMANO_ENCABEZADO, b"\0"))
+        dist.tofile(archivo)
+        siguientes.tofile(archivo)
+
+
+def leer_encabezado(ruta: str) -> dict:
+    """
+    Lee y valida el encabezado del archivo.
+
+    Raises:
+        ValueError: si el archivo no tiene el formato o la versión esperados
+    """
+    with open(ruta, "rb") as archivo:
+        crudo = archivo.read(TAMANO_ENCABEZADO)
+    if len(crudo) < TAMANO_ENCABEZADO:
+        raise ValueError("Archivo demasiado corto para ser un resultado de Floyd-Warshall")
+
+    firma, version, _, n, codigo_dist, codigo_next, huella = _ESTRUCTURA.unpack_from(crudo)
+    if firma != FIRMA:
+        raise ValueError("El archivo no es un resultado de Floyd-Warshall")
+    if version != VERSION:
+        raise ValueError(f"Versión de formato no soportada: {version}")
+
+    return {
+        'version': version,
+        'n': n,
+        'dtype_dist': np.dtype(codigo_dist.strip().decode("ascii")),
+        'dtype_next': np.dtype(codigo_next.strip().decode("ascii")),
+        'hash_grafo': huella,
+    }
+
+
+def cargar_resultado(ruta: str, grafo=None, modo: str = "r") -> Tuple[np.memmap, np.memmap]:
+    """
+    Abre un resultado guardado con `guardar_resultado` sin leerlo a memoria.
+
+    Args:
+        ruta: Archivo a abrir
+        grafo: Si se pasa, se verifica que el archivo corresponda a este grafo
+        modo: Modo de np.memmap ("r" sólo lectura, "r+" para actualizar en el lugar)
+
+    Returns:
+        Tupla (dist, next_node) como np.memmap de n×n. `reconstruir_camino`
+        funciona directamente sobre `next_node`.
+
+    Raises:
+        ValueError: si el formato es inválido o el grafo no coincide
+    """
+    encabezado = leer_encabezado(ruta)
+    if grafo is not None and hash_grafo(grafo) != encabezado['hash_grafo']:
+        raise ValueError("El archivo no corresponde al grafo indicado")
+
+    n = encabezado['n']
+    forma = (n, n)
+    if n == 0:
+        return (np.zeros(forma, encabezado['dtype_dist']), np.zeros(forma, encabezado['dtype_next']))
+
+    dist = np.memmap(ruta, dtype=encabezado['dtype_dist'], mode=modo,
+                     offset=TAMANO_ENCABEZADO, shape=forma)
+    offset_next = TAMANO_ENCABEZADO + n * n * encabezado['dtype_dist'].itemsize
+    next_node = np.memmap(ruta, dtype=encabezado['dtype_next'], mode=modo,
+                          offset=offset_next, shape=forma)
+    return dist, next_node
+
+
+def resultado_vigente(ruta: str, grafo) -> Optional[Tuple[np.memmap, np.memmap]]:
+    """
+    Devuelve el resultado guardado si existe y corresponde a `grafo`, o None
+    si hay que recalcularlo (archivo ausente, inválido o de otro grafo).
+    """
+    try:
+        return cargar_resultado(ruta, grafo)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,72 @@
+"""
+Floyd-Warshall vectorizado con NumPy.
+
+Misma recurrencia que `floyd_warshall`, pero cada paso k se resuelve como una
+operación sobre la matriz completa (broadcasting) en lugar de un doble ciclo
+en Python. La complejidad sigue siendo O(n³), pero el trabajo interno se hace
+en código compilado sobre un arreglo contiguo.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from tp_algos.algorithms.graphs.matrices_compactas import SIN_SIGUIENTE
+
+
+def preparar_matrices(grafo, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convierte la matriz de adyacencia en los arreglos iniciales del algoritmo.
+
+    Returns:
+        Tupla con:
+        - dist: arreglo n×n contiguo con el dtype pedido
+        - next_node: arreglo n×n de enteros (SIN_SIGUIENTE si no hay arista)
+    """
+    n = len(grafo)
+    dist = np.array(grafo, dtype=dtype, order='C').reshape(n, n)
+
+    next_node = np.full((n, n), SIN_SIGUIENTE, dtype=np.int32)
+    hay_arista = np.isfinite(dist)
+    np.fill_diagonal(hay_arista, False)
+    columnas = np.broadcast_to(np.arange(n, dtype=np.int32), (n, n))
+    next_node[hay_arista] = columnas[hay_arista]
+    return dist, next_node
+
+
+def floyd_warshall_numpy(grafo, dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Floyd-Warshall donde cada paso k es una operación matricial.
+
+    Para cada k se calcula de una vez:
+        candidato = dist[:, k, None] + dist[None, k, :]
+    y se actualizan con una escritura enmascarada las posiciones que mejoran.
+
+    Args:
+        grafo: Matriz de adyacencia n×n (lista de listas o arreglo)
+        dtype: np.float64 (exacto para enteros < 2⁵³) o np.float32 (mitad de memoria)
+
+    Returns:
+        Tupla (dist, next_node) como arreglos NumPy. En `next_node` el valor
+        SIN_SIGUIENTE (-1) reemplaza a None.
+
+    Complejidad: O(n³) operaciones, O(n) llamadas a NumPy
+    Espacio: O(n²)
+    """
+    dist, next_node = preparar_matrices(grafo, dtype)
+    n = dist.shape[0]
+    candidato = np.empty_like(dist)
+    mejora = np.empty((n, n), dtype=bool)
+
+    for k in range(n):
+        # La fila y la columna k no cambian durante el paso k (sin ciclos negativos),
+        # así que se pueden leer sin copiar
+        np.add(dist[:, k, None], dist[None, k, :], out=candidato)
+        np.less(candidato, dist, out=mejora)
+        if not mejora.any():
+            continue
+        dist[mejora] = candidato[mejora]
+        # next[i][j] = next[i][k] para cada posición que mejoró
+        filas = np.nonzero(mejora)[0]
+        next_node[mejora] = next_node[filas, k]
+
+    return dist, next_node
@@ -0,0 +1,189 @@
+"""
+Algoritmo de Johnson para caminos más cortos entre todos los pares en grafos dispersos.
+
+1. Bellman-Ford desde un nodo virtual (conectado a todos con peso 0) calcula
+   potenciales h que permiten repesar las aristas: w'(u,v) = w(u,v) + h[u] - h[v] ≥ 0.
+   Si Bellman-Ford sigue relajando después de n pasadas, hay un ciclo negativo.
+2. Dijkstra con heap binario (heapq) desde cada nodo sobre los pesos w'.
+3. Se deshace el repesado: dist(s,v) = dist'(s,v) - h[s] + h[v].
+
+Con m aristas la complejidad es O(n·m + n·(n + m) log n), contra O(n³) de
+Floyd-Warshall: en una red de 10k nodos con ~5 aristas por nodo es la diferencia
+entre horas y minutos.
+"""
+import heapq
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Union
+
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+
+INF = float('inf')
+
+
+def _como_grafo_disperso(grafo: Union[GrafoDisperso, List[List[float]]]) -> GrafoDisperso:
+    if isinstance(grafo, GrafoDisperso):
+        return grafo
+    return GrafoDisperso.desde_matriz(grafo)
+
+
+def potenciales_bellman_ford(grafo: GrafoDisperso) -> List[float]:
+    """
+    Calcula los potenciales h de Johnson con Bellman-Ford desde un nodo virtual.
+
+    Raises:
+        ValueError: si el grafo tiene un ciclo de peso negativo
+
+    Complejidad: O(n·m)
+    """
+    # Tras relajar las aristas del nodo virtual, todos los nodos quedan en 0
+    h = [0] * grafo.n
+    aristas = list(grafo.aristas())
+
+    for _ in range(grafo.n + 1):
+        hubo_cambios = False
+        for origen, destino, peso in aristas:
+            if h[origen] + peso < h[destino]:
+                h[destino] = h[origen] + peso
+                hubo_cambios = True
+        if not hubo_cambios:
+            return h
+
+    # Sin ciclos negativos converge en a lo sumo n - 1 pasadas; si sigue cambiando, hay uno
+    raise ValueError("El grafo contiene un ciclo de peso negativo")
+
+
+def dijkstra_repesado(grafo: GrafoDisperso, h: List[float],
+                      origen: int) -> Tuple[List[float], List[Optional[int]], List[Optional[int]]]:
+    """
+    Dijkstra desde `origen` usando los pesos repesados w + h[u] - h[v].
+
+    Returns:
+        Tupla con:
+        - dist: distancias reales (ya sin repesar) desde el origen
+        - siguiente: primer nodo del camino origen->v (fila de `next_node`)
+        - predecesor: nodo anterior a v en el árbol de caminos mínimos
+    """
+    n = grafo.n
+    dist_rep = [INF] * n
+    siguiente: List[Optional[int]] = [None] * n
+    predecesor: List[Optional[int]] = [None] * n
+    visitado = [False] * n
+
+    dist_rep[origen] = 0
+    heap = [(0, origen)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if visitado[u]:
+            continue
+        visitado[u] = True
+        h_u = h[u]
+        for v, peso in grafo.adyacentes[u]:
+            nueva = d + peso + h_u - h[v]
+            if nueva < dist_rep[v]:
+                dist_rep[v] = nueva
+                predecesor[v] = u
+                siguiente[v] = v if u == origen else siguiente[u]
+                heapq.heappush(heap, (nueva, v))
+
+    h_origen = h[origen]
+    dist = [d - h_origen + h[v] if d != INF else INF for v, d in enumerate(dist_rep)]
+    dist[origen] = 0
+    siguiente[origen] = None
+    predecesor[origen] = None
+    return dist, siguiente, predecesor
+
+
+class ResultadoPerezoso:
+    """
+    Resultado de Johnson que calcula cada fila (un Dijkstra) recién cuando se pide.
+
+    `dist` y `next_node` se comportan como las matrices de `floyd_warshall`
+    (dist[i][j], next_node[i][j]), así que `reconstruir_camino` funciona igual;
+    cada nodo intermedio del camino dispara (una sola vez) el Dijkstra de su fila.
+    Para un único par conviene `camino(origen, destino)`, que usa sólo la fila
+    del origen.
+    """
+
+    def __init__(self, grafo: GrafoDisperso, h: List[float], max_filas: Optional[int] = None):
+        self.grafo = grafo
+        self.h = h
+        self.max_filas = max_filas
+        self._filas: "OrderedDict[int, tuple]" = OrderedDict()
+        self.dist = _VistaFilas(self, 0)
+        self.next_node = _VistaFilas(self, 1)
+
+    def __len__(self):
+        return self.grafo.n
+
+    def fila(self, origen: int) -> tuple:
+        """Devuelve (dist, siguiente, predecesor) desde `origen`, calculándolo si hace falta."""
+        if origen in self._filas:
+            self._filas.move_to_end(origen)
+            return self._filas[origen]
+        resultado = dijkstra_repesado(self.grafo, self.h, origen)
+        self._filas[origen] = resultado
+        if self.max_filas is not None and len(self._filas) > self.max_filas:
+            self._filas.popitem(last=False)
+        return resultado
+
+    def camino(self, origen: int, destino: int) -> List[int]:
+        """Camino mínimo origen->destino usando sólo el árbol del origen."""
+        dist, _, predecesor = self.fila(origen)
+        if origen == destino or dist[destino] == INF:
+            return []
+        camino = [destino]
+        while camino[-1] != origen:
+            camino.append(predecesor[camino[-1]])
+        camino.reverse()
+        return camino
+
+
+class _VistaFilas:
+    """Vista indexable fila por fila sobre un ResultadoPerezoso."""
+
+    def __init__(self, resultado: ResultadoPerezoso, indice: int):
+        self._resultado = resultado
+        self._indice = indice
+
+    def __len__(self):
+        return len(self._resultado)
+
+    def __getitem__(self, origen: int) -> list:
+        return self._resultado.fila(origen)[self._indice]
+
+
+def johnson(grafo: Union[GrafoDisperso, List[List[float]]], perezoso: bool = False,
+            max_filas: Optional[int] = None):
+    """
+    Caminos más cortos entre todos los pares con el algoritmo de Johnson.
+
+    Args:
+        grafo: GrafoDisperso o matriz de adyacencia (se convierte a listas)
+        perezoso: Si es True, no calcula nada por adelantado y devuelve un
+                  ResultadoPerezoso que resuelve cada fila al accederla
+        max_filas: Con perezoso=True, cantidad máxima de filas en memoria (LRU)
+
+    Returns:
+        - perezoso=False: tupla (dist, next_node) como listas de listas, con el
+          mismo formato que `floyd_warshall`
+        - perezoso=True: ResultadoPerezoso (usar .dist y .next_node)
+
+    Raises:
+        ValueError: si el grafo contiene un ciclo de peso negativo
+
+    Complejidad: O(n·m + n·(n + m) log n)
+    Espacio: O(n + m) más O(n²) para el resultado completo
+    """
+    grafo = _como_grafo_disperso(grafo)
+    h = potenciales_bellman_ford(grafo)
+
+    if perezoso:
+        return ResultadoPerezoso(grafo, h, max_filas)
+
+    dist = []
+    next_node = []
+    for origen in range(grafo.n):
+        fila_dist, fila_siguiente, _ = dijkstra_repesado(grafo, h, origen)
+        dist.append(fila_dist)
+        next_node.append(fila_siguiente)
+    return dist, next_node
@@ -0,0 +1,104 @@
+"""
+Matrices compactas para los resultados de Floyd-Warshall.
+
+Una lista de listas de n×n guarda un puntero de 8 bytes por celda más un
+objeto Python por cada valor (float o int fuera del caché de enteros chicos).
+Estas clases guardan los n² valores en un único `array` contiguo:
+    - MatrizDistancias: float64 ('d') u float32 ('f') por celda
+    - MatrizSiguientes: int32 ('i') por celda, con -1 en lugar de None
+
+Ambas se indexan como las listas (m[i][j]): m[i] devuelve una fila como
+memoryview sin copiar, que admite lectura y asignación. Por eso funcionan sin
+cambios con el ciclo de `floyd_warshall` y con `reconstruir_camino`.
+"""
+from array import array
+from typing import List, Optional
+
+# Valor usado en `next_node` para indicar "no hay camino" (en lugar de None)
+SIN_SIGUIENTE = -1
+
+
+class _MatrizPlana:
+    """Matriz n×n guardada fila por fila en un array de tipo `tipo`."""
+
+    def __init__(self, n: int, tipo: str, valor_inicial):
+        self.n = n
+        self.datos = array(tipo, [valor_inicial]) * (n * n)
+        self._vista = memoryview(self.datos)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i: int) -> memoryview:
+        if not 0 <= i < self.n:
+            raise IndexError("fila fuera de rango")
+        return self._vista[i * self.n:(i + 1) * self.n]
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self[i]
+
+    @property
+    def nbytes(self) -> int:
+        return self.datos.itemsize * len(self.datos)
+
+
+class MatrizDistancias(_MatrizPlana):
+    """
+    Matriz de distancias con tipo seleccionable: 'd' (float64) o 'f' (float32,
+    la mitad de memoria; exacta para enteros hasta 2²⁴).
+    """
+
+    def __init__(self, n: int, tipo: str = 'd'):
+        if tipo not in ('d', 'f'):
+            raise ValueError("El tipo de distancia debe ser 'd' (float64) o 'f' (float32)")
+        super().__init__(n, tipo, float('inf'))
+
+    @classmethod
+    def desde_listas(cls, matriz: List[List[float]], tipo: str = 'd') -> "MatrizDistancias":
+        compacta = cls(len(matriz), tipo)
+        for i, fila in enumerate(matriz):
+            compacta[i][:] = array(tipo, fila)
+        return compacta
+
+    def a_listas(self) -> List[List[float]]:
+        return [fila.tolist() for fila in self]
+
+
+class MatrizSiguientes(_MatrizPlana):
+    """Matriz next_node como int32 con SIN_SIGUIENTE (-1) en lugar de None."""
+
+    def __init__(self, n: int):
+        super().__init__(n, 'i', SIN_SIGUIENTE)
+
+    @classmethod
+    def desde_listas(cls, next_node: List[List[Optional[int]]]) -> "MatrizSiguientes":
+        compacta = cls(len(next_node))
+        for i, fila in enumerate(next_node):
+            compacta[i][:] = array('i', (SIN_SIGUIENTE if j is None else j for j in fila))
+        return compacta
+
+    def a_listas(self) -> List[List[Optional[int]]]:
+        return [[None if j == SIN_SIGUIENTE else j for j in fila.tolist()] for fila in self]
+
+
+def compactar(dist: List[List[float]], next_node: List[List[Optional[int]]],
+              tipo: str = 'd') -> tuple:
+    """Convierte un resultado en listas de listas a (MatrizDistancias, MatrizSiguientes)."""
+    return MatrizDistancias.desde_listas(dist, tipo), MatrizSiguientes.desde_listas(next_node)
+
+
+def expandir(dist, next_node) -> tuple:
+    """
+    Convierte un resultado compacto (estas clases o arreglos NumPy con -1) al
+    formato de listas de listas con None de `floyd_warshall`.
+    """
+    if hasattr(dist, 'tolist') and not isinstance(dist, _MatrizPlana):
+        dist_listas = dist.tolist()
+    else:
+        dist_listas = dist.a_listas()
+    if isinstance(next_node, MatrizSiguientes):
+        next_listas = next_node.a_listas()
+    else:
+        next_listas = [[None if j == SIN_SIGUIENTE else j for j in fila] for fila in next_node.tolist()]
+    return dist_listas, next_listas
@@ -0,0 +1,100 @@
+"""
+Problema: Par de puntos más cercanos en el plano.
+Algoritmo aleatorizado con grilla de hash (Rabin, Khuller–Matias), O(n) esperado.
+
+Se recorren los puntos en orden aleatorio manteniendo d, la menor distancia
+entre los puntos ya vistos, y una grilla de celdas de lado d (un dict de
+celda -> puntos). Cada punto nuevo sólo puede estar a menos de d de puntos en
+las 9 celdas vecinas, y cada celda tiene a lo sumo 4 puntos. Si el punto nuevo
+mejora d, la grilla se reconstruye con el nuevo tamaño de celda.
+
+Con orden aleatorio, la probabilidad de que el i-ésimo punto mejore d es a lo
+sumo 2/i, así que el costo esperado de las reconstrucciones es
+sum_i (2/i) * O(i) = O(n). No hace falta ordenar.
+"""
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+
+from tp_algos.algorithms.divide_conquer.closest_pair import Point
+
+# Índices de celda (x // lado, y // lado). Se dejan como float: son enteros
+# exactos y evitan convertir en cada consulta.
+Celda = Tuple[float, float]
+
+
+def _construir_grilla(puntos: List[Point], hasta: int, lado: float) -> Dict[Celda, List[Point]]:
+    """Grilla de celdas de lado `lado` con los puntos puntos[0..hasta]."""
+    grilla: Dict[Celda, List[Point]] = {}
+    for p in puntos[:hasta + 1]:
+        celda = (p[0] // lado, p[1] // lado)
+        if celda in grilla:
+            grilla[celda].append(p)
+        else:
+            grilla[celda] = [p]
+    return grilla
+
+
+def closest_pair_grilla(puntos: List[Point], semilla: Optional[int] = None) -> Tuple[float, Point, Point]:
+    """
+    Par de puntos más cercanos con grilla de hash y orden aleatorio.
+
+    Args:
+        puntos: Lista de tuplas (x, y)
+        semilla: Semilla del orden aleatorio (None = no determinista). El
+                 resultado no depende de la semilla salvo ante empates; el
+                 tiempo sí.
+
+    Returns:
+        Tupla con (distancia_minima, punto1, punto2), como `closest_pair`
+
+    Complejidad: O(n) esperado (sobre el orden aleatorio), O(n²) en el peor caso
+    Espacio: O(n)
+    """
+    if len(puntos) < 2:
+        return float('inf'), None, None
+
+    orden = list(puntos)
+    random.Random(semilla).shuffle(orden)
+
+    p1, p2 = orden[0], orden[1]
+    mejor = (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2  # distancia al cuadrado
+    if mejor == 0:
+        return 0.0, p1, p2
+    # Como en la franja del motor de arreglos, el lado se ensancha apenas para
+    # cubrir el redondeo de la raíz: un par a distancia d nunca queda a dos celdas
+    lado = math.sqrt(mejor) * (1 + 1e-9)
+    grilla = _construir_grilla(orden, 1, lado)
+
+    vacia = ()
+    for i in range(2, len(orden)):
+        p = orden[i]
+        x, y = p
+        cx, cy = x // lado, y // lado
+        candidato = None
+        for vx in (cx - 1, cx, cx + 1):
+            for vy in (cy - 1, cy, cy + 1):
+                for q in grilla.get((vx, vy), vacia):
+                    dx = x - q[0]
+                    dy = y - q[1]
+                    d2 = dx * dx + dy * dy
+                    if d2 < mejor:
+                        mejor, candidato = d2, q
+
+        if candidato is None:
+            celda = (cx, cy)
+            if celda in grilla:
+                grilla[celda].append(p)
+            else:
+                grilla[celda] = [p]
+            continue
+
+        p1, p2 = candidato, p
+        if mejor == 0:
+            break
+        # d mejoró: las celdas quedaron grandes, se reconstruye con el nuevo lado
+        lado = math.sqrt(mejor) * (1 + 1e-9)
+        grilla = _construir_grilla(orden, i, lado)
+
+    # Misma fórmula que `distancia`, para devolver exactamente el mismo valor
+    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2), p1, p2
@@ -0,0 +1,138 @@
+"""
+Problema: todos los pares de puntos a distancia ≤ δ, y los k pares más cercanos.
+
+`closest_pair` devuelve sólo el mejor par. Para deduplicar puntos casi
+idénticos hace falta enumerar todos los pares cercanos, sin comparar los n²:
+
+    - Se reparten los puntos en una grilla de celdas de lado δ (un dict).
+      Dos puntos a distancia ≤ δ están en la misma celda o en celdas vecinas,
+      así que cada celda se compara con ella misma y con 4 de sus 8 vecinas
+      (las otras 4 la comparan a ella). El costo es O(n + cantidad de pares
+      candidatos), que es proporcional a la salida cuando δ es chico.
+    - Para los k más cercanos se prueba con un δ estimado y se duplica hasta
+      que haya al menos k pares a distancia ≤ δ: los k menores de esos son los
+      k menores de todos.
+
+Ambas funciones son generadores: los pares se producen de a uno.
+"""
+import heapq
+import math
+from typing import Dict, Iterator, List, Tuple
+
+from tp_algos.algorithms.divide_conquer.closest_pair import Point, closest_pair, distancia
+
+Par = Tuple[float, int, int]  # (distancia, i, j) con i < j índices en puntos
+
+# Celdas vecinas "hacia adelante": cada par de celdas adyacentes se visita una vez
+_VECINAS_ADELANTE = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def pares_cercanos(puntos: List[Point], delta: float) -> Iterator[Par]:
+    """
+    Genera todos los pares de puntos a distancia ≤ delta, sin orden particular.
+
+    Args:
+        puntos: Lista de tuplas (x, y)
+        delta: Distancia máxima (≥ 0); con 0 se generan los puntos repetidos
+
+    Yields:
+        Tuplas (distancia, i, j) con i < j índices en `puntos`
+
+    Complejidad: O(n + c) con c la cantidad de pares en celdas vecinas
+                 (proporcional a la cantidad de pares generados si δ es chico)
+    Espacio: O(n) para la grilla; los pares no se acumulan
+    """
+    if delta < 0:
+        raise ValueError("delta debe ser no negativo")
+
+    if delta == 0:
+        iguales: Dict[Point, List[int]] = {}
+        for i, p in enumerate(puntos):
+            iguales.setdefault((p[0], p[1]), []).append(i)
+        for indices in iguales.values():
+            for a in range(len(indices)):
+                for b in range(a + 1, len(indices)):
+                    yield 0.0, indices[a], indices[b]
+        return
+
+    grilla: Dict[Tuple[float, float], List[int]] = {}
+    for i, p in enumerate(puntos):
+        grilla.setdefault((p[0] // delta, p[1] // delta), []).append(i)
+
+    for (cx, cy), celda in grilla.items():
+        # Pares dentro de la celda
+        for a in range(len(celda)):
+            i = celda[a]
+            for b in range(a + 1, len(celda)):
+                j = celda[b]
+                d = distancia(puntos[i], puntos[j])
+                if d <= delta:
+                    yield (d, i, j) if i < j else (d, j, i)
+        # Pares con las celdas vecinas hacia adelante
+        for dx, dy in _VECINAS_ADELANTE:
+            vecina = grilla.get((cx + dx, cy + dy))
+            if not vecina:
+                continue
+            for i in celda:
+                for j in vecina:
+                    d = distancia(puntos[i], puntos[j])
+                    if d <= delta:
+                        yield (d, i, j) if i < j else (d, j, i)
+
+
+def _delta_inicial(puntos: List[Point], k: int) -> float:
+    """
+    δ con ~k pares esperados si los puntos estuvieran uniformes en su caja:
+    pares ≈ n² π δ² / (2 · área). Nunca menor que la distancia del par más cercano.
+    """
+    n = len(puntos)
+    xs = [p[0] for p in puntos]
+    ys = [p[1] for p in puntos]
+    ancho, alto = max(xs) - min(xs), max(ys) - min(ys)
+    estimado = math.sqrt(2 * ancho * alto * k / (math.pi * n * n))
+    if estimado == 0:
+        # Puntos alineados: en una recta, pares ≈ n² δ / largo
+        estimado = max(ancho, alto) * k / (n * n)
+    return max(estimado, closest_pair(puntos, motor="arreglos")[0])
+
+
+def k_pares_mas_cercanos(puntos: List[Point], k: int) -> Iterator[Par]:
+    """
+    Genera los k pares de puntos más cercanos, de menor a mayor distancia.
+
+    Args:
+        puntos: Lista de tuplas (x, y)
+        k: Cantidad de pares (si hay menos de k pares, se generan todos)
+
+    Yields:
+        Tuplas (distancia, i, j) con i < j índices en `puntos`
+
+    Complejidad: O((n + c) log k) por cada δ probado, con c los pares
+                 candidatos; δ se duplica, así que se prueban O(log) valores
+    Espacio: O(n + k)
+    """
+    n = len(puntos)
+    if k <= 0 or n < 2:
+        return
+    total_pares = n * (n - 1) // 2
+    k = min(k, total_pares)
+
+    delta = _delta_inicial(puntos, k)
+    if delta == 0:
+        # Todos los puntos son iguales: cualquier par está a distancia 0
+        delta = 1.0
+    while True:
+        # Max-heap acotado a k elementos: (-distancia, -i, -j)
+        mejores: List[Tuple[float, int, int]] = []
+        for d, i, j in pares_cercanos(puntos, delta):
+            if len(mejores) < k:
+                heapq.heappush(mejores, (-d, -i, -j))
+            elif (-d, -i, -j) > mejores[0]:
+                heapq.heapreplace(mejores, (-d, -i, -j))
+        if len(mejores) == k:
+            break
+        # Menos de k pares a distancia ≤ δ: los que faltan están más lejos
+        delta *= 2
+
+    for menos_d, menos_i, menos_j in sorted(mejores, reverse=True):
+        yield -menos_d, -menos_i, -menos_j
@@ -0,0 +1,62 @@
+"""
+Grafo dirigido y ponderado representado con listas de adyacencia.
+
+Para redes dispersas (m ≈ c·n aristas) ocupa O(n + m) en lugar de los O(n²)
+de la matriz que devuelve `crear_grafo_vacio`.
+"""
+from typing import Iterator, List, Tuple
+
+Arista = Tuple[int, int, float]
+
+
+class GrafoDisperso:
+    def __init__(self, n: int):
+        self.n = n
+        # adyacentes[u] = lista de (destino, peso)
+        self.adyacentes: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+
+    def __len__(self):
+        return self.n
+
+    def agregar_arista(self, origen: int, destino: int, peso: float):
+        self.adyacentes[origen].append((destino, peso))
+
+    def aristas(self) -> Iterator[Arista]:
+        for origen, vecinos in enumerate(self.adyacentes):
+            for destino, peso in vecinos:
+                yield origen, destino, peso
+
+    def cantidad_aristas(self) -> int:
+        return sum(len(vecinos) for vecinos in self.adyacentes)
+
+    def invertido(self) -> "GrafoDisperso":
+        """Grafo con todas las aristas en sentido contrario."""
+        inverso = GrafoDisperso(self.n)
+        for origen, destino, peso in self.aristas():
+            inverso.agregar_arista(destino, origen, peso)
+        return inverso
+
+    @classmethod
+    def desde_matriz(cls, matriz: List[List[float]]) -> "GrafoDisperso":
+        """
+        Construye el grafo a partir de una matriz de adyacencia (inf = sin arista).
+        La diagonal sólo se conserva si es negativa, porque un lazo no negativo
+        nunca forma parte de un camino mínimo.
+        """
+        grafo = cls(len(matriz))
+        for i, fila in enumerate(matriz):
+            for j, peso in enumerate(fila):
+                if peso == float('inf') or (i == j and peso >= 0):
+                    continue
+                grafo.agregar_arista(i, j, peso)
+        return grafo
+
+    def a_matriz(self) -> List[List[float]]:
+        """Matriz de adyacencia equivalente (con aristas paralelas se queda con la menor)."""
+        matriz = [[float('inf')] * self.n for _ in range(self.n)]
+        for i in range(self.n):
+            matriz[i][i] = 0
+        for origen, destino, peso in self.aristas():
+            if peso < matriz[origen][destino]:
+                matriz[origen][destino] = peso
+        return matriz
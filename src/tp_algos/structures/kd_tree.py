@@ -0,0 +1,176 @@
+"""
+Árbol KD estático para consultas de vecinos sobre un conjunto fijo de puntos.
+
+El árbol es implícito: no hay objetos nodo. Al construirlo se reordenan las
+posiciones de forma que cada rango [inicio, fin) es un subárbol cuya raíz es
+la posición del medio, y los dos lados del medio son los subárboles izquierdo
+y derecho. El eje de corte alterna x / y con la profundidad. Las coordenadas
+reordenadas se guardan en dos `array('d')` y los rangos de hasta TAMANO_HOJA
+puntos se recorren sin seguir dividiendo.
+
+Las consultas devuelven índices de la lista original de puntos.
+"""
+import heapq
+import math
+from array import array
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+# Rangos de este tamaño o menos no se dividen: se comparan todos sus puntos
+TAMANO_HOJA = 8
+
+
+class KDTree:
+    def __init__(self, puntos: Sequence[Point]):
+        """
+        Construye el árbol. Complejidad: O(n log² n) (un sort por nivel)
+        """
+        self.puntos = list(puntos)
+        self.n = len(self.puntos)
+        orden = list(range(self.n))
+        self._construir(orden, 0, self.n, 0)
+        # indices[pos] = índice original del punto guardado en la posición pos
+        self.indices = array('l', orden)
+        self.xs = array('d', (self.puntos[i][0] for i in orden))
+        self.ys = array('d', (self.puntos[i][1] for i in orden))
+
+    def __len__(self):
+        return self.n
+
+    def _construir(self, orden: List[int], inicio: int, fin: int, eje: int):
+        if fin - inicio <= TAMANO_HOJA:
+            return
+        puntos = self.puntos
+        orden[inicio:fin] = sorted(orden[inicio:fin], key=lambda i: puntos[i][eje])
+        medio = (inicio + fin) // 2
+        self._construir(orden, inicio, medio, 1 - eje)
+        self._construir(orden, medio + 1, fin, 1 - eje)
+
+    def _k_cercanos(self, qx: float, qy: float, k: int, excluir: int = -1) -> List[Tuple[float, int]]:
+        """Las k posiciones más cercanas a (qx, qy) como (distancia², posición)."""
+        xs, ys = self.xs, self.ys
+        # Max-heap por distancia²: (-d², posición)
+        heap: List[Tuple[float, int]] = []
+
+        def considerar(pos: int):
+            dx = xs[pos] - qx
+            dy = ys[pos] - qy
+            d2 = dx * dx + dy * dy
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, pos))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, pos))
+
+        def visitar(inicio: int, fin: int, eje: int):
+            if fin - inicio <= TAMANO_HOJA:
+                for pos in range(inicio, fin):
+                    if pos != excluir:
+                        considerar(pos)
+                return
+            medio = (inicio + fin) // 2
+            if medio != excluir:
+                considerar(medio)
+            diferencia = (qx - xs[medio]) if eje == 0 else (qy - ys[medio])
+            if diferencia < 0:
+                cerca, lejos = (inicio, medio), (medio + 1, fin)
+            else:
+                cerca, lejos = (medio + 1, fin), (inicio, medio)
+            visitar(cerca[0], cerca[1], 1 - eje)
+            # El otro lado sólo puede mejorar si el plano de corte está a menos
+            # distancia que el k-ésimo actual
+            if len(heap) < k or diferencia * diferencia < -heap[0][0]:
+                visitar(lejos[0], lejos[1], 1 - eje)
+
+        visitar(0, self.n, 0)
+        return sorted((-menos_d2, pos) for menos_d2, pos in heap)
+
+    def _distancia(self, qx: float, qy: float, pos: int) -> float:
+        """Misma fórmula que `distancia` de closest_pair (x ** 2 puede diferir
+        en el último bit de x * x, que es lo que se usa al comparar)."""
+        return math.sqrt((self.xs[pos] - qx) ** 2 + (self.ys[pos] - qy) ** 2)
+
+    def vecino_mas_cercano(self, q: Point) -> Tuple[float, int]:
+        """
+        Punto más cercano a q.
+
+        Returns:
+            Tupla (distancia, indice) con el índice en la lista original, o
+            (inf, None) si el árbol está vacío
+
+        Complejidad: O(log n) esperado para puntos bien distribuidos
+        """
+        vecinos = self.k_vecinos(q, 1)
+        return vecinos[0] if vecinos else (float('inf'), None)
+
+    def k_vecinos(self, q: Point, k: int) -> List[Tuple[float, int]]:
+        """
+        Los k puntos más cercanos a q, de menor a mayor distancia.
+
+        Returns:
+            Lista de hasta k tuplas (distancia, indice)
+
+        Complejidad: O(k log k + log n) esperado
+        """
+        if k <= 0:
+            return []
+        qx, qy = q
+        return [(self._distancia(qx, qy, pos), self.indices[pos]) for _, pos in self._k_cercanos(qx, qy, k)]
+
+    def en_radio(self, q: Point, r: float) -> List[int]:
+        """
+        Índices de todos los puntos a distancia ≤ r de q, en orden creciente.
+
+        Complejidad: O(√n + m) esperado, con m la cantidad de resultados
+        """
+        xs, ys = self.xs, self.ys
+        qx, qy = q
+        r2 = r * r
+        resultado: List[int] = []
+        pendientes = [(0, self.n, 0)]
+        while pendientes:
+            inicio, fin, eje = pendientes.pop()
+            if fin - inicio <= TAMANO_HOJA:
+                for pos in range(inicio, fin):
+                    dx = xs[pos] - qx
+                    dy = ys[pos] - qy
+                    if dx * dx + dy * dy <= r2:
+                        resultado.append(self.indices[pos])
+                continue
+            medio = (inicio + fin) // 2
+            dx = xs[medio] - qx
+            dy = ys[medio] - qy
+            if dx * dx + dy * dy <= r2:
+                resultado.append(self.indices[medio])
+            diferencia = -dx if eje == 0 else -dy
+            # Cada lado se visita sólo si la bola de radio r cruza el plano de corte
+            if diferencia <= r:
+                pendientes.append((inicio, medio, 1 - eje))
+            if diferencia >= -r:
+                pendientes.append((medio + 1, fin, 1 - eje))
+        resultado.sort()
+        return resultado
+
+    def todos_los_vecinos(self) -> Tuple[List[Tuple[float, int]], Tuple[float, Point, Point]]:
+        """
+        Vecino más cercano de cada punto (sin contarse a sí mismo).
+
+        Returns:
+            Tupla (vecinos, par): vecinos[i] = (distancia, indice) del más
+            cercano al punto i, y par = (distancia_minima, punto1, punto2) con el
+            mismo contrato que `closest_pair`, que sale como subproducto
+
+        Complejidad: O(n log n) esperado
+        """
+        vecinos: List[Tuple[float, int]] = [(float('inf'), None)] * self.n
+        mejor = (float('inf'), None, None)
+        for pos in range(self.n):
+            cercanos = self._k_cercanos(self.xs[pos], self.ys[pos], 1, excluir=pos)
+            if not cercanos:
+                continue
+            otro = cercanos[0][1]
+            i, j = self.indices[pos], self.indices[otro]
+            vecinos[i] = (self._distancia(self.xs[pos], self.ys[pos], otro), j)
+            if vecinos[i][0] < mejor[0]:
+                mejor = (vecinos[i][0], self.puntos[i], self.puntos[j])
+        return vecinos, mejor
@@ -0,0 +1,42 @@
+"""
+Segmentos de `multiprocessing.shared_memory` para los motores paralelos.
+
+El proceso principal crea los segmentos con `segmentos_compartidos` y es el
+único que los libera; los trabajadores se conectan con `conectar` en el
+inicializador del pool, sólo por nombre.
+"""
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Iterator, List, Sequence
+
+
+@contextmanager
+def segmentos_compartidos(tamanos: Sequence[int]) -> Iterator[List[shared_memory.SharedMemory]]:
+    """
+    Crea un segmento por tamaño (en bytes) y los libera al salir del bloque.
+
+    Las vistas (arreglos NumPy, memoryview) sobre los segmentos tienen que
+    liberarse antes de salir; si una excepción las mantiene vivas, el segmento
+    igual se libera con unlink.
+    """
+    memorias: List[shared_memory.SharedMemory] = []
+    try:
+        for tamano in tamanos:
+            memorias.append(shared_memory.SharedMemory(create=True, size=max(tamano, 1)))
+        yield memorias
+    finally:
+        for memoria in memorias:
+            memoria.unlink()
+            try:
+                memoria.close()
+            except BufferError:
+                # Sólo ocurre si una excepción mantiene vivas las vistas; el
+                # segmento ya fue liberado con unlink
+                pass
+
+
+def conectar(nombre: str) -> shared_memory.SharedMemory:
+    """Conecta un proceso trabajador a un segmento creado por el principal."""
+    # Los trabajadores comparten el resource_tracker del proceso principal,
+    # que es quien hace unlink al terminar
+    return shared_memory.SharedMemory(name=nombre)
@@ -0,0 +1,46 @@
+"""
+Generadores de instancias aleatorias compartidos por los tests.
+"""
+import random
+
+from tp_algos.algorithms.graphs.floyd_warshall import crear_grafo_vacio
+
+
+def grafo_aleatorio(n, densidad, semilla, peso_maximo=100):
+    """Genera un grafo dirigido aleatorio con pesos enteros en [1, peso_maximo]."""
+    rng = random.Random(semilla)
+    grafo = crear_grafo_vacio(n)
+    for i in range(n):
+        for j in range(n):
+            if i != j and rng.random() < densidad:
+                grafo[i][j] = rng.randint(1, peso_maximo)
+    return grafo
+
+
+def puntos_aleatorios(n, semilla, enteros=False, lado=100):
+    """
+    Genera n puntos aleatorios en [-lado, lado]². Con enteros=True son enteros
+    en [0, lado]², así que hay repetidos y empates.
+    """
+    rng = random.Random(semilla)
+    if enteros:
+        return [(rng.randint(0, lado), rng.randint(0, lado)) for _ in range(n)]
+    return [(rng.uniform(-lado, lado), rng.uniform(-lado, lado)) for _ in range(n)]
+
+
+def mochila_aleatoria(semilla, n_maximo=14, peso_maximo=10, valor_maximo=30,
+                      capacidad_maxima=40, n_minimo=0, capacidad_minima=0):
+    """
+    Genera (pesos, valores, capacidad) aleatorios. Los enteros empiezan en 0,
+    así que hay pesos cero, objetos que no caben y empates.
+    """
+    rng = random.Random(semilla)
+    n = rng.randint(n_minimo, n_maximo)
+    pesos = [rng.randint(0, peso_maximo) for _ in range(n)]
+    valores = [rng.randint(0, valor_maximo) for _ in range(n)]
+    return pesos, valores, rng.randint(capacidad_minima, capacidad_maxima)
+
+
+def costo_camino(grafo, camino):
+    """Suma los pesos de las aristas de un camino."""
+    return sum(grafo[a][b] for a, b in zip(camino, camino[1:]))
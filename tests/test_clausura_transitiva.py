@@ -0,0 +1,62 @@
+"""
+Tests para la clausura transitiva con bitsets.
+"""
+
+import pytest
+from tp_algos.algorithms.graphs.clausura_transitiva import (
+    clausura_transitiva, Alcanzabilidad
+)
+from tp_algos.algorithms.graphs.floyd_warshall import floyd_warshall, crear_grafo_vacio
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+from tests.generadores import grafo_aleatorio
+
+
+class TestClausuraTransitiva:
+    """Tests para clausura_transitiva y Alcanzabilidad."""
+
+    def test_cadena(self):
+        """Test con una cadena 0 -> 1 -> 2."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 1
+        grafo[1][2] = 1
+
+        filas = clausura_transitiva(grafo)
+
+        assert filas == [0b111, 0b110, 0b100]
+
+    @pytest.mark.parametrize("semilla", range(4))
+    def test_igual_a_floyd_warshall(self, semilla):
+        """Test que coincide con las distancias finitas de Floyd-Warshall."""
+        grafo = grafo_aleatorio(30, 0.05, semilla)
+        dist, _ = floyd_warshall(grafo)
+
+        alcance = Alcanzabilidad(grafo)
+
+        for i in range(30):
+            for j in range(30):
+                assert alcance.alcanzable(i, j) == (dist[i][j] != float('inf'))
+
+    def test_grafo_disperso(self):
+        """Test que acepta un GrafoDisperso."""
+        grafo = GrafoDisperso(4)
+        grafo.agregar_arista(0, 1, 5)
+        grafo.agregar_arista(1, 3, 2)
+
+        alcance = Alcanzabilidad(grafo)
+
+        assert alcance.alcanzables_desde(0) == [0, 1, 3]
+        assert not alcance.alcanzable(3, 0)
+
+    def test_componentes_fuertemente_conexas(self):
+        """Test con dos ciclos unidos por una arista y un nodo aislado."""
+        grafo = crear_grafo_vacio(6)
+        for u, v in [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 3)]:
+            grafo[u][v] = 1
+
+        componentes = Alcanzabilidad(grafo).componentes_fuertemente_conexas()
+
+        assert componentes == [[0, 1, 2], [3, 4], [5]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
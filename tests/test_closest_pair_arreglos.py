@@ -0,0 +1,66 @@
+"""
+Tests para el motor de par más cercano sobre arreglos.
+"""
+import random
+
+import pytest
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair, fuerza_bruta, distancia
+from tp_algos.algorithms.divide_conquer.closest_pair_arreglos import closest_pair_arreglos
+from tests.generadores import puntos_aleatorios
+
+
+class TestClosestPairArreglos:
+    """Tests para closest_pair_arreglos y motor="arreglos"."""
+
+    def test_ejemplo_complejo(self):
+        """Test con el ejemplo de closest_pair."""
+        puntos = [(2, 3), (12, 30), (40, 50), (5, 1), (12, 10), (3, 4)]
+
+        dist, p1, p2 = closest_pair(puntos, motor="arreglos")
+
+        assert dist == distancia((2, 3), (3, 4))
+        assert {p1, p2} == {(2, 3), (3, 4)}
+
+    @pytest.mark.parametrize("semilla", range(20))
+    def test_igual_a_fuerza_bruta(self, semilla):
+        """Test con puntos aleatorios: misma distancia exacta y par consistente."""
+        puntos = puntos_aleatorios(random.Random(semilla).randint(2, 80), semilla, enteros=semilla % 2 == 0, lado=30)
+
+        dist, p1, p2 = closest_pair_arreglos(puntos)
+
+        assert dist == fuerza_bruta(puntos)[0]
+        assert distancia(p1, p2) == dist
+
+    def test_igual_a_closest_pair(self):
+        """Test con muchos puntos: misma distancia que el motor de listas."""
+        puntos = puntos_aleatorios(3000, 42)
+
+        assert closest_pair_arreglos(puntos)[0] == closest_pair(puntos)[0]
+
+    def test_misma_x(self):
+        """Test con todos los puntos sobre una vertical (franja completa en cada nivel)."""
+        puntos = [(5.0, float(y * y)) for y in range(60)] + [(5.0, 0.5)]
+
+        assert closest_pair_arreglos(puntos)[0] == 0.5
+
+    def test_puntos_repetidos(self):
+        """Test con un punto repetido: distancia cero."""
+        puntos = puntos_aleatorios(50, 3) + [(1.5, 2.5), (1.5, 2.5)]
+
+        dist, p1, p2 = closest_pair_arreglos(puntos)
+
+        assert dist == 0
+        assert p1 == p2 == (1.5, 2.5)
+
+    def test_menos_de_dos_puntos(self):
+        """Test con un solo punto."""
+        assert closest_pair_arreglos([(1, 1)]) == (float('inf'), None, None)
+
+    def test_motor_desconocido(self):
+        """Test que rechaza motores inexistentes."""
+        with pytest.raises(ValueError):
+            closest_pair([(0, 0), (1, 1)], motor="gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
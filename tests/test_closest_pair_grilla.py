@@ -0,0 +1,60 @@
+"""
+Tests para el par más cercano aleatorizado con grilla de hash.
+"""
+import random
+
+import pytest
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair, fuerza_bruta, distancia
+from tp_algos.algorithms.randomized.closest_pair_grilla import closest_pair_grilla
+from tests.generadores import puntos_aleatorios
+
+
+class TestClosestPairGrilla:
+    """Tests para closest_pair_grilla."""
+
+    def test_dos_puntos(self):
+        """Test con solo dos puntos."""
+        dist, p1, p2 = closest_pair_grilla([(0, 0), (3, 4)], semilla=1)
+
+        assert dist == 5.0
+        assert {p1, p2} == {(0, 0), (3, 4)}
+
+    @pytest.mark.parametrize("semilla", range(20))
+    def test_igual_a_fuerza_bruta(self, semilla):
+        """Test con puntos aleatorios (enteros con empates o reales)."""
+        rng = random.Random(semilla)
+        n = rng.randint(2, 80)
+        puntos = puntos_aleatorios(n, semilla, enteros=semilla % 2 == 1, lado=40 if semilla % 2 else 1e3)
+
+        dist, p1, p2 = closest_pair_grilla(puntos, semilla=semilla)
+
+        assert dist == fuerza_bruta(puntos)[0]
+        assert distancia(p1, p2) == dist
+
+    def test_semilla_reproducible(self):
+        """Test que con la misma semilla devuelve exactamente el mismo resultado."""
+        rng = random.Random(7)
+        puntos = [(rng.randint(0, 50), rng.randint(0, 50)) for _ in range(300)]
+
+        assert closest_pair_grilla(puntos, semilla=3) == closest_pair_grilla(puntos, semilla=3)
+
+    def test_igual_a_closest_pair(self):
+        """Test con muchos puntos: misma distancia que Divide & Conquer."""
+        puntos = puntos_aleatorios(5000, 11, lado=1e6)
+
+        assert closest_pair_grilla(puntos, semilla=0)[0] == closest_pair(puntos)[0]
+
+    def test_puntos_repetidos(self):
+        """Test con puntos repetidos: distancia cero."""
+        dist, p1, p2 = closest_pair_grilla([(1, 1), (5, 5), (1, 1), (9, 2)], semilla=2)
+
+        assert dist == 0
+        assert p1 == p2 == (1, 1)
+
+    def test_menos_de_dos_puntos(self):
+        """Test con lista vacía."""
+        assert closest_pair_grilla([]) == (float('inf'), None, None)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
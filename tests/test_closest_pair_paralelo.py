@@ -0,0 +1,82 @@
+"""
+Tests para el par de puntos más cercanos repartido entre procesos.
+"""
+import random
+
+import pytest
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair, distancia, fuerza_bruta
+from tp_algos.algorithms.divide_conquer.closest_pair_paralelo import closest_pair_paralelo, _franjas
+from tests.generadores import puntos_aleatorios
+
+
+class TestClosestPairParalelo:
+    """Tests para closest_pair_paralelo (con umbral bajo para forzar el pool)."""
+
+    @pytest.mark.parametrize("semilla", range(3))
+    def test_igual_a_closest_pair(self, semilla):
+        """Test que la distancia coincide con el motor de listas."""
+        puntos = puntos_aleatorios(3000, semilla)
+
+        d, p1, p2 = closest_pair_paralelo(puntos, workers=3, umbral_paralelo=0)
+
+        assert d == closest_pair(puntos)[0]
+        assert distancia(p1, p2) == d
+
+    def test_par_que_cruza_una_frontera(self):
+        """Test donde el mejor par queda partido entre dos franjas."""
+        puntos = [(float(i), 0.0) for i in range(0, 400, 4)]
+        # Entre las posiciones 49 y 50 (196 y 200), frontera de 2 franjas
+        puntos += [(197.9, 5.0), (198.1, 5.0)]
+
+        d, p1, p2 = closest_pair(puntos, motor="paralelo", workers=2, umbral_paralelo=0)
+
+        assert d == pytest.approx(0.2)
+        assert {p1, p2} == {(197.9, 5.0), (198.1, 5.0)}
+
+    def test_franjas_mas_angostas_que_d(self):
+        """Test de regresión: franjas más angostas que d, con puntos de otras
+        franjas que desplazaban al verdadero par fuera de los 7 vecinos."""
+        puntos = [(0, 0), (0.01, 5000), (0.05, 0.09), (0.051, 6000)]
+        for j in range(2, 10):
+            x = 0.4 + 0.25 * (j - 2)
+            puntos += [(x, 0.01 * (j - 1)), (x + 0.001, 1000 * (j + 6))]
+
+        d = closest_pair_paralelo(puntos, workers=10, umbral_paralelo=0)[0]
+
+        assert d == closest_pair(puntos)[0] == fuerza_bruta(puntos)[0]
+
+    @pytest.mark.parametrize("workers", [2, 3, 5, 7, 16])
+    def test_muchas_franjas_pocos_puntos(self, workers):
+        """Test con pocos puntos por franja y distintas cantidades de franjas."""
+        for semilla in range(5):
+            puntos = puntos_aleatorios(40, semilla, enteros=semilla % 2 == 0, lado=30)
+
+            assert closest_pair_paralelo(puntos, workers=workers, umbral_paralelo=0)[0] == fuerza_bruta(puntos)[0]
+
+    def test_coordenadas_enteras_repetidas(self):
+        """Test con muchos puntos repetidos (muchas x iguales en las fronteras)."""
+        rng = random.Random(7)
+        puntos = [(rng.randint(0, 5), rng.randint(0, 40)) for _ in range(300)]
+
+        assert closest_pair_paralelo(puntos, workers=4, umbral_paralelo=0)[0] == fuerza_bruta(puntos)[0]
+
+    def test_mas_workers_que_puntos(self):
+        """Test con más procesos que puntos y con menos de dos puntos."""
+        assert closest_pair_paralelo([(0, 0), (3, 4), (10, 10)], workers=8, umbral_paralelo=0)[0] == 5.0
+        assert closest_pair_paralelo([(1, 1)], workers=2, umbral_paralelo=0) == (float('inf'), None, None)
+
+    def test_franjas_cubren_el_rango(self):
+        """Test que las franjas son contiguas y cubren 0..n."""
+        franjas = _franjas(10, 3)
+
+        assert franjas[0][0] == 0 and franjas[-1][1] == 10
+        assert all(a[1] == b[0] for a, b in zip(franjas, franjas[1:]))
+
+    def test_workers_invalidos(self):
+        """Test que rechaza una cantidad de workers no positiva."""
+        with pytest.raises(ValueError):
+            closest_pair_paralelo([(0, 0), (1, 1)], workers=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""
+Tests para el servicio de consultas de rutas punto a punto.
+"""
+import random
+
+import pytest
+from tp_algos.algorithms.graphs.consultas_rutas import (
+    ConsultorRutas, dijkstra_bidireccional
+)
+from tp_algos.algorithms.graphs.floyd_warshall import floyd_warshall, crear_grafo_vacio
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+from tests.generadores import costo_camino
+
+
+def red_distribucion():
+    """Red de 5 centros usada en la demo de Floyd-Warshall."""
+    grafo = crear_grafo_vacio(5)
+    rutas = [
+        (0, 1, 500), (0, 2, 300), (1, 0, 500), (1, 3, 600), (1, 4, 450),
+        (2, 0, 300), (2, 1, 350), (2, 4, 800), (3, 1, 600), (4, 1, 450), (4, 2, 750),
+    ]
+    for origen, destino, costo in rutas:
+        grafo[origen][destino] = costo
+    return grafo, ["BA", "COR", "ROS", "MDZ", "TUC"]
+
+
+class TestDijkstraBidireccional:
+    """Tests para la búsqueda bidireccional."""
+
+    @pytest.mark.parametrize("semilla", range(4))
+    def test_igual_a_floyd_warshall(self, semilla):
+        """Test que todas las rutas coinciden con Floyd-Warshall."""
+        rng = random.Random(semilla)
+        n = 25
+        grafo = GrafoDisperso(n)
+        for u in range(n):
+            for v in rng.sample(range(n), 3):
+                if u != v:
+                    grafo.agregar_arista(u, v, rng.randint(1, 20))
+        matriz = grafo.a_matriz()
+        dist_fw, _ = floyd_warshall(matriz)
+        inverso = grafo.invertido()
+
+        for o in range(n):
+            for d in range(n):
+                distancia, camino = dijkstra_bidireccional(grafo, inverso, o, d)
+                assert distancia == dist_fw[o][d]
+                if distancia != float('inf'):
+                    assert camino[0] == o and camino[-1] == d
+                    assert costo_camino(matriz, camino) == distancia
+                else:
+                    assert camino == []
+
+
+class TestConsultorRutas:
+    """Tests para ConsultorRutas."""
+
+    def test_ruta_con_nombres(self):
+        """Test con la red de distribución y nombres de centros."""
+        grafo, nombres = red_distribucion()
+        consultor = ConsultorRutas(grafo, nombres)
+
+        distancia, camino = consultor.ruta("BA", "MDZ")
+
+        assert distancia == 1100
+        assert camino == ["BA", "COR", "MDZ"]
+
+    def test_cache_aciertos_y_fallos(self):
+        """Test que las consultas repetidas desde un origen usan el caché."""
+        grafo, nombres = red_distribucion()
+        consultor = ConsultorRutas(grafo, nombres, umbral_arbol=2)
+
+        primera = consultor.ruta("BA", "TUC")
+        segunda = consultor.ruta("BA", "MDZ")
+        tercera = consultor.ruta("BA", "TUC")
+
+        assert primera == tercera
+        assert segunda[0] == 1100
+        assert consultor.fallos == 2
+        assert consultor.aciertos == 1
+        assert consultor.estadisticas()['arboles_en_cache'] == 1
+
+    def test_cache_lru_acotado(self):
+        """Test que el caché no supera su capacidad y descarta el menos usado."""
+        grafo, _ = red_distribucion()
+        consultor = ConsultorRutas(grafo, capacidad_cache=2, umbral_arbol=1)
+
+        consultor.ruta(0, 3)
+        consultor.ruta(1, 3)
+        consultor.ruta(0, 4)  # acierto: 0 pasa a ser el más reciente
+        consultor.ruta(2, 3)  # desaloja al origen 1
+
+        assert list(consultor._arboles) == [0, 2]
+        assert consultor.aciertos == 1
+
+    def test_sin_camino(self):
+        """Test cuando el destino no es alcanzable."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 1
+        consultor = ConsultorRutas(grafo)
+
+        assert consultor.ruta(1, 0) == (float('inf'), [])
+        assert consultor.ruta(0, 0) == (0, [0])
+
+    def test_rechaza_pesos_negativos(self):
+        """Test que rechaza grafos con pesos negativos."""
+        grafo = crear_grafo_vacio(2)
+        grafo[0][1] = -1
+
+        with pytest.raises(ValueError):
+            ConsultorRutas(grafo)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,11 +1,28 @@
 """
 Tests para el algoritmo Floyd-Warshall.
 """
+import io
+import json
+import random
+
 import pytest
 from tp_algos.algorithms.graphs.floyd_warshall import (
     floyd_warshall, reconstruir_camino, floyd_warshall_detallado,
-    crear_grafo_vacio
+    crear_grafo_vacio, actualizar_arista, actualizar_aristas, aumentar_arista,
+    floyd_warshall_traza, escribir_traza, CaminosPerezosos
 )
+from tests.generadores import grafo_aleatorio, costo_camino
+
+
+def verificar_caminos(grafo, dist, next_node):
+    """Verifica que cada camino reconstruido cueste lo que indica dist."""
+    n = len(grafo)
+    for i in range(n):
+        for j in range(n):
+            if i != j and dist[i][j] != float('inf'):
+                camino = reconstruir_camino(next_node, i, j)
+                assert camino[0] == i and camino[-1] == j
+                assert costo_camino(grafo, camino) == dist[i][j]
 
 
 class TestFloydWarshall:
@@ -190,6 +207,85 @@ class TestFloydWarshallDetallado:
         assert camino_xz['camino'] == ['X', 'Y', 'Z']
 
 
+class TestFloydWarshallTraza:
+    """Tests para la traza por eventos."""
+    
+    def test_eventos_en_orden(self):
+        """Test que los eventos salen en orden y sin instantáneas por defecto."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 4
+        grafo[1][2] = 3
+        grafo[0][2] = 10
+        
+        eventos = list(floyd_warshall_traza(grafo, ["A", "B", "C"]))
+        tipos = [e['tipo'] for e in eventos]
+        
+        assert tipos == ['paso', 'cambio', 'paso', 'paso', 'fin']
+        cambio = eventos[1]
+        assert (cambio['de'], cambio['a'], cambio['via']) == ("A", "C", "B")
+        assert cambio['dist_anterior'] == 10 and cambio['dist_nueva'] == 7
+        assert all('matriz' not in e for e in eventos if e['tipo'] == 'paso')
+        assert eventos[-1]['matriz_distancias'][0][2] == 7
+    
+    def test_instantaneas_muestreadas(self):
+        """Test que sólo copia la matriz en los pasos muestreados y en el último."""
+        grafo = grafo_aleatorio(7, 0.3, 0)
+        
+        pasos = [e for e in floyd_warshall_traza(grafo, instantaneas_cada=3) if e['tipo'] == 'paso']
+        
+        assert [p['k'] for p in pasos if 'matriz' in p] == [2, 5, 6]
+    
+    def test_es_perezosa(self):
+        """Test que el generador no calcula nada hasta que se consume."""
+        grafo = grafo_aleatorio(30, 0.3, 1)
+        traza = floyd_warshall_traza(grafo)
+        
+        primero = next(traza)
+        
+        assert primero['k'] == 0
+    
+    def test_detallado_compatible(self):
+        """Test que el detallado por defecto conserva las instantáneas de cada paso."""
+        grafo = grafo_aleatorio(6, 0.4, 2)
+        
+        resultado = floyd_warshall_detallado(grafo)
+        
+        assert len(resultado['pasos']) == 7
+        assert resultado['pasos'][0]['k'] == -1
+        assert resultado['pasos'][-1]['matriz'] == resultado['matriz_distancias']
+        assert sum(len(p.get('cambios', [])) for p in resultado['pasos']) == sum(
+            1 for e in floyd_warshall_traza(grafo) if e['tipo'] == 'cambio'
+        )
+    
+    def test_caminos_perezosos(self):
+        """Test que los caminos perezosos coinciden con los generados."""
+        grafo = grafo_aleatorio(8, 0.3, 3)
+        
+        completos = floyd_warshall_detallado(grafo)['todos_caminos']
+        perezosos = floyd_warshall_detallado(grafo, instantaneas_cada=0,
+                                             caminos_perezosos=True)['todos_caminos']
+        
+        assert isinstance(perezosos, CaminosPerezosos)
+        assert len(perezosos) == len(completos)
+        assert dict(perezosos.items()) == completos
+        with pytest.raises(KeyError):
+            perezosos["Nodo_0_a_Nodo_0"]
+    
+    def test_escribir_traza(self):
+        """Test que la traza se escribe como JSON, una línea por evento."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 4
+        grafo[1][2] = 3
+        salida = io.StringIO()
+        
+        escritos = escribir_traza(grafo, salida, ["A", "B", "C"])
+        lineas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        
+        assert escritos == len(lineas) == 5
+        assert lineas[1]['tipo'] == 'cambio' and lineas[1]['dist_anterior'] == '∞'
+        assert lineas[-1] == {'tipo': 'fin'}
+
+
 class TestCrearGrafoVacio:
     """Tests para la función de crear grafo vacío."""
     
@@ -250,5 +346,151 @@ class TestCasosReales:
         assert camino == [0, 1, 2, 3]
 
 
+class TestActualizacionIncremental:
+    """Tests para las actualizaciones incrementales de aristas."""
+    
+    def test_nueva_ruta_mas_barata(self):
+        """Test agregando una ruta directa barata BA -> MDZ."""
+        grafo = crear_grafo_vacio(4)
+        grafo[0][1] = 500
+        grafo[1][2] = 600
+        grafo[2][3] = 100
+        dist, next_node = floyd_warshall(grafo)
+        
+        cambios = actualizar_arista(dist, next_node, 0, 2, 700)
+        
+        assert cambios == 2  # 0->2 y 0->3
+        assert dist[0][2] == 700
+        assert dist[0][3] == 800
+        assert reconstruir_camino(next_node, 0, 3) == [0, 2, 3]
+    
+    def test_peso_mayor_no_cambia_nada(self):
+        """Test que una arista más cara que el camino actual no tiene efecto."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 1
+        grafo[1][2] = 1
+        dist, next_node = floyd_warshall(grafo)
+        
+        assert actualizar_arista(dist, next_node, 0, 2, 5) == 0
+        assert dist[0][2] == 2
+    
+    @pytest.mark.parametrize("semilla", range(4))
+    def test_lote_igual_a_recalcular(self, semilla):
+        """Test que un lote de reducciones da lo mismo que recalcular todo."""
+        rng = random.Random(semilla)
+        grafo = grafo_aleatorio(20, 0.1, semilla)
+        dist, next_node = floyd_warshall(grafo)
+        
+        aristas = [(rng.randrange(20), rng.randrange(20), rng.randint(1, 30)) for _ in range(6)]
+        aristas = [(u, v, w) for u, v, w in aristas if u != v]
+        actualizar_aristas(dist, next_node, aristas)
+        for u, v, w in aristas:
+            grafo[u][v] = min(grafo[u][v], w)
+        
+        dist_esperada, _ = floyd_warshall(grafo)
+        assert dist == dist_esperada
+        verificar_caminos(grafo, dist, next_node)
+    
+    def test_ciclo_negativo(self):
+        """Test que detecta una arista que cierra un ciclo negativo."""
+        grafo = crear_grafo_vacio(2)
+        grafo[0][1] = 3
+        dist, next_node = floyd_warshall(grafo)
+        
+        with pytest.raises(ValueError):
+            actualizar_arista(dist, next_node, 1, 0, -4)
+    
+    @pytest.mark.parametrize("semilla", range(4))
+    def test_aumento_y_eliminacion(self, semilla):
+        """Test que subir o eliminar aristas da lo mismo que recalcular todo."""
+        rng = random.Random(semilla)
+        # Pesos grandes: sin empates, cada par tiene un único camino mínimo
+        grafo = grafo_aleatorio(20, 0.2, semilla, peso_maximo=10 ** 6)
+        dist, next_node = floyd_warshall(grafo)
+        aristas = [(i, j) for i in range(20) for j in range(20)
+                   if i != j and grafo[i][j] != float('inf')]
+        
+        for u, v in rng.sample(aristas, 5):
+            nuevo = rng.choice([float('inf'), grafo[u][v] + rng.randint(1, 10 ** 5)])
+            # Filas afectadas: orígenes con algún camino mínimo que pasa por u->v
+            esperadas = [
+                i for i in range(20)
+                if any((u, v) in zip(camino, camino[1:])
+                       for camino in (reconstruir_camino(next_node, i, j) for j in range(20)))
+            ]
+            
+            filas = aumentar_arista(grafo, dist, next_node, u, v, nuevo)
+            grafo[u][v] = nuevo
+            
+            assert sorted(filas) == esperadas
+        
+        dist_esperada, _ = floyd_warshall(grafo)
+        assert dist == dist_esperada
+        verificar_caminos(grafo, dist, next_node)
+    
+    @pytest.mark.parametrize("semilla", range(30))
+    def test_aumento_con_pesos_reales(self, semilla):
+        """Test con pesos reales: las filas afectadas no dependen de comparar sumas."""
+        rng = random.Random(semilla)
+        n = 12
+        grafo = crear_grafo_vacio(n)
+        for i in range(n):
+            for j in range(n):
+                if i != j and rng.random() < 0.3:
+                    grafo[i][j] = rng.uniform(0.1, 10)
+        dist, next_node = floyd_warshall(grafo)
+        # Aristas usadas por algún camino mínimo guardado
+        usadas = sorted({(i, next_node[i][j]) for i in range(n) for j in range(n)
+                         if next_node[i][j] is not None})
+        if not usadas:
+            return
+        
+        for u, v in rng.sample(usadas, min(3, len(usadas))):
+            nuevo = rng.choice([float('inf'), grafo[u][v] + rng.uniform(1, 10)])
+            aumentar_arista(grafo, dist, next_node, u, v, nuevo)
+            grafo[u][v] = nuevo
+        
+        dist_esperada, _ = floyd_warshall(grafo)
+        for fila, esperada in zip(dist, dist_esperada):
+            assert fila == pytest.approx(esperada)
+        for i in range(n):
+            for j in range(n):
+                if i != j and dist[i][j] != float('inf'):
+                    camino = reconstruir_camino(next_node, i, j)
+                    assert costo_camino(grafo, camino) == pytest.approx(dist[i][j])
+    
+    def test_eliminar_arista_recalcula_solo_filas_afectadas(self):
+        """Test que al eliminar una arista sólo se recalculan las filas que la usaban."""
+        grafo = crear_grafo_vacio(4)
+        grafo[0][1] = 1
+        grafo[1][2] = 1
+        grafo[0][2] = 5
+        grafo[3][0] = 1
+        dist, next_node = floyd_warshall(grafo)
+        
+        filas = aumentar_arista(grafo, dist, next_node, 1, 2)
+        
+        assert sorted(filas) == [0, 1, 3]
+        assert grafo[1][2] == 1  # la matriz de adyacencia no se modifica
+        assert dist[0][2] == 5
+        assert dist[1][2] == float('inf')
+        assert dist[3][2] == 6
+    
+    def test_aumentar_arista_con_arreglos_numpy(self):
+        """Test con la matriz de adyacencia y el resultado como arreglos NumPy."""
+        np = pytest.importorskip("numpy")
+        grafo = np.array([[0, 1, 5, 9], [9, 0, 1, 9], [9, 9, 0, 1], [1, 9, 9, 0]])
+        dist, next_node = floyd_warshall(grafo, motor="numpy", compacto=True)
+        
+        filas = aumentar_arista(grafo, dist, next_node, 1, 2, 20)
+        
+        assert grafo[1][2] == 1
+        grafo[1][2] = 20
+        dist_esperada, next_esperado = floyd_warshall(grafo, motor="numpy", compacto=True)
+        assert sorted(filas) == [0, 1, 3]
+        assert (dist == dist_esperada).all()
+        assert reconstruir_camino(next_node, 0, 3) == [0, 2, 3]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
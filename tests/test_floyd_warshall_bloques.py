@@ -0,0 +1,92 @@
+"""
+Tests para Floyd-Warshall por bloques.
+"""
+
+import pytest
+from tp_algos.algorithms.graphs.floyd_warshall import (
+    floyd_warshall, reconstruir_camino, crear_grafo_vacio
+)
+from tp_algos.algorithms.graphs.floyd_warshall_bloques import (
+    floyd_warshall_bloques, rango_bloques
+)
+from tests.generadores import grafo_aleatorio, costo_camino
+
+
+class TestRangoBloques:
+    """Tests para la partición en bloques."""
+
+    def test_particion_exacta(self):
+        """Test con n múltiplo del tamaño de bloque."""
+        assert rango_bloques(8, 4) == [slice(0, 4), slice(4, 8)]
+
+    def test_ultimo_bloque_incompleto(self):
+        """Test con un último bloque más chico."""
+        assert rango_bloques(10, 4) == [slice(0, 4), slice(4, 8), slice(8, 10)]
+
+
+class TestFloydWarshallBloques:
+    """Tests que comparan la versión por bloques con la original."""
+
+    @pytest.mark.parametrize("n,tamano_bloque,semilla", [
+        (1, 4, 0),
+        (7, 3, 1),
+        (16, 4, 2),
+        (30, 7, 3),
+        (40, 64, 4),
+        (33, 1, 5),
+    ])
+    def test_mismas_distancias(self, n, tamano_bloque, semilla):
+        """Test que las distancias coinciden con floyd_warshall."""
+        grafo = grafo_aleatorio(n, 0.15, semilla)
+
+        dist_esperada, _ = floyd_warshall(grafo)
+        dist, _ = floyd_warshall(grafo, motor="bloques", tamano_bloque=tamano_bloque)
+
+        assert dist == dist_esperada
+
+    @pytest.mark.parametrize("semilla", range(3))
+    def test_caminos_validos(self, semilla):
+        """Test que cada camino reconstruido tiene el costo mínimo."""
+        n = 24
+        grafo = grafo_aleatorio(n, 0.12, semilla)
+        dist, next_node = floyd_warshall(grafo, motor="bloques", tamano_bloque=5)
+
+        for i in range(n):
+            for j in range(n):
+                if i == j or dist[i][j] == float('inf'):
+                    continue
+                camino = reconstruir_camino(next_node, i, j)
+                assert camino[0] == i and camino[-1] == j
+                assert costo_camino(grafo, camino) == dist[i][j]
+
+    def test_pesos_negativos_sin_ciclos(self):
+        """Test con aristas negativas (sin ciclos negativos)."""
+        grafo = crear_grafo_vacio(5)
+        grafo[0][1] = 4
+        grafo[1][2] = -2
+        grafo[2][3] = 3
+        grafo[0][3] = 10
+        grafo[3][4] = -1
+
+        dist_esperada, _ = floyd_warshall(grafo)
+        dist, _ = floyd_warshall(grafo, motor="bloques", tamano_bloque=2)
+
+        assert dist == dist_esperada
+
+    def test_no_modifica_grafo(self):
+        """Test que el grafo de entrada no se modifica."""
+        grafo = grafo_aleatorio(10, 0.3, 9)
+        copia = [fila[:] for fila in grafo]
+
+        floyd_warshall_bloques(grafo, tamano_bloque=3)
+
+        assert grafo == copia
+
+    def test_tamano_bloque_invalido(self):
+        """Test que rechaza bloques de tamaño no positivo."""
+        with pytest.raises(ValueError):
+            floyd_warshall_bloques(crear_grafo_vacio(3), tamano_bloque=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
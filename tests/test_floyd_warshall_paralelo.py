@@ -0,0 +1,52 @@
+"""
+Tests para Floyd-Warshall paralelo.
+"""
+
+import pytest
+from tp_algos.algorithms.graphs.floyd_warshall import floyd_warshall, crear_grafo_vacio
+from tp_algos.algorithms.graphs.floyd_warshall_bloques import floyd_warshall_bloques
+from tp_algos.algorithms.graphs.floyd_warshall_paralelo import floyd_warshall_paralelo
+from tests.generadores import grafo_aleatorio
+
+
+class TestFloydWarshallParalelo:
+    """Tests para floyd_warshall_paralelo."""
+
+    def test_mismas_distancias(self):
+        """Test que con varios procesos da las mismas distancias."""
+        grafo = grafo_aleatorio(40, 0.1, 0)
+
+        dist_esperada, _ = floyd_warshall(grafo)
+        dist, _ = floyd_warshall(grafo, motor="paralelo", workers=2,
+                                 tamano_bloque=8, umbral_paralelo=0)
+
+        assert dist == dist_esperada
+
+    def test_igual_a_version_serial_por_bloques(self):
+        """Test que reproduce exactamente la versión serial por bloques."""
+        grafo = grafo_aleatorio(30, 0.15, 1)
+
+        dist_serial, next_serial = floyd_warshall_bloques(grafo, tamano_bloque=7)
+        dist, next_node = floyd_warshall_paralelo(grafo, workers=3, tamano_bloque=7,
+                                                  umbral_paralelo=0)
+
+        assert (dist == dist_serial).all()
+        assert (next_node == next_serial).all()
+
+    def test_fallback_serial_grafo_chico(self):
+        """Test que para n chico se resuelve sin crear procesos."""
+        grafo = grafo_aleatorio(10, 0.3, 2)
+
+        dist_esperada, _ = floyd_warshall(grafo)
+        dist, _ = floyd_warshall(grafo, motor="paralelo", workers=4)
+
+        assert dist == dist_esperada
+
+    def test_workers_invalidos(self):
+        """Test que rechaza una cantidad de workers no positiva."""
+        with pytest.raises(ValueError):
+            floyd_warshall_paralelo(crear_grafo_vacio(3), workers=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
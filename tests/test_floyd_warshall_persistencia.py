@@ -0,0 +1,85 @@
+"""
+Tests para la persistencia binaria de resultados de Floyd-Warshall.
+"""
+
+import numpy as np
+import pytest
+from tp_algos.algorithms.graphs.floyd_warshall import (
+    floyd_warshall, reconstruir_camino, crear_grafo_vacio
+)
+from tp_algos.algorithms.graphs.floyd_warshall_persistencia import (
+    guardar_resultado, cargar_resultado, leer_encabezado, resultado_vigente,
+    TAMANO_ENCABEZADO
+)
+from tests.generadores import grafo_aleatorio
+
+
+class TestPersistencia:
+    """Tests de guardado y carga con memmap."""
+
+    def test_ida_y_vuelta(self, tmp_path):
+        """Test que lo cargado coincide con lo guardado."""
+        grafo = grafo_aleatorio(15, 0.2, 0)
+        dist, next_node = floyd_warshall(grafo)
+        ruta = tmp_path / "fw.bin"
+
+        guardar_resultado(ruta, dist, next_node, grafo)
+        dist_m, next_m = cargar_resultado(ruta, grafo)
+
+        assert isinstance(dist_m, np.memmap)
+        assert dist_m.tolist() == dist
+        assert [[None if j == -1 else j for j in fila] for fila in next_m.tolist()] == next_node
+
+    def test_reconstruir_camino_sobre_memmap(self, tmp_path):
+        """Test que reconstruir_camino funciona con el arreglo mapeado."""
+        grafo = grafo_aleatorio(12, 0.2, 1)
+        dist, next_node = floyd_warshall(grafo)
+        ruta = tmp_path / "fw.bin"
+        guardar_resultado(ruta, dist, next_node)
+
+        _, next_m = cargar_resultado(ruta)
+
+        for i in range(12):
+            for j in range(12):
+                assert reconstruir_camino(next_m, i, j) == reconstruir_camino(next_node, i, j)
+
+    def test_encabezado_y_tamano(self, tmp_path):
+        """Test del encabezado y del tamaño compacto (float32 + int16)."""
+        grafo = grafo_aleatorio(10, 0.3, 2)
+        dist, next_node = floyd_warshall(grafo, motor="numpy")
+        ruta = tmp_path / "fw.bin"
+
+        guardar_resultado(ruta, dist, next_node, grafo, dtype_dist=np.float32)
+        encabezado = leer_encabezado(ruta)
+
+        assert encabezado['n'] == 10
+        assert encabezado['dtype_dist'] == np.float32
+        assert encabezado['dtype_next'] == np.int16
+        assert ruta.stat().st_size == TAMANO_ENCABEZADO + 100 * 4 + 100 * 2
+
+    def test_grafo_distinto(self, tmp_path):
+        """Test que detecta que el archivo es de otro grafo."""
+        grafo = grafo_aleatorio(8, 0.3, 3)
+        ruta = tmp_path / "fw.bin"
+        guardar_resultado(ruta, *floyd_warshall(grafo), grafo)
+
+        otro = [fila[:] for fila in grafo]
+        otro[0][1] = 12345
+
+        with pytest.raises(ValueError):
+            cargar_resultado(ruta, otro)
+        assert resultado_vigente(ruta, otro) is None
+        assert resultado_vigente(ruta, grafo) is not None
+
+    def test_archivo_invalido(self, tmp_path):
+        """Test que rechaza archivos que no tienen el formato."""
+        ruta = tmp_path / "otro.bin"
+        ruta.write_bytes(b"x" * 100)
+
+        with pytest.raises(ValueError):
+            leer_encabezado(ruta)
+        assert resultado_vigente(tmp_path / "no_existe.bin", crear_grafo_vacio(2)) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
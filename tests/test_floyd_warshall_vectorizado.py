@@ -0,0 +1,102 @@
+"""
+Tests para el motor vectorizado (NumPy) de Floyd-Warshall.
+"""
+
+import numpy as np
+import pytest
+from tp_algos.algorithms.graphs.floyd_warshall import (
+    floyd_warshall, reconstruir_camino, crear_grafo_vacio, actualizar_arista
+)
+from tp_algos.algorithms.graphs.floyd_warshall_vectorizado import (
+    floyd_warshall_numpy, SIN_SIGUIENTE
+)
+from tests.generadores import grafo_aleatorio, costo_camino
+
+
+class TestFloydWarshallNumpy:
+    """Tests para floyd_warshall_numpy."""
+
+    def test_grafo_simple(self):
+        """Test con grafo simple de 3 nodos."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 4
+        grafo[1][2] = 3
+        grafo[0][2] = 10
+
+        dist, next_node = floyd_warshall_numpy(grafo)
+
+        assert dist[0][2] == 7
+        assert next_node[0][2] == 1
+        assert next_node[1][0] == SIN_SIGUIENTE
+
+    def test_dtype_contiguo(self):
+        """Test que respeta el dtype pedido y usa memoria contigua."""
+        grafo = grafo_aleatorio(6, 0.5, 1)
+
+        dist, _ = floyd_warshall_numpy(grafo, dtype=np.float32)
+
+        assert dist.dtype == np.float32
+        assert dist.flags['C_CONTIGUOUS']
+
+    @pytest.mark.parametrize("semilla", range(5))
+    def test_igual_a_version_python(self, semilla):
+        """Test que da exactamente el mismo resultado que el triple ciclo."""
+        grafo = grafo_aleatorio(25, 0.2, semilla)
+
+        dist_py, next_py = floyd_warshall(grafo)
+        dist_np, next_np = floyd_warshall(grafo, motor="numpy")
+
+        assert dist_np == dist_py
+        assert next_np == next_py
+
+    def test_float32_mismas_distancias(self):
+        """Test con float32: pesos enteros chicos se representan exactos."""
+        grafo = grafo_aleatorio(20, 0.3, 7)
+
+        dist_py, _ = floyd_warshall(grafo)
+        dist_np, _ = floyd_warshall(grafo, motor="numpy", dtype=np.float32)
+
+        assert dist_np == dist_py
+
+    def test_caminos_reconstruidos(self):
+        """Test que los caminos reconstruidos tienen el costo mínimo."""
+        grafo = grafo_aleatorio(15, 0.25, 3)
+        dist, next_node = floyd_warshall(grafo, motor="numpy")
+
+        for i in range(15):
+            for j in range(15):
+                camino = reconstruir_camino(next_node, i, j)
+                if i != j and dist[i][j] != float('inf'):
+                    assert camino[0] == i and camino[-1] == j
+                    assert costo_camino(grafo, camino) == dist[i][j]
+
+    def test_grafo_vacio(self):
+        """Test con grafo sin nodos."""
+        dist, next_node = floyd_warshall(crear_grafo_vacio(0), motor="numpy")
+
+        assert dist == []
+        assert next_node == []
+
+    def test_actualizar_arista_sobre_arreglos(self):
+        """Test que la actualización incremental funciona sobre arreglos NumPy."""
+        grafo = grafo_aleatorio(20, 0.15, 11)
+        dist, next_node = floyd_warshall_numpy(grafo)
+
+        actualizar_arista(dist, next_node, 3, 17, 2)
+        grafo[3][17] = min(grafo[3][17], 2)
+
+        dist_esperada, _ = floyd_warshall(grafo)
+        assert dist.tolist() == dist_esperada
+        for i in range(20):
+            for j in range(20):
+                if i != j and dist[i][j] != float('inf'):
+                    assert costo_camino(grafo, reconstruir_camino(next_node, i, j)) == dist[i][j]
+
+    def test_motor_desconocido(self):
+        """Test que rechaza motores inexistentes."""
+        with pytest.raises(ValueError):
+            floyd_warshall(crear_grafo_vacio(2), motor="fortran")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,28 @@
+from tp_algos.algorithms.graphs.floyd_warshall import crear_grafo_vacio
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+
+
+def test_agregar_aristas():
+    g = GrafoDisperso(3)
+    g.agregar_arista(0, 1, 5)
+    g.agregar_arista(1, 2, 3)
+    assert g.cantidad_aristas() == 2
+    assert sorted(g.aristas()) == [(0, 1, 5), (1, 2, 3)]
+
+
+def test_desde_matriz_y_vuelta():
+    matriz = crear_grafo_vacio(4)
+    matriz[0][1] = 2
+    matriz[2][3] = -1
+    matriz[3][0] = 7
+    g = GrafoDisperso.desde_matriz(matriz)
+    assert g.cantidad_aristas() == 3
+    assert g.a_matriz() == matriz
+
+
+def test_invertido():
+    g = GrafoDisperso(3)
+    g.agregar_arista(0, 1, 4)
+    g.agregar_arista(0, 2, 1)
+    inv = g.invertido()
+    assert sorted(inv.aristas()) == [(1, 0, 4), (2, 0, 1)]
@@ -0,0 +1,108 @@
+"""
+Tests para el algoritmo de Johnson.
+"""
+import random
+
+import pytest
+from tp_algos.algorithms.graphs.floyd_warshall import (
+    floyd_warshall, reconstruir_camino, crear_grafo_vacio
+)
+from tp_algos.algorithms.graphs.johnson import johnson, ResultadoPerezoso
+from tp_algos.structures.grafo_disperso import GrafoDisperso
+from tests.generadores import costo_camino
+
+
+def grafo_disperso_aleatorio(n, grado, semilla, negativos=False):
+    """
+    Genera un grafo disperso aleatorio. Con `negativos`, repesa las aristas con
+    potenciales al azar: aparecen pesos negativos pero ningún ciclo negativo.
+    """
+    rng = random.Random(semilla)
+    potencial = [rng.randint(0, 30) if negativos else 0 for _ in range(n)]
+    grafo = GrafoDisperso(n)
+    for u in range(n):
+        for v in rng.sample(range(n), min(grado, n)):
+            if u != v:
+                grafo.agregar_arista(u, v, rng.randint(1, 50) + potencial[u] - potencial[v])
+    return grafo
+
+
+class TestJohnson:
+    """Tests que comparan Johnson contra Floyd-Warshall."""
+
+    def test_grafo_simple(self):
+        """Test con el grafo simple de 3 nodos."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 4
+        grafo[1][2] = 3
+        grafo[0][2] = 10
+
+        dist, next_node = johnson(grafo)
+
+        assert dist[0][2] == 7
+        assert reconstruir_camino(next_node, 0, 2) == [0, 1, 2]
+        assert reconstruir_camino(next_node, 2, 0) == []
+
+    @pytest.mark.parametrize("semilla,negativos", [(0, False), (1, False), (2, True), (3, True)])
+    def test_igual_a_floyd_warshall(self, semilla, negativos):
+        """Test que las distancias coinciden con Floyd-Warshall."""
+        grafo = grafo_disperso_aleatorio(30, 3, semilla, negativos)
+        matriz = grafo.a_matriz()
+
+        dist_fw, _ = floyd_warshall(matriz)
+        dist, next_node = johnson(grafo)
+
+        assert dist == dist_fw
+        for i in range(30):
+            for j in range(30):
+                if i != j and dist[i][j] != float('inf'):
+                    camino = reconstruir_camino(next_node, i, j)
+                    assert costo_camino(matriz, camino) == dist[i][j]
+
+    def test_ciclo_negativo(self):
+        """Test que detecta un ciclo de peso negativo."""
+        grafo = GrafoDisperso(3)
+        grafo.agregar_arista(0, 1, 1)
+        grafo.agregar_arista(1, 2, -3)
+        grafo.agregar_arista(2, 0, 1)
+
+        with pytest.raises(ValueError):
+            johnson(grafo)
+
+    def test_grafo_vacio(self):
+        """Test con grafo sin nodos."""
+        assert johnson(GrafoDisperso(0)) == ([], [])
+
+
+class TestJohnsonPerezoso:
+    """Tests para el resultado perezoso."""
+
+    def test_filas_bajo_demanda(self):
+        """Test que sólo calcula las filas que se consultan."""
+        grafo = grafo_disperso_aleatorio(20, 3, 4, negativos=True)
+        dist_fw, _ = floyd_warshall(grafo.a_matriz())
+
+        resultado = johnson(grafo, perezoso=True)
+
+        assert isinstance(resultado, ResultadoPerezoso)
+        assert resultado.dist[5] == dist_fw[5]
+        assert len(resultado._filas) == 1
+
+    def test_reconstruir_camino_perezoso(self):
+        """Test que reconstruir_camino funciona sobre la vista perezosa."""
+        grafo = grafo_disperso_aleatorio(25, 2, 5)
+        matriz = grafo.a_matriz()
+        dist_fw, _ = floyd_warshall(matriz)
+
+        resultado = johnson(grafo, perezoso=True, max_filas=4)
+
+        for destino in range(25):
+            camino = reconstruir_camino(resultado.next_node, 0, destino)
+            if destino != 0 and dist_fw[0][destino] != float('inf'):
+                assert costo_camino(matriz, camino) == dist_fw[0][destino]
+                assert resultado.camino(0, destino)[-1] == destino
+        assert len(resultado._filas) <= 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
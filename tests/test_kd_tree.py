@@ -0,0 +1,48 @@
+import math
+import random
+
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair, distancia
+from tp_algos.structures.kd_tree import KDTree
+from tests.generadores import puntos_aleatorios
+
+
+def test_vecino_mas_cercano():
+    puntos = [(0, 0), (10, 10), (3, 4), (-5, 2)]
+    arbol = KDTree(puntos)
+    assert arbol.vecino_mas_cercano((2.5, 3.5)) == (distancia((2.5, 3.5), (3, 4)), 2)
+    assert KDTree([]).vecino_mas_cercano((1, 1)) == (math.inf, None)
+
+
+def test_consultas_contra_fuerza_bruta():
+    puntos = puntos_aleatorios(500, 1)
+    arbol = KDTree(puntos)
+    rng = random.Random(2)
+    for _ in range(50):
+        q = (rng.uniform(-110, 110), rng.uniform(-110, 110))
+        distancias = sorted((distancia(q, p), i) for i, p in enumerate(puntos))
+
+        assert arbol.vecino_mas_cercano(q) == distancias[0]
+        assert [d for d, _ in arbol.k_vecinos(q, 7)] == [d for d, _ in distancias[:7]]
+        assert arbol.en_radio(q, 12.5) == sorted(i for d, i in distancias if d <= 12.5)
+
+
+def test_k_mayor_que_n():
+    arbol = KDTree([(0, 0), (1, 1)])
+    assert [i for _, i in arbol.k_vecinos((0.1, 0), 5)] == [0, 1]
+
+
+def test_todos_los_vecinos_y_par_mas_cercano():
+    puntos = puntos_aleatorios(400, 3) + [(50.0, 50.0), (50.0, 50.0)]
+    arbol = KDTree(puntos)
+    vecinos, par = arbol.todos_los_vecinos()
+    for i, (d, j) in enumerate(vecinos):
+        assert j != i
+        assert d == min(distancia(puntos[i], p) for k, p in enumerate(puntos) if k != i)
+    assert par[0] == closest_pair(puntos)[0] == 0
+
+
+def test_par_mas_cercano_igual_a_closest_pair():
+    puntos = puntos_aleatorios(2000, 4)
+    _, par = KDTree(puntos).todos_los_vecinos()
+    assert par[0] == closest_pair(puntos)[0]
+    assert distancia(par[1], par[2]) == par[0]
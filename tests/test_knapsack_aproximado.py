@@ -0,0 +1,71 @@
+"""
+Tests para el FPTAS de mochila 0/1 y la cota fraccionaria.
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import (
+    knapsack_01, knapsack_01_aproximado, cota_fraccionaria
+)
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackAproximado:
+    """Tests para knapsack_01_aproximado."""
+
+    @pytest.mark.parametrize("eps", [0.5, 0.1, 0.01])
+    @pytest.mark.parametrize("semilla", range(15))
+    def test_garantia_de_aproximacion(self, semilla, eps):
+        """Test que valor >= (1 - eps) * OPT y que la cota acota el error real."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 15, 20, 1000, 60, n_minimo=1)
+
+        optimo = knapsack_01(pesos, valores, capacidad, formulacion="peso")
+        valor, items, cota = knapsack_01_aproximado(pesos, valores, capacidad, eps)
+
+        assert sum(pesos[i] for i in items) <= capacidad
+        assert sum(valores[i] for i in items) == valor
+        assert valor >= (1 - eps) * optimo
+        assert optimo - valor <= cota
+
+    def test_exacto_con_valores_chicos(self):
+        """Test que sin necesidad de escalar devuelve el óptimo con cota 0."""
+        valor, items, cota = knapsack_01_aproximado([2, 3, 4, 5], [3, 4, 5, 6], 8, eps=0.5)
+
+        assert (valor, cota) == (10, 0)
+        assert items == [1, 3]
+
+    def test_valores_reales(self):
+        """Test con valores no enteros: siempre escala y da una cota positiva."""
+        pesos = [10, 20, 30]
+        valores = [60.5, 100.25, 120.75]
+
+        valor, items, cota = knapsack_01_aproximado(pesos, valores, 50, eps=0.1)
+
+        assert 221.0 - valor <= cota
+        assert valor >= 0.9 * 221.0
+
+    def test_eps_invalido(self):
+        """Test que eps debe estar en (0, 1)."""
+        with pytest.raises(ValueError):
+            knapsack_01_aproximado([1], [1], 1, eps=0)
+
+    def test_sin_objetos_que_entren(self):
+        """Test con ningún objeto que quepa."""
+        assert knapsack_01_aproximado([5, 6], [10, 20], 4) == (0, [], 0)
+
+
+class TestCotaFraccionaria:
+    """Tests para la cota de la mochila fraccionaria."""
+
+    def test_ejemplo_clasico(self):
+        """Test con el ejemplo clásico (óptimo fraccionario 240)."""
+        assert cota_fraccionaria([10, 20, 30], [60, 100, 120], 50) == 240
+
+    @pytest.mark.parametrize("semilla", range(10))
+    def test_acota_al_optimo(self, semilla):
+        """Test que la cota nunca es menor que el óptimo entero."""
+        pesos, valores, _ = mochila_aleatoria(semilla, 10, 15, 40, n_minimo=10)
+
+        assert cota_fraccionaria(pesos, valores, 30) >= knapsack_01(pesos, valores, 30, formulacion="peso")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Tests para la mochila 0/1 por Branch and Bound.
+"""
+import random
+
+import pytest
+from tp_algos.algorithms.branch_and_bound.knapsack_bb import knapsack_01_bb
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01, cota_fraccionaria
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackBB:
+    """Tests para knapsack_01_bb."""
+
+    def test_ejemplo_simple(self):
+        """Test con ejemplo simple."""
+        assert knapsack_01_bb([2, 3, 4, 5], [3, 4, 5, 6], 8) == (10, [1, 3], 10)
+
+    @pytest.mark.parametrize("semilla", range(40))
+    def test_optimo_demostrado(self, semilla):
+        """Test con instancias aleatorias: mismo valor que la DP y cota igual al valor."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 16, 15, 40, 50)
+
+        valor, items, cota = knapsack_01_bb(pesos, valores, capacidad)
+
+        assert valor == knapsack_01(pesos, valores, capacidad, formulacion="peso")
+        assert cota == valor
+        assert sum(pesos[i] for i in items) <= capacidad
+        assert sum(valores[i] for i in items) == valor
+
+    def test_capacidad_enorme(self):
+        """Test con pesos y capacidad del orden de 10⁹."""
+        rng = random.Random(3)
+        pesos = [rng.randint(10 ** 8, 10 ** 9) for _ in range(60)]
+        valores = [p // 1000 + rng.randint(0, 10 ** 5) for p in pesos]
+        capacidad = sum(pesos) // 3
+
+        valor, items, cota = knapsack_01_bb(pesos, valores, capacidad)
+
+        assert cota == valor
+        assert sum(pesos[i] for i in items) <= capacidad
+        assert valor <= cota_fraccionaria(pesos, valores, capacidad)
+
+    def test_presupuesto_de_nodos(self):
+        """Test que con presupuesto agotado devuelve una solución factible y una cota válida."""
+        rng = random.Random(5)
+        pesos = [rng.randint(1, 100) for _ in range(40)]
+        valores = [p + rng.randint(0, 10) for p in pesos]
+        capacidad = 1000
+
+        optimo, _, _ = knapsack_01_bb(pesos, valores, capacidad)
+        valor, items, cota = knapsack_01_bb(pesos, valores, capacidad, max_nodos=1)
+
+        assert sum(pesos[i] for i in items) <= capacidad
+        assert valor <= optimo <= cota
+
+    def test_limite_de_tiempo(self):
+        """Test que con tiempo_limite=0 devuelve la solución golosa inicial."""
+        valor, items, cota = knapsack_01_bb([10, 20, 30], [60, 100, 120], 50, tiempo_limite=0)
+
+        assert (valor, items) == (160, [0, 1])
+        assert cota >= 220
+
+    def test_sin_objetos(self):
+        """Test con lista vacía de objetos."""
+        assert knapsack_01_bb([], [], 10) == (0, [], 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,52 @@
+"""
+Tests para la mochila 0/1 con tabla de decisiones en bits.
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01_con_items, knapsack_01_detallado
+from tp_algos.algorithms.dp.knapsack_bits import knapsack_01_bits, TablaDecisiones
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackBits:
+    """Tests para knapsack_01_bits y el modo reconstruccion="bits"."""
+
+    def test_ejemplo_simple(self):
+        """Test con ejemplo simple."""
+        valor, items = knapsack_01_con_items([2, 3, 4, 5], [3, 4, 5, 6], 8, reconstruccion="bits")
+
+        assert valor == 10
+        assert items == [1, 3]
+
+    @pytest.mark.parametrize("semilla", range(40))
+    def test_mismos_items_que_la_tabla(self, semilla):
+        """Test que elige exactamente los mismos objetos que la tabla, incluso con empates."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 14, 8, 6, 30)
+
+        assert knapsack_01_bits(pesos, valores, capacidad) == knapsack_01_con_items(pesos, valores, capacidad)
+
+    def test_valores_reales(self):
+        """Test con valores no enteros."""
+        pesos, valores = [3, 4, 5, 2], [1.5, 2.25, 3.1, 0.7]
+
+        assert knapsack_01_bits(pesos, valores, 9) == knapsack_01_con_items(pesos, valores, 9)
+
+    def test_tamano_tabla(self):
+        """Test que la tabla ocupa un bit por celda (redondeado a bytes por fila)."""
+        tabla = TablaDecisiones(100, 1000)
+
+        assert tabla.nbytes == 100 * 126
+
+    def test_detallado_sin_tabla(self):
+        """Test del modo detallado con decisiones en bits."""
+        pesos, valores = [23, 31, 29, 44, 53], [92, 57, 49, 68, 60]
+
+        resultado = knapsack_01_detallado(pesos, valores, 100, reconstruccion="bits")
+        esperado = knapsack_01_detallado(pesos, valores, 100)
+
+        assert resultado['tabla_dp'] is None
+        assert resultado['items_seleccionados'] == esperado['items_seleccionados']
+        assert resultado['valor_maximo'] == esperado['valor_maximo']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,61 @@
+"""
+Tests para la reconstrucción de la mochila 0/1 en memoria lineal (Hirschberg).
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01_con_items, knapsack_01_detallado
+from tp_algos.algorithms.dp.knapsack_hirschberg import knapsack_01_hirschberg
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackHirschberg:
+    """Tests para knapsack_01_hirschberg y el modo reconstruccion="hirschberg"."""
+
+    def test_ejemplo_simple(self):
+        """Test con ejemplo simple de solución única."""
+        resultado = knapsack_01_con_items([2, 3, 4, 5], [3, 4, 5, 6], 8, reconstruccion="hirschberg")
+
+        assert resultado == knapsack_01_con_items([2, 3, 4, 5], [3, 4, 5, 6], 8)
+
+    @pytest.mark.parametrize("semilla", range(40))
+    def test_solucion_optima_y_factible(self, semilla):
+        """Test que el valor coincide con la tabla y los objetos lo realizan."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, peso_maximo=12)
+
+        valor, items = knapsack_01_hirschberg(pesos, valores, capacidad)
+        valor_tabla, _ = knapsack_01_con_items(pesos, valores, capacidad)
+
+        assert valor == valor_tabla
+        assert items == sorted(set(items))
+        assert sum(pesos[i] for i in items) <= capacidad
+        assert sum(valores[i] for i in items) == valor
+
+    def test_mismos_items_sin_empates(self):
+        """Test que con solución óptima única elige los mismos objetos que la tabla."""
+        pesos = [23, 31, 29, 44, 53, 38, 63, 85, 89, 82]
+        valores = [92, 57, 49, 68, 60, 43, 67, 84, 87, 72]
+
+        assert knapsack_01_hirschberg(pesos, valores, 165) == knapsack_01_con_items(pesos, valores, 165)
+
+    def test_sin_objetos(self):
+        """Test con lista vacía de objetos."""
+        assert knapsack_01_hirschberg([], [], 10) == (0, [])
+
+    def test_detallado_sin_tabla(self):
+        """Test que el modo detallado no arma la tabla y conserva el resto de los campos."""
+        pesos, valores = [2, 3, 4, 5], [3, 4, 5, 6]
+
+        resultado = knapsack_01_detallado(pesos, valores, 8, reconstruccion="hirschberg")
+        esperado = knapsack_01_detallado(pesos, valores, 8)
+
+        assert resultado['tabla_dp'] is None
+        for clave in ('valor_maximo', 'items_seleccionados', 'peso_total', 'solucion_detallada'):
+            assert resultado[clave] == esperado[clave]
+
+    def test_modo_desconocido(self):
+        """Test que rechaza modos de reconstrucción inexistentes."""
+        with pytest.raises(ValueError):
+            knapsack_01_con_items([1], [1], 1, reconstruccion="magia")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+Tests para el estado incremental de la mochila 0/1.
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01, knapsack_01_con_items, knapsack_01_optimizado
+from tp_algos.algorithms.dp.knapsack_incremental import KnapsackState
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackState:
+    """Tests para KnapsackState."""
+
+    @pytest.mark.parametrize("semilla", range(10))
+    def test_igual_a_recalcular(self, semilla):
+        """Test que después de cada objeto agregado coincide con recalcular todo."""
+        estado = KnapsackState(30, guardar_decisiones=True)
+        nuevos_pesos, nuevos_valores, _ = mochila_aleatoria(semilla, 15, n_minimo=15)
+        pesos, valores = [], []
+        for peso, valor in zip(nuevos_pesos, nuevos_valores):
+            estado.agregar_item(peso, valor)
+            pesos.append(peso)
+            valores.append(valor)
+
+            assert estado.mejor_valor() == knapsack_01(pesos, valores, 30, formulacion="peso")
+            assert estado.items() == knapsack_01_con_items(pesos, valores, 30, formulacion="peso")[1]
+
+    def test_capacidades_menores(self):
+        """Test que responde cualquier capacidad hasta la del estado."""
+        estado = KnapsackState(8, guardar_decisiones=True)
+        for peso, valor in zip([2, 3, 4, 5], [3, 4, 5, 6]):
+            estado.agregar_item(peso, valor)
+
+        assert [estado.mejor_valor(c) for c in range(9)] == [0, 0, 3, 4, 5, 7, 8, 9, 10]
+        assert estado.items(5) == [0, 1]
+        with pytest.raises(ValueError):
+            estado.mejor_valor(9)
+
+    def test_valores_reales(self):
+        """Test que pasa a float64 al agregar un valor no entero."""
+        estado = KnapsackState(5)
+        estado.agregar_item(2, 3)
+        estado.agregar_item(3, 1.5)
+
+        assert estado.mejor_valor() == 4.5
+
+    def test_valores_que_desbordan_int64(self):
+        """Test que pasa a enteros de Python cuando la suma puede exceder int64."""
+        estado = KnapsackState(2, guardar_decisiones=True)
+        estado.agregar_item(1, 2 ** 62)
+        estado.agregar_item(1, 2 ** 62)
+
+        assert estado.mejor_valor() == 2 ** 63
+        assert estado.mejor_valor() == knapsack_01_optimizado([1, 1], [2 ** 62, 2 ** 62], 2, motor="numpy")
+        assert estado.items() == [0, 1]
+        with pytest.raises(ValueError):
+            estado.guardar("no_se_escribe.bin")
+
+    def test_items_sin_decisiones(self):
+        """Test que sin decisiones no se pueden pedir los objetos."""
+        estado = KnapsackState(5)
+        estado.agregar_item(1, 1)
+
+        with pytest.raises(ValueError):
+            estado.items()
+
+    @pytest.mark.parametrize("con_decisiones", [True, False])
+    def test_guardar_y_cargar(self, tmp_path, con_decisiones):
+        """Test que un estado cargado sigue igual y admite más objetos."""
+        ruta = tmp_path / "estado.bin"
+        nuevos_pesos, nuevos_valores, _ = mochila_aleatoria(4, 20, n_minimo=20)
+        objetos = list(zip(nuevos_pesos, nuevos_valores))
+        estado = KnapsackState(25, guardar_decisiones=con_decisiones)
+        for peso, valor in objetos[:12]:
+            estado.agregar_item(peso, valor)
+
+        estado.guardar(ruta)
+        cargado = KnapsackState.cargar(ruta)
+        for peso, valor in objetos[12:]:
+            estado.agregar_item(peso, valor)
+            cargado.agregar_item(peso, valor)
+
+        assert len(cargado) == 20
+        assert cargado.pesos == estado.pesos
+        assert [cargado.mejor_valor(c) for c in range(26)] == [estado.mejor_valor(c) for c in range(26)]
+        if con_decisiones:
+            assert cargado.items() == estado.items()
+
+    def test_archivo_invalido(self, tmp_path):
+        """Test que rechaza archivos que no son estados de mochila."""
+        ruta = tmp_path / "otro.bin"
+        ruta.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError):
+            KnapsackState.cargar(ruta)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
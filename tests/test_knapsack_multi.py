@@ -0,0 +1,39 @@
+"""
+Tests para la mochila 0/1 con varias capacidades en una pasada.
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import (
+    knapsack_01, knapsack_01_con_items, knapsack_01_multi
+)
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackMulti:
+    """Tests para knapsack_01_multi."""
+
+    @pytest.mark.parametrize("semilla", range(20))
+    def test_igual_a_resolver_cada_capacidad(self, semilla):
+        """Test que cada respuesta coincide con resolver esa capacidad por separado."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 12)
+        capacidades = [capacidad, 0, 7, 19, 40, capacidad // 2]
+
+        assert knapsack_01_multi(pesos, valores, capacidades) == [
+            knapsack_01(pesos, valores, c, formulacion="peso") for c in capacidades
+        ]
+        assert knapsack_01_multi(pesos, valores, capacidades, con_items=True) == [
+            knapsack_01_con_items(pesos, valores, c, formulacion="peso") for c in capacidades
+        ]
+
+    def test_orden_y_repetidos(self):
+        """Test que respeta el orden pedido y admite capacidades repetidas."""
+        pesos, valores = [2, 3, 4, 5], [3, 4, 5, 6]
+
+        assert knapsack_01_multi(pesos, valores, [8, 0, 5, 8]) == [10, 0, 7, 10]
+
+    def test_sin_capacidades(self):
+        """Test con lista vacía de capacidades."""
+        assert knapsack_01_multi([1, 2], [3, 4], []) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,50 @@
+"""
+Tests para la mochila 0/1 paralela sobre tramos de capacidad.
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01, knapsack_01_optimizado
+from tp_algos.algorithms.dp.knapsack_paralelo import knapsack_01_paralelo, _tramos
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackParalelo:
+    """Tests para knapsack_01_paralelo (con umbral bajo para forzar el pool)."""
+
+    @pytest.mark.parametrize("semilla", range(3))
+    def test_igual_a_knapsack_01(self, semilla):
+        """Test que el resultado paralelo coincide con la DP serial."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 25, 60, 100, 300, n_minimo=25,
+                                                      capacidad_minima=100)
+
+        resultado = knapsack_01_paralelo(pesos, valores, capacidad, workers=3, umbral_paralelo=0)
+
+        assert resultado == knapsack_01(pesos, valores, capacidad, formulacion="peso")
+
+    def test_valores_reales(self):
+        """Test con valores no enteros (filas float64 compartidas)."""
+        pesos, valores = [3, 4, 5, 2], [1.5, 2.25, 3.1, 0.7]
+
+        resultado = knapsack_01_optimizado(pesos, valores, 9, motor="paralelo",
+                                           workers=2, umbral_paralelo=0)
+
+        assert resultado == knapsack_01(pesos, valores, 9)
+
+    def test_mas_workers_que_capacidades(self):
+        """Test con más procesos que capacidades posibles."""
+        assert knapsack_01_paralelo([1, 2], [5, 7], 2, workers=4, umbral_paralelo=0) == 7
+
+    def test_tramos_cubren_el_rango(self):
+        """Test que los tramos son contiguos y cubren 0..largo."""
+        tramos = _tramos(10, 3)
+
+        assert tramos[0][0] == 0 and tramos[-1][1] == 10
+        assert all(a[1] == b[0] for a, b in zip(tramos, tramos[1:]))
+
+    def test_workers_invalidos(self):
+        """Test que rechaza una cantidad de workers no positiva."""
+        with pytest.raises(ValueError):
+            knapsack_01_paralelo([1], [1], 1, workers=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
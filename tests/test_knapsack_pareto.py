@@ -0,0 +1,60 @@
+"""
+Tests para la mochila 0/1 sobre el frente de Pareto.
+"""
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01_con_items
+from tp_algos.algorithms.dp.knapsack_pareto import knapsack_01_pareto, frente_pareto
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackPareto:
+    """Tests para knapsack_01_pareto."""
+
+    def test_ejemplo_simple(self):
+        """Test con ejemplo simple."""
+        assert knapsack_01_pareto([2, 3, 4, 5], [3, 4, 5, 6], 8) == (10, [1, 3])
+
+    @pytest.mark.parametrize("semilla", range(40))
+    def test_igual_valor_que_la_tabla(self, semilla):
+        """Test con instancias aleatorias: mismo valor óptimo y solución factible."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, valor_maximo=20)
+
+        valor, items = knapsack_01_pareto(pesos, valores, capacidad)
+
+        assert valor == knapsack_01_con_items(pesos, valores, capacidad)[0]
+        assert sum(pesos[i] for i in items) <= capacidad
+        assert sum(valores[i] for i in items) == valor
+
+    def test_frente_no_dominado(self):
+        """Test que el frente tiene pesos y valores estrictamente crecientes."""
+        for pesos, valores in (([3, 4, 5, 2, 7], [4, 5, 6, 3, 9]), ([3, 3, 2, 1], [4, 5, 6, 6])):
+            frente = frente_pareto(pesos, valores, 12)
+
+            pesos_frente = [w for w, _, _ in frente]
+            valores_frente = [v for _, v, _ in frente]
+            assert all(a < b for a, b in zip(pesos_frente, pesos_frente[1:]))
+            assert all(a < b for a, b in zip(valores_frente, valores_frente[1:]))
+
+    def test_mismo_peso_se_colapsa(self):
+        """Test que de dos estados con el mismo peso queda sólo el de más valor."""
+        frente = frente_pareto([3, 3], [4, 5], 10)
+
+        assert [(w, v) for w, v, _ in frente] == [(0, 0), (3, 5), (6, 9)]
+
+    def test_capacidad_enorme(self):
+        """Test con pesos en gramos hasta 10⁹: no depende de W."""
+        pesos = [400_000_000, 350_000_000, 300_000_000, 999_999_999]
+        valores = [40, 36, 31, 90]
+
+        valor, items = knapsack_01_pareto(pesos, valores, 1_050_000_000)
+
+        assert valor == 107
+        assert items == [0, 1, 2]
+
+    def test_sin_objetos(self):
+        """Test con lista vacía de objetos."""
+        assert knapsack_01_pareto([], [], 10) == (0, [])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
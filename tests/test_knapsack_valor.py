@@ -0,0 +1,103 @@
+"""
+Tests para la mochila 0/1 indexada por valor.
+"""
+import pytest
+from tp_algos.algorithms.dp import knapsack_valor
+from tp_algos.algorithms.dp.knapsack_01 import (
+    knapsack_01, knapsack_01_con_items, knapsack_01_detallado
+)
+from tp_algos.algorithms.dp.knapsack_valor import (
+    knapsack_01_por_valor, knapsack_01_por_valor_con_items
+)
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackPorValor:
+    """Tests para la formulación por valor y la elección automática."""
+
+    @pytest.mark.parametrize("semilla", range(40))
+    def test_igual_a_la_tabla_por_peso(self, semilla):
+        """Test que da el mismo valor y los mismos objetos, incluso con empates."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 12, 8, 6, 30)
+
+        esperado = knapsack_01_con_items(pesos, valores, capacidad, formulacion="peso")
+
+        assert knapsack_01_por_valor_con_items(pesos, valores, capacidad) == esperado
+        assert knapsack_01_por_valor(pesos, valores, capacidad) == esperado[0]
+
+    def test_pesos_enormes(self):
+        """Test con pesos de hasta 10¹²: la formulación automática usa el valor."""
+        pesos = [10 ** 12, 5 * 10 ** 11, 6 * 10 ** 11, 3 * 10 ** 11]
+        valores = [3, 2, 2, 1]
+        capacidad = 11 * 10 ** 11
+
+        assert knapsack_01(pesos, valores, capacidad, formulacion="auto") == 4
+        assert knapsack_01_con_items(pesos, valores, capacidad, formulacion="auto") == (4, [1, 2])
+
+    def test_valores_reales_usan_peso(self):
+        """Test que con valores no enteros "auto" sigue indexando por peso."""
+        assert knapsack_01([1, 2], [0.5, 1.5], 100, formulacion="auto") == 2.0
+
+    def test_formulacion_valor_rechaza_reales(self):
+        """Test que la formulación por valor exige enteros no negativos."""
+        with pytest.raises(ValueError):
+            knapsack_01([1, 2], [0.5, 1.5], 3, formulacion="valor")
+
+    def test_formulacion_desconocida(self):
+        """Test que rechaza formulaciones inexistentes."""
+        with pytest.raises(ValueError):
+            knapsack_01([1], [1], 1, formulacion="volumen")
+        with pytest.raises(ValueError):
+            knapsack_01_con_items([1], [1], 1, reconstruccion="bits", formulacion="volumen")
+
+    def test_formulacion_valor_exige_tabla(self):
+        """Test que la formulación por valor no se combina con otra reconstrucción."""
+        with pytest.raises(ValueError):
+            knapsack_01_con_items([1, 2], [3, 4], 3, reconstruccion="bits", formulacion="valor")
+        # "auto" con otra reconstrucción indexa por peso
+        assert knapsack_01_con_items([1, 2], [3, 4], 100, reconstruccion="bits", formulacion="auto") == (7, [0, 1])
+
+    def test_por_defecto_elige_automaticamente(self, monkeypatch):
+        """Test que sin formulación explícita se indexa por valor cuando la tabla es más angosta."""
+        llamadas = []
+        def registrar(funcion):
+            def envoltura(*args):
+                llamadas.append(funcion.__name__)
+                return funcion(*args)
+            return envoltura
+        monkeypatch.setattr(knapsack_valor, "knapsack_01_por_valor", registrar(knapsack_01_por_valor))
+        monkeypatch.setattr(knapsack_valor, "knapsack_01_por_valor_con_items",
+                            registrar(knapsack_01_por_valor_con_items))
+
+        # sum(valores) < capacidad: se indexa por valor
+        assert knapsack_01([2, 3], [1, 1], 10) == 2
+        assert knapsack_01_con_items([2, 3], [1, 1], 10) == (2, [0, 1])
+        assert llamadas == ["knapsack_01_por_valor", "knapsack_01_por_valor_con_items"]
+
+        # sum(valores) >= capacidad: sigue la tabla por peso
+        assert knapsack_01([2, 3], [5, 6], 4) == 6
+        assert len(llamadas) == 2
+
+    def test_detallado_con_formulacion(self):
+        """Test que el modo detallado también elige la formulación."""
+        pesos = [10 ** 12, 5 * 10 ** 11, 6 * 10 ** 11, 3 * 10 ** 11]
+        resultado = knapsack_01_detallado(pesos, [3, 2, 2, 1], 11 * 10 ** 11)
+
+        assert resultado['valor_maximo'] == 4
+        assert resultado['items_seleccionados'] == [1, 2]
+        assert resultado['peso_total'] == 11 * 10 ** 11
+        assert resultado['tabla_dp'] is None
+
+        por_valor = knapsack_01_detallado([2, 3, 4], [3, 4, 5], 50, formulacion="valor")
+        por_peso = knapsack_01_detallado([2, 3, 4], [3, 4, 5], 50, formulacion="peso")
+        assert por_valor['tabla_dp'] is None
+        assert len(por_peso['tabla_dp'][0]) == 51
+        for clave in ('valor_maximo', 'items_seleccionados', 'peso_total', 'solucion_detallada'):
+            assert por_valor[clave] == por_peso[clave]
+
+        with pytest.raises(ValueError):
+            knapsack_01_detallado([1], [1], 1, reconstruccion="bits", formulacion="valor")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
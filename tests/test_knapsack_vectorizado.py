@@ -0,0 +1,56 @@
+"""
+Tests para la mochila 0/1 vectorizada con NumPy.
+"""
+import numpy as np
+import pytest
+from tp_algos.algorithms.dp.knapsack_01 import knapsack_01, knapsack_01_optimizado
+from tp_algos.algorithms.dp.knapsack_vectorizado import (
+    knapsack_01_vectorizado, elegir_dtype
+)
+from tests.generadores import mochila_aleatoria
+
+
+class TestKnapsackVectorizado:
+    """Tests que comparan el motor NumPy con knapsack_01."""
+
+    def test_ejemplo_simple(self):
+        """Test con ejemplo simple."""
+        resultado = knapsack_01_optimizado([2, 3, 4, 5], [3, 4, 5, 6], 8, motor="numpy")
+
+        assert resultado == 10
+        assert isinstance(resultado, int)
+
+    @pytest.mark.parametrize("semilla", range(6))
+    def test_igual_a_knapsack_01(self, semilla):
+        """Test con instancias aleatorias, incluyendo pesos cero y objetos que no caben."""
+        pesos, valores, capacidad = mochila_aleatoria(semilla, 15, 20, 50)
+
+        assert knapsack_01_vectorizado(pesos, valores, capacidad) == knapsack_01(pesos, valores, capacidad)
+
+    def test_valores_reales(self):
+        """Test con valores no enteros (usa float64)."""
+        pesos = [3, 4, 5]
+        valores = [1.5, 2.25, 3.1]
+
+        assert knapsack_01_vectorizado(pesos, valores, 8) == knapsack_01(pesos, valores, 8)
+
+    def test_valores_enormes_exactos(self):
+        """Test que con enteros fuera de int64 el resultado sigue siendo exacto."""
+        valores = [10 ** 20 + 1, 10 ** 20 + 3]
+
+        assert knapsack_01_vectorizado([1, 1], valores, 2) == 2 * 10 ** 20 + 4
+
+    def test_elegir_dtype(self):
+        """Test de la elección del dtype según los valores."""
+        assert elegir_dtype([1, 2, 3]) == np.int64
+        assert elegir_dtype([1, 2.5]) == np.float64
+        assert elegir_dtype([2 ** 70]) == object
+
+    def test_motor_desconocido(self):
+        """Test que rechaza motores inexistentes."""
+        with pytest.raises(ValueError):
+            knapsack_01_optimizado([1], [1], 1, motor="gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""
+Tests para las matrices compactas de Floyd-Warshall.
+"""
+
+import pytest
+from tp_algos.algorithms.graphs.floyd_warshall import (
+    floyd_warshall, floyd_warshall_detallado, reconstruir_camino, crear_grafo_vacio,
+    aumentar_arista
+)
+from tp_algos.algorithms.graphs.matrices_compactas import (
+    MatrizDistancias, MatrizSiguientes, compactar, expandir, SIN_SIGUIENTE
+)
+from tests.generadores import grafo_aleatorio, costo_camino
+
+
+class TestMatricesCompactas:
+    """Tests de las estructuras compactas."""
+
+    def test_indexado_como_listas(self):
+        """Test que m[i][j] lee y escribe como en una lista de listas."""
+        m = MatrizSiguientes(3)
+        m[1][2] = 7
+
+        assert m[1][2] == 7
+        assert m[0][0] == SIN_SIGUIENTE
+        assert len(m) == 3
+
+    def test_tipo_float32(self):
+        """Test que float32 usa la mitad de memoria que float64."""
+        assert MatrizDistancias(10, 'f').nbytes * 2 == MatrizDistancias(10, 'd').nbytes
+
+    def test_tipo_invalido(self):
+        """Test que rechaza tipos de distancia desconocidos."""
+        with pytest.raises(ValueError):
+            MatrizDistancias(3, 'i')
+
+    def test_compactar_y_expandir(self):
+        """Test de ida y vuelta entre listas y matrices compactas."""
+        dist, next_node = floyd_warshall(grafo_aleatorio(8, 0.3, 0))
+
+        assert expandir(*compactar(dist, next_node)) == (dist, next_node)
+
+
+class TestFloydWarshallCompacto:
+    """Los mismos escenarios de test_floyd_warshall con el resultado compacto."""
+
+    @pytest.mark.parametrize("motor", ["python", "numpy"])
+    def test_grafo_simple(self, motor):
+        """Test con grafo simple de 3 nodos."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 4
+        grafo[1][2] = 3
+        grafo[0][2] = 10
+
+        dist, next_node = floyd_warshall(grafo, motor=motor, compacto=True)
+
+        assert dist[0][1] == 4
+        assert dist[0][2] == 7
+        assert reconstruir_camino(next_node, 0, 2) == [0, 1, 2]
+        assert reconstruir_camino(next_node, 2, 0) == []
+
+    @pytest.mark.parametrize("tipo", ['d', 'f'])
+    def test_igual_a_listas(self, tipo):
+        """Test que el resultado compacto coincide con el de listas."""
+        grafo = grafo_aleatorio(20, 0.15, 1)
+
+        esperado = floyd_warshall(grafo)
+        compacto = floyd_warshall(grafo, compacto=True, tipo_distancia=tipo)
+
+        assert isinstance(compacto[0], MatrizDistancias)
+        assert expandir(*compacto) == esperado
+
+    @pytest.mark.parametrize("tipo", ['d', 'f'])
+    def test_aumentar_arista_compacto(self, tipo):
+        """Test que aumentar_arista actualiza las matrices compactas en el lugar."""
+        grafo = grafo_aleatorio(15, 0.25, 4)
+        dist, next_node = floyd_warshall(grafo, compacto=True, tipo_distancia=tipo)
+        u, v = next((i, next_node[i][j]) for i in range(15) for j in range(15)
+                    if next_node[i][j] != SIN_SIGUIENTE)
+
+        filas = aumentar_arista(grafo, dist, next_node, u, v)
+        grafo[u][v] = float('inf')
+
+        assert filas
+        dist_esperada, _ = floyd_warshall(grafo)
+        assert expandir(dist, next_node)[0] == dist_esperada
+        for i in range(15):
+            for j in range(15):
+                camino = reconstruir_camino(next_node, i, j)
+                if i != j and camino:
+                    assert costo_camino(grafo, camino) == dist[i][j]
+
+    def test_tipo_distancia_fuera_del_motor_python(self):
+        """Test que tipo_distancia no se ignora en silencio con otros motores."""
+        grafo = grafo_aleatorio(4, 0.5, 2)
+
+        with pytest.raises(ValueError):
+            floyd_warshall(grafo, motor="numpy", compacto=True, tipo_distancia='f')
+        with pytest.raises(ValueError):
+            floyd_warshall(grafo, tipo_distancia='f')
+
+    def test_detallado_compacto(self):
+        """Test que la versión detallada acepta la representación compacta."""
+        grafo = crear_grafo_vacio(3)
+        grafo[0][1] = 5
+        grafo[1][2] = 3
+        grafo[0][2] = 10
+
+        resultado = floyd_warshall_detallado(grafo, ["X", "Y", "Z"], compacto=True)
+
+        assert resultado['todos_caminos']['X_a_Z']['camino'] == ['X', 'Y', 'Z']
+        assert resultado['pasos'][0]['matriz'][0][2] == 10
+        assert resultado['pasos'][-1]['matriz'][0][2] == 8
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,24 @@
+import pytest
+from tp_algos.structures.memoria_compartida import conectar, segmentos_compartidos
+
+
+def test_segmentos_compartidos():
+    with segmentos_compartidos([16, 0]) as (memoria, vacia):
+        assert memoria.size >= 16 and vacia.size >= 1
+        otra = conectar(memoria.name)
+        otra.buf[0] = 42
+        assert memoria.buf[0] == 42
+        otra.close()
+        nombre = memoria.name
+    # Al salir del bloque el segmento ya no existe
+    with pytest.raises(FileNotFoundError):
+        conectar(nombre)
+
+
+def test_segmentos_se_liberan_ante_excepciones():
+    with pytest.raises(RuntimeError):
+        with segmentos_compartidos([8]) as (memoria,):
+            nombre = memoria.name
+            raise RuntimeError
+    with pytest.raises(FileNotFoundError):
+        conectar(nombre)
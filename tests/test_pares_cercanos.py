@@ -0,0 +1,86 @@
+"""
+Tests para la enumeración de pares cercanos y los k pares más cercanos.
+"""
+from itertools import islice
+
+import pytest
+from tp_algos.algorithms.divide_conquer.closest_pair import closest_pair, distancia
+from tp_algos.algorithms.randomized.pares_cercanos import pares_cercanos, k_pares_mas_cercanos
+from tests.generadores import puntos_aleatorios
+
+
+def todos_los_pares(puntos):
+    """Todos los pares (distancia, i, j) por fuerza bruta, ordenados."""
+    return sorted(
+        (distancia(puntos[i], puntos[j]), i, j)
+        for i in range(len(puntos)) for j in range(i + 1, len(puntos))
+    )
+
+
+class TestParesCercanos:
+    """Tests para pares_cercanos."""
+
+    @pytest.mark.parametrize("delta", [0, 1, 2.5, 10])
+    @pytest.mark.parametrize("semilla", range(6))
+    def test_igual_a_fuerza_bruta(self, semilla, delta):
+        """Test que genera exactamente los pares a distancia ≤ delta."""
+        puntos = puntos_aleatorios(60, semilla, enteros=semilla % 2 == 0, lado=15)
+
+        esperado = [par for par in todos_los_pares(puntos) if par[0] <= delta]
+
+        assert sorted(pares_cercanos(puntos, delta)) == esperado
+
+    def test_es_generador(self):
+        """Test que se puede consumir de a poco sin calcular todos los pares."""
+        puntos = [(0.0, float(i)) for i in range(1000)]
+
+        primeros = list(islice(pares_cercanos(puntos, 5), 3))
+
+        assert len(primeros) == 3
+        assert all(d <= 5 for d, _, _ in primeros)
+
+    def test_delta_negativo(self):
+        """Test que rechaza delta negativo."""
+        with pytest.raises(ValueError):
+            list(pares_cercanos([(0, 0)], -1))
+
+
+class TestKParesMasCercanos:
+    """Tests para k_pares_mas_cercanos."""
+
+    @pytest.mark.parametrize("k", [1, 5, 40])
+    @pytest.mark.parametrize("semilla", range(6))
+    def test_igual_a_fuerza_bruta(self, semilla, k):
+        """Test que las distancias son las k menores, en orden creciente."""
+        puntos = puntos_aleatorios(50, semilla, enteros=semilla % 2 == 1)
+
+        resultado = list(k_pares_mas_cercanos(puntos, k))
+
+        assert [d for d, _, _ in resultado] == [d for d, _, _ in todos_los_pares(puntos)[:k]]
+        assert all(distancia(puntos[i], puntos[j]) == d and i < j for d, i, j in resultado)
+
+    def test_primer_par_es_closest_pair(self):
+        """Test que el primer par coincide con closest_pair."""
+        puntos = puntos_aleatorios(500, 9)
+
+        d, _, _ = next(k_pares_mas_cercanos(puntos, 10))
+
+        assert d == closest_pair(puntos)[0]
+
+    def test_k_mayor_que_la_cantidad_de_pares(self):
+        """Test que con k grande devuelve todos los pares."""
+        puntos = [(0, 0), (1, 0), (5, 5)]
+
+        assert list(k_pares_mas_cercanos(puntos, 10)) == todos_los_pares(puntos)
+
+    def test_puntos_alineados_e_iguales(self):
+        """Test con puntos sobre una recta y con todos los puntos iguales."""
+        alineados = [(float(i * i), 0.0) for i in range(30)]
+        iguales = [(2.0, 2.0)] * 5
+
+        assert [d for d, _, _ in k_pares_mas_cercanos(alineados, 4)] == [1.0, 3.0, 4.0, 5.0]
+        assert list(k_pares_mas_cercanos(iguales, 3)) == [(0.0, 0, 1), (0.0, 0, 2), (0.0, 0, 3)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])